@@ -1,3 +1,5 @@
+import itertools
+import math
 import os
 
 import adsk.core
@@ -5,10 +7,55 @@ import adsk.fusion
 
 from ... import config
 from ...lib import fusionAddInUtils as futil
+from ...lib.joinery.boolean_batch import batch_savings, plan_cut_boxes, tree_reduce
+from ...lib.joinery.broad_phase import find_candidate_pairs
+from ...lib.joinery.chunking import ChunkedRun
+from ...lib.joinery.classify import classify_intersections, intersection_info
+from ...lib.joinery.feature_params import (
+    PARAMS_ATTRIBUTE,
+    is_legacy_attribute,
+    legacy_parameters,
+    make_parameters,
+    pack_parameters,
+    unpack_parameters,
+)
+from ...lib.joinery.finger_layout import layout_fingers
+from ...lib.joinery.fingerprint import body_fingerprint, with_thickness
+from ...lib.joinery.incremental import (
+    make_snapshot,
+    plan_recompute,
+    reuse_clean_results,
+)
+from ...lib.joinery.intersection_cache import MISS, IntersectionCache
+from ...lib.joinery.joint_graph import (
+    GRAPH_ATTRIBUTE,
+    JointGraph,
+    layout_record,
+    pack_graph,
+    unpack_graph,
+)
+from ...lib.joinery.metadata_index import MetadataIndex
+from ...lib.joinery.obb import estimate_sheet_thickness
+from ...lib.joinery.orientation import (
+    filter_parallel_pairs,
+    normal_bucket,
+    plane_offset,
+)
+from ...lib.joinery.partition import is_axis_permutation, place_joint
+from ...lib.joinery.preview import box_lines, finger_boxes, joint_boxes
+from ...lib.joinery.slab_kernel import (
+    intersect_slab_pairs,
+    make_slab,
+    slab_outline_contains,
+)
+from ...lib.joinery.templates import TemplateCache, box_center, template_key
+from ...lib.joinery.token_index import TokenIndex
+from ...lib.joinery.workers import WorkerPool
 from ...lib.utils.version_check import perform_startup_version_check
 
 app = adsk.core.Application.get()
 ui = app.userInterface
+logger = futil.get_logger(__name__)
 
 
 # Create command
@@ -34,38 +81,284 @@ IS_PROMOTED = False
 # Resource location for command icons, here we assume a sub folder in this directory named "resources".
 ICON_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "")
 
+# Custom parameters of the feature. They are set on the feature input, so the
+# compute Fusion runs inside customFeatures.add() already sees them
+TAB_WIDTH_PARAMETER = "tab_width"
+TOLERANCE_PARAMETER = "tolerance"
+
 # Local list of event handlers used to maintain a reference so
 # they are not released and garbage collected.
 local_handlers = []
 
+# Pairwise intersection results keyed by body fingerprints, shared across computes
+intersection_cache = IntersectionCache(
+    config.INTERSECTION_CACHE_MAX_ENTRIES, config.INTERSECTION_CACHE_MAX_BYTES
+)
+
+# Geometric sheet thickness estimate per body geometry fingerprint, for bodies
+# without a sheet metal rule thickness
+thickness_cache = {}
+
+# Component-local joints per (component token, tolerance, native body
+# fingerprints), placed into every occurrence of the component
+component_joint_cache = {}
+
+# Mid-plane (normal, point) of flat sheet bodies, or None for other bodies, per
+# body fingerprint, for the orientation filter
+plane_cache = {}
+
+# Temporary tab/slot box bodies centered on the origin, keyed by box size
+tab_templates = TemplateCache(config.TAB_TEMPLATE_CACHE_MAX_ENTRIES)
+
+# Last successful compute per custom feature entity token, for incremental recomputes
+compute_snapshots = {}
+
+# Joint graph per custom feature entity token, and the tokens whose graph
+# changed since it was last written to the feature's attribute
+joint_graphs = {}
+_unsaved_graphs = set()
+
+# Custom features and bodies of the active document by entity token; cleared
+# whenever the document or timeline may have changed
+entity_index = TokenIndex()
+
+# Joint ID and dogbone hint face attributes of the active document, swept from
+# the design once and refreshed per body when a feature recomputes
+metadata_index = MetadataIndex()
+
+# (event, handler) pairs for the application events this module listens to
+_document_handlers = []
+
+# Parsed parameters per custom feature entity token as (packed text, parameters),
+# so the packed attribute is only parsed again when its text changes
+feature_parameters_cache = {}
+
+# Pair and layout counters from the most recent compute, for diagnostics and
+# benchmarks
+last_compute_stats = {}
+
+# Thread for background jobs; only ever given plain-data snapshots
+worker_pool = WorkerPool(config.WORKER_POOL_MAX_WORKERS)
+
+# Background jobs by id: (future, deliver callback); completion is announced by
+# firing WORKER_RESULT_EVENT_ID and delivered on the main thread
+_background_jobs = {}
+_background_job_ids = itertools.count(1)
+_worker_result_event = None
+_worker_result_handler = None
+
+
+def get_sheet_metal_rule_thickness(body):
+    """
+    Thickness of the active sheet metal rule of the body's parent component,
+    or None when there is no rule or it has no thickness.
+    """
+    component = body.parentComponent if hasattr(body, "parentComponent") else None
+    if not (component and hasattr(component, "activeSheetMetalRule")):
+        return None
+    rule = component.activeSheetMetalRule
+    if not (rule and hasattr(rule, "thickness") and rule.thickness):
+        return None
+    return rule.thickness.value or None
+
+
+def estimate_body_thickness(body):
+    """
+    Estimate sheet thickness from geometry using an oriented bounding box of
+    the body's vertices, which stays correct for arbitrarily rotated sheets.
+    Falls back to the smallest axis-aligned extent for vertex-less bodies.
+    """
+    points = [_point_tuple(vertex.geometry) for vertex in body.vertices]
+    thickness = estimate_sheet_thickness(points)
+    if thickness is not None:
+        return thickness
+
+    bounds = get_body_bounds(body)
+    return min(bounds[3] - bounds[0], bounds[4] - bounds[1], bounds[5] - bounds[2])
 
-def get_sheet_metal_thickness(body):
+
+def get_sheet_metal_thickness(body, fingerprint=None):
     """
     Get sheet metal thickness from the body's parent component sheet metal rule.
     Falls back to geometric calculation if rule access fails.
+    Geometric estimates are cached per body geometry fingerprint when the
+    caller passes the fingerprint it already has; without one the estimate
+    is computed directly, since fingerprinting costs as much as it saves.
     Returns thickness in cm (Fusion's internal units).
     """
     try:
         # Try to get thickness from parent component's activeSheetMetalRule
-        if hasattr(body, 'parentComponent') and body.parentComponent:
-            component = body.parentComponent
-            if hasattr(component, 'activeSheetMetalRule') and component.activeSheetMetalRule:
-                rule = component.activeSheetMetalRule
-                if hasattr(rule, 'thickness') and rule.thickness:
-                    return rule.thickness.value
-        
-        # Fallback: calculate from geometry using bounding box
-        bbox = body.boundingBox
-        width = bbox.maxPoint.x - bbox.minPoint.x
-        height = bbox.maxPoint.y - bbox.minPoint.y
-        depth = bbox.maxPoint.z - bbox.minPoint.z
-        return min(width, height, depth)
-        
+        thickness = get_sheet_metal_rule_thickness(body)
+        if thickness:
+            return thickness
+
+        # Fallback: calculate from geometry using an oriented bounding box
+        if fingerprint is None:
+            return estimate_body_thickness(body)
+        thickness = thickness_cache.get(fingerprint)
+        if thickness is None:
+            thickness = estimate_body_thickness(body)
+            if len(thickness_cache) >= config.THICKNESS_CACHE_MAX_ENTRIES:
+                thickness_cache.clear()
+            thickness_cache[fingerprint] = thickness
+        return thickness
+
     except Exception as e:
-        futil.log(f"Error determining sheet metal thickness: {e!s}")
+        logger.error("Error determining sheet metal thickness: %s", e)
         return None
 
 
+def get_body_plane(body, fingerprint):
+    """
+    Mid-plane of a flat sheet body as (normal, point), with the normal of its
+    largest planar face. Returns None unless every vertex of the body lies on
+    that face's plane or on one plane parallel to it, so flanged, bent or
+    stepped bodies are never taken for a flat sheet.
+    Cached per body fingerprint.
+    """
+    if fingerprint in plane_cache:
+        return plane_cache[fingerprint]
+
+    largest = None
+    largest_area = 0.0
+    faces = body.faces
+    for i in range(faces.count):
+        face = faces.item(i)
+        geometry = face.geometry
+        if geometry.surfaceType != adsk.core.SurfaceTypes.PlaneSurfaceType:
+            continue
+        area = face.area
+        if area > largest_area:
+            largest_area = area
+            largest = geometry
+
+    plane = None
+    if largest is not None:
+        normal = _point_tuple(largest.normal)
+        origin = _point_tuple(largest.origin)
+        levels = [
+            sum(
+                (p - o) * n
+                for p, o, n in zip(
+                    _point_tuple(vertex.geometry), origin, normal, strict=True
+                )
+            )
+            for vertex in body.vertices
+        ]
+        low, high = min(levels), max(levels)
+        epsilon = config.PLANAR_KERNEL_EPSILON
+        if high - low > epsilon and all(
+            min(level - low, high - level) <= epsilon for level in levels
+        ):
+            middle = (low + high) / 2.0
+            plane = (
+                normal,
+                tuple(o + n * middle for o, n in zip(origin, normal, strict=True)),
+            )
+
+    if len(plane_cache) >= config.PLANE_CACHE_MAX_ENTRIES:
+        plane_cache.clear()
+    plane_cache[fingerprint] = plane
+    return plane
+
+
+@futil.traced()
+def reject_parallel_pairs(bodies, pairs, thicknesses, fingerprints):
+    """
+    Orientation pre-filter: drop candidate pairs of parallel, non-coplanar
+    sheets, which cannot form T-joints or cross-joints.
+    Returns (kept_pairs, parallel_rejected, coplanar_kept).
+    """
+    if not config.ORIENTATION_FILTER_ENABLED:
+        return pairs, 0, 0
+
+    angle_tolerance = math.radians(config.ORIENTATION_ANGLE_TOLERANCE_DEG)
+    involved = {index for pair in pairs for index in pair}
+    buckets = [None] * len(bodies)
+    offsets = [0.0] * len(bodies)
+    for index in involved:
+        plane = get_body_plane(bodies[index], fingerprints[index])
+        if plane:
+            normal, point = plane
+            buckets[index] = normal_bucket(normal, angle_tolerance)
+            offsets[index] = plane_offset(normal, point)
+    return filter_parallel_pairs(pairs, buckets, offsets, thicknesses)
+
+
+def get_occurrence_groups(bodies):
+    """
+    Group body indices by the occurrence they are reached through.
+    Returns {occurrence token: [indices]} for occurrences holding two or more
+    of the bodies. Root-component bodies are never grouped, nor are bodies of
+    occurrences whose rotation is not an axis permutation: placed bounds
+    would overstate their joints, so those pairs stay in the global pass.
+    """
+    groups = {}
+    placeable = {}
+    for index, body in enumerate(bodies):
+        occurrence = body.assemblyContext
+        if not occurrence:
+            continue
+        token = occurrence.entityToken
+        if token not in placeable:
+            placeable[token] = is_axis_permutation(occurrence.transform2.asArray())
+        if placeable[token]:
+            groups.setdefault(token, []).append(index)
+    return {token: indices for token, indices in groups.items() if len(indices) > 1}
+
+
+@futil.traced()
+def get_occurrence_joints(bodies, indices, tolerance, path_counts, run):
+    """
+    Joints between the bodies of one occurrence, from the component-local
+    joints of its component definition placed with the occurrence transform.
+    Local joints are computed from the native bodies on the first occurrence
+    of a definition and cached per component, tolerance and native body
+    fingerprints in index order, so joint directions match the global pass.
+    They are evaluated as a stage of run, so pairs it leaves unevaluated end
+    up in its pending list under their global indices; a component whose
+    pairs were not all evaluated is not cached.
+    Returns (joints, cache_hit) with joints as (index_a, index_b, info) tuples.
+    """
+    occurrence = bodies[indices[0]].assemblyContext
+    natives = [bodies[index].nativeObject for index in indices]
+    thicknesses, fingerprints = get_body_fingerprints(natives)
+    key = (occurrence.component.entityToken, tolerance, tuple(fingerprints))
+
+    local_joints = component_joint_cache.get(key)
+    cache_hit = local_joints is not None
+    if not cache_hit:
+        bounds = [get_body_bounds(body) for body in natives]
+        pairs, _ = find_candidate_pairs(bounds, tolerance)
+        pairs, _, _ = reject_parallel_pairs(natives, pairs, thicknesses, fingerprints)
+        # Evaluated under global indices so pending pairs need no mapping
+        joints = evaluate_pairs(
+            dict(zip(indices, natives, strict=True)),
+            [(indices[local_a], indices[local_b]) for local_a, local_b in pairs],
+            dict(zip(indices, thicknesses, strict=True)),
+            dict(zip(indices, fingerprints, strict=True)),
+            path_counts,
+            run,
+        )
+        local_of = {index: local for local, index in enumerate(indices)}
+        local_joints = [
+            (local_of[index_a], local_of[index_b], info)
+            for index_a, index_b, info in joints
+        ]
+        if run.is_complete:
+            if len(component_joint_cache) >= config.COMPONENT_CACHE_MAX_ENTRIES:
+                component_joint_cache.clear()
+            component_joint_cache[key] = local_joints
+
+    matrix = occurrence.transform2.asArray()
+    joints = [
+        (indices[local_a], indices[local_b], place_joint(info, matrix))
+        for local_a, local_b, info in local_joints
+    ]
+    return joints, cache_hit
+
+
+@futil.traced()
 def create_intersection_body_temporary(target_body, tool_body):
     """
     Create intersection body using TemporaryBRepManager for internal Custom Feature operations.
@@ -75,93 +368,885 @@ def create_intersection_body_temporary(target_body, tool_body):
     try:
         # Get the TemporaryBRepManager
         temp_brep_mgr = adsk.fusion.TemporaryBRepManager.get()
-        
+
         # Create copies of both bodies for safe manipulation
-        target_copy = temp_brep_mgr.copy(target_body)
-        tool_copy = temp_brep_mgr.copy(tool_body)
-        
-        futil.log(f"Created temporary copies of {target_body.name} and {tool_body.name}")
-        
+        with futil.span("brep.copy"):
+            target_copy = temp_brep_mgr.copy(target_body)
+            tool_copy = temp_brep_mgr.copy(tool_body)
+
+        logger.debug(
+            "Created temporary copies of %s and %s", target_body.name, tool_body.name
+        )
+
         # Perform intersection operation using temporary BRep
         # booleanOperation modifies target_copy in-place and returns boolean success
-        operation_success = temp_brep_mgr.booleanOperation(
-            target_copy, 
-            tool_copy, 
-            adsk.fusion.BooleanTypes.IntersectionBooleanType
-        )
-        
+        with futil.span("brep.boolean"):
+            operation_success = temp_brep_mgr.booleanOperation(
+                target_copy, tool_copy, adsk.fusion.BooleanTypes.IntersectionBooleanType
+            )
+
         if operation_success and target_copy.volume > 0:
             # Log detailed information about the intersection
-            futil.log(f"Created temporary intersection body between {target_body.name} and {tool_body.name}")
-            futil.log(f"Intersection body volume: {target_copy.volume*1000:.3f} cm³")
-            
+            logger.debug(
+                "Created temporary intersection body between %s and %s",
+                target_body.name,
+                tool_body.name,
+            )
+            logger.debug(
+                "Intersection body volume: %.3f cm³", target_copy.volume * 1000
+            )
+
             return target_copy
         else:
-            futil.log("No intersection found between bodies")
+            logger.debug("No intersection found between bodies")
             return None
-            
+
     except Exception as e:
-        futil.log(f"Error creating temporary intersection body: {e!s}")
+        logger.error("Error creating temporary intersection body: %s", e)
         return None
 
 
+@futil.traced()
 def analyze_intersection_geometry(intersection_body, sheet_thickness):
     """
     Analyze intersection body geometry to determine joint type and suitability.
+    Thin wrapper over the batch classifier for a single intersection.
     Returns dictionary with intersection analysis or None if unsuitable.
     """
     try:
-        # Basic geometry validation
         volume = intersection_body.volume
-        area = intersection_body.area
-        bbox = intersection_body.boundingBox
-        
-        # Calculate intersection dimensions
-        width = bbox.maxPoint.x - bbox.minPoint.x
-        height = bbox.maxPoint.y - bbox.minPoint.y
-        depth = bbox.maxPoint.z - bbox.minPoint.z
-        
-        # Minimum volume check (must be meaningful intersection)
-        min_volume = sheet_thickness * sheet_thickness * sheet_thickness * 0.1  # 10% of a cubic thickness
-        if volume < min_volume:
-            futil.log(f"Intersection too small: {volume*1000:.3f} cm³ < {min_volume*1000:.3f} cm³")
+        batch = classify_intersections(
+            [get_body_bounds(intersection_body)],
+            [volume],
+            [intersection_body.area],
+            [sheet_thickness],
+        )
+        info = intersection_info(batch, 0)
+        if not info:
+            logger.debug("Intersection too small: %.3f cm³", volume * 1000)
+        return info
+
+    except Exception as e:
+        logger.error("Error analyzing intersection geometry: %s", e)
+        return None
+
+
+def get_body_bounds(body):
+    """
+    Get a body's axis-aligned bounding box as a plain tuple
+    (min_x, min_y, min_z, max_x, max_y, max_z) for the broad phase.
+    """
+    bbox = body.boundingBox
+    min_point = bbox.minPoint
+    max_point = bbox.maxPoint
+    return (
+        min_point.x,
+        min_point.y,
+        min_point.z,
+        max_point.x,
+        max_point.y,
+        max_point.z,
+    )
+
+
+def _point_tuple(point):
+    return (point.x, point.y, point.z)
+
+
+@futil.traced()
+def extract_body_slab(body):
+    """
+    Describe a flat sheet body as a slab (base plane, convex outline and
+    thickness) for the planar intersection kernel.
+    Returns None when the body is not a convex planar prism, in which case the
+    caller falls back to TemporaryBRepManager booleans.
+    """
+    try:
+        faces = [body.faces.item(i) for i in range(body.faces.count)]
+        if len(faces) < 5:
             return None
-        
-        # Determine intersection type based on geometry
-        dimensions = sorted([width, height, depth], reverse=True)
-        longest_dim = dimensions[0]
-        middle_dim = dimensions[1] 
-        shortest_dim = dimensions[2]
-        
-        # Classify intersection type
-        if shortest_dim > sheet_thickness * 0.5:
-            joint_type = "cross-joint"  # Bodies cross through each other
-            description = f"Cross joint: {longest_dim*10:.1f} x {middle_dim*10:.1f} x {shortest_dim*10:.1f} mm"
-        elif middle_dim > longest_dim * 0.1:
-            joint_type = "t-joint"  # One body intersects perpendicularly 
-            description = f"T-joint: {longest_dim*10:.1f} x {middle_dim*10:.1f} mm intersection"
-        else:
-            joint_type = "edge-joint"  # Edge-to-edge contact
-            description = f"Edge joint: {longest_dim*10:.1f} mm length"
-        
-        return {
-            'type': joint_type,
-            'description': description,
-            'dimensions': {
-                'width': width,
-                'height': height, 
-                'depth': depth,
-                'volume': volume,
-                'area': area
-            },
-            'suitable_for_tabs': longest_dim > sheet_thickness * 3  # Need minimum length for tabs
+        for face in faces:
+            if face.geometry.surfaceType != adsk.core.SurfaceTypes.PlaneSurfaceType:
+                return None
+
+        # The two largest faces of a sheet are its top and bottom
+        faces.sort(key=lambda face: face.area, reverse=True)
+        top_face, bottom_face = faces[0], faces[1]
+        top_points = [_point_tuple(vertex.geometry) for vertex in top_face.vertices]
+        bottom_points = [
+            _point_tuple(vertex.geometry) for vertex in bottom_face.vertices
+        ]
+        if len(faces) != len(top_points) + 2 or len(bottom_points) != len(top_points):
+            return None
+
+        top_normal = top_face.geometry.normal
+        if not top_normal.isParallelTo(bottom_face.geometry.normal):
+            return None
+
+        normal = _point_tuple(top_normal)
+        offset = [b - t for b, t in zip(bottom_points[0], top_points[0], strict=True)]
+        thickness = sum(o * n for o, n in zip(offset, normal, strict=True))
+        slab = make_slab(top_points, normal, thickness, config.PLANAR_KERNEL_EPSILON)
+        if slab and slab_outline_contains(
+            slab, bottom_points, config.PLANAR_KERNEL_EPSILON
+        ):
+            return slab
+        return None
+
+    except Exception as e:
+        logger.error("Error extracting slab from body: %s", e)
+        return None
+
+
+def measure_boolean_pair(target_body, tool_body):
+    """
+    Measure the intersection of one body pair with a TemporaryBRepManager
+    boolean, for bodies the planar kernel cannot handle.
+    Returns (measurement, intersection_body) where measurement is a
+    (bounds, volume, area) tuple or None when the bodies do not intersect.
+    """
+    intersection_body = create_intersection_body_temporary(target_body, tool_body)
+    if not intersection_body:
+        return None, None
+    measurement = (
+        get_body_bounds(intersection_body),
+        intersection_body.volume,
+        intersection_body.area,
+    )
+    return measurement, intersection_body
+
+
+def slab_measurements(slab_pairs):
+    """
+    Planar kernel measurements for (slab_a, slab_b) pairs as (bounds, volume,
+    area) tuples or None. Plain data only, so it runs on worker threads.
+    """
+    return [
+        (result["bounds"], result["volume"], result["area"]) if result else None
+        for result in intersect_slab_pairs(slab_pairs, config.PLANAR_KERNEL_EPSILON)
+    ]
+
+
+def classify_measurements(measurements, thicknesses):
+    """Classify (bounds, volume, area) measurements in one batch; returns info dicts or None"""
+    batch = classify_intersections(
+        [measurement[0] for measurement in measurements],
+        [measurement[1] for measurement in measurements],
+        [measurement[2] for measurement in measurements],
+        thicknesses,
+    )
+    return [intersection_info(batch, row) for row in range(len(measurements))]
+
+
+def cache_pair_result(cache_key, info, intersection_body):
+    """Store a classified pair in the intersection cache, with its BRep if configured"""
+    if config.INTERSECTION_CACHE_KEEP_BREP and intersection_body:
+        brep_bytes = (
+            intersection_body.faces.count
+            * config.INTERSECTION_CACHE_BREP_BYTES_PER_FACE
+        )
+        intersection_cache.put(cache_key, info, intersection_body, brep_bytes)
+    else:
+        intersection_cache.put(cache_key, info)
+
+
+@futil.traced()
+def get_body_fingerprints(bodies):
+    """
+    Determine thickness and geometry fingerprint for each body.
+    Returns (thicknesses, fingerprints) lists parallel to bodies.
+    """
+    geometry_fingerprints = [body_fingerprint(body) for body in bodies]
+    thicknesses = [
+        get_sheet_metal_thickness(body, fingerprint)
+        for body, fingerprint in zip(bodies, geometry_fingerprints, strict=True)
+    ]
+    fingerprints = [
+        with_thickness(fingerprint, thickness)
+        for fingerprint, thickness in zip(
+            geometry_fingerprints, thicknesses, strict=True
+        )
+    ]
+    return thicknesses, fingerprints
+
+
+@futil.traced()
+def find_sheet_intersections(
+    bodies,
+    tolerance,
+    thicknesses,
+    fingerprints,
+    dirty_indices=None,
+    run=None,
+    pending_pairs=(),
+):
+    """
+    Find every valid intersection between the given sheet bodies.
+    A broad-phase pass over tolerance-inflated bounding boxes emits candidate
+    pairs first so booleans only run for bodies that can actually overlap.
+    Pairs inside one occurrence are taken from the per-component cache (see
+    get_occurrence_joints); only the remaining pairs are evaluated globally.
+    When dirty_indices is given, only candidate pairs touching one of those
+    bodies are evaluated, plus the (index_a, index_b) pairs in pending_pairs.
+    Pairs missing the cache, in occurrences and globally, are evaluated in
+    chunks driven by run (a ChunkedRun); if it stops early its pending list
+    holds the unevaluated (index_a, index_b, cache_key) pairs. Occurrences
+    holding a pending pair are evaluated again.
+    Returns a list of (index_a, index_b, intersection_info) tuples.
+    """
+    bounds = [get_body_bounds(body) for body in bodies]
+    with futil.span("broad_phase", bodies=len(bodies)):
+        candidate_pairs, rejected_count = find_candidate_pairs(bounds, tolerance)
+    logger.info(
+        "Broad phase: %s candidate pairs, %s pairs rejected",
+        len(candidate_pairs),
+        rejected_count,
+    )
+
+    path_counts = {"cached": 0, "kernel": 0, "boolean": 0}
+    intersections = []
+    partition_stats = {
+        "component_groups": 0,
+        "component_cache_hits": 0,
+        "component_joints": 0,
+    }
+    if run is None:
+        run = ChunkedRun(len(candidate_pairs) or 1)
+    if config.PARTITION_BY_COMPONENT:
+        groups = get_occurrence_groups(bodies)
+        group_of = {
+            index: token for token, indices in groups.items() for index in indices
         }
-        
+        # Intra-occurrence pairs come from the component cache instead
+        candidate_pairs = [
+            pair
+            for pair in candidate_pairs
+            if pair[0] not in group_of or group_of.get(pair[0]) != group_of.get(pair[1])
+        ]
+        pending_groups = {
+            group_of[index_a]
+            for index_a, index_b in pending_pairs
+            if index_a in group_of and group_of[index_a] == group_of.get(index_b)
+        }
+        for token, indices in groups.items():
+            if (
+                dirty_indices is not None
+                and not dirty_indices.intersection(indices)
+                and token not in pending_groups
+            ):
+                continue
+            joints, cache_hit = get_occurrence_joints(
+                bodies, indices, tolerance, path_counts, run
+            )
+            intersections.extend(joints)
+            partition_stats["component_groups"] += 1
+            partition_stats["component_cache_hits"] += cache_hit
+            partition_stats["component_joints"] += len(joints)
+        if groups:
+            logger.info("Component partitions: %s", partition_stats)
+
+    if dirty_indices is not None:
+        candidate_pairs = [
+            pair
+            for pair in candidate_pairs
+            if pair[0] in dirty_indices
+            or pair[1] in dirty_indices
+            or pair in pending_pairs
+        ]
+        logger.info(
+            "Evaluating %s candidate pairs touching changed bodies or pending",
+            len(candidate_pairs),
+        )
+
+    candidate_pairs, parallel_count, coplanar_count = reject_parallel_pairs(
+        bodies, candidate_pairs, thicknesses, fingerprints
+    )
+    if parallel_count or coplanar_count:
+        logger.info(
+            "Orientation filter: %s parallel pairs rejected, %s coplanar pairs kept as edge joints",
+            parallel_count,
+            coplanar_count,
+        )
+
+    intersections.extend(
+        evaluate_pairs(
+            bodies, candidate_pairs, thicknesses, fingerprints, path_counts, run
+        )
+    )
+    if not run.is_complete:
+        logger.warning(
+            "Narrow phase stopped (%s) after %s of %s pairs",
+            run.stop_reason,
+            run.done,
+            run.total,
+        )
+
+    logger.info("Narrow phase paths: %s", path_counts)
+    logger.info("Intersection cache: %s", intersection_cache.stats())
+    last_compute_stats.clear()
+    last_compute_stats.update(path_counts)
+    last_compute_stats.update(partition_stats)
+    last_compute_stats.update(
+        candidate_pairs=len(candidate_pairs),
+        rejected_pairs=rejected_count,
+        parallel_pairs=parallel_count,
+        coplanar_pairs=coplanar_count,
+        intersections=len(intersections),
+        pending_pairs=len(run.pending),
+    )
+    return intersections
+
+
+def evaluate_pairs(bodies, pairs, thicknesses, fingerprints, path_counts, run=None):
+    """
+    Narrow phase for candidate pairs: intersection cache, then the planar
+    kernel or a boolean per miss, then one classification batch per chunk.
+    Path counts are added to path_counts. Misses are evaluated as one more
+    stage of run, if given.
+    Returns a list of (index_a, index_b, intersection_info) tuples.
+    """
+    intersections, misses = lookup_cached_pairs(
+        pairs, thicknesses, fingerprints, path_counts
+    )
+
+    # Slabs are extracted on the main thread, only for bodies whose pairs miss
+    # the cache, and shared by all chunks
+    slabs = {}
+    if run is None:
+        run = ChunkedRun(len(misses) or 1)
+    classified = 0
+    too_small = 0
+    for chunk in run.chunks(misses, resume=True):
+        measured = measure_chunk(bodies, chunk, slabs, path_counts)
+        chunk_intersections, chunk_classified = classify_chunk(measured, thicknesses)
+        intersections.extend(chunk_intersections)
+        classified += chunk_classified
+        too_small += chunk_classified - len(chunk_intersections)
+
+    if classified:
+        logger.info(
+            "Classified %s intersections, %s too small for joints",
+            classified,
+            too_small,
+        )
+    return intersections
+
+
+def lookup_cached_pairs(pairs, thicknesses, fingerprints, path_counts):
+    """
+    Split candidate pairs into cached intersections and cache misses.
+    Returns (intersections, misses) with misses as (index_a, index_b,
+    cache_key) tuples; pairs whose first body has no thickness are skipped.
+    """
+    intersections = []
+    misses = []
+    for index_a, index_b in pairs:
+        if not thicknesses[index_a]:
+            logger.warning(
+                "Could not determine thickness for body %s - skipping pair", index_a
+            )
+            continue
+
+        cache_key = (fingerprints[index_a], fingerprints[index_b])
+        cached = intersection_cache.get(cache_key)
+        if cached is not MISS:
+            path_counts["cached"] += 1
+            if cached[0]:
+                intersections.append((index_a, index_b, cached[0]))
+            continue
+        misses.append((index_a, index_b, cache_key))
+    return intersections, misses
+
+
+def _lookup_slab(bodies, slabs, index):
+    if index not in slabs:
+        slabs[index] = extract_body_slab(bodies[index])
+    return slabs[index]
+
+
+def measure_chunk(bodies, chunk, slabs, path_counts):
+    """
+    Measure one chunk of cache misses: slab pairs with the planar kernel,
+    the pairs it cannot handle with booleans.
+    Returns (miss, measurement, intersection_body) per pair of the chunk.
+    """
+    kernel_pairs = []
+    boolean_pairs = []
+    for miss in chunk:
+        slab_a = (
+            _lookup_slab(bodies, slabs, miss[0])
+            if config.PLANAR_KERNEL_ENABLED
+            else None
+        )
+        slab_b = _lookup_slab(bodies, slabs, miss[1]) if slab_a else None
+        if slab_a and slab_b:
+            kernel_pairs.append((miss, (slab_a, slab_b)))
+        else:
+            boolean_pairs.append(miss)
+
+    measured = []
+    for miss in boolean_pairs:
+        measurement, intersection_body = measure_boolean_pair(
+            bodies[miss[0]], bodies[miss[1]]
+        )
+        measured.append((miss, measurement, intersection_body))
+    with futil.span("slab_kernel", pairs=len(kernel_pairs)):
+        kernel_measurements = slab_measurements(
+            [slab_pair for _, slab_pair in kernel_pairs]
+        )
+    measured.extend(
+        (miss, measurement, None)
+        for (miss, _), measurement in zip(
+            kernel_pairs, kernel_measurements, strict=True
+        )
+    )
+    path_counts["kernel"] += len(kernel_pairs)
+    path_counts["boolean"] += len(boolean_pairs)
+    return measured
+
+
+def classify_chunk(measured, thicknesses):
+    """
+    Classify the hits of a measured chunk in one batch and cache every result.
+    Returns (intersections, classified) where classified counts the hits,
+    including those too small for joints.
+    """
+    pending = []
+    for miss, measurement, intersection_body in measured:
+        if measurement:
+            pending.append((miss, measurement, intersection_body))
+        else:
+            intersection_cache.put(miss[2], None)
+    if not pending:
+        return [], 0
+
+    with futil.span("classify_batch", intersections=len(pending)):
+        infos = classify_measurements(
+            [measurement for _, measurement, _ in pending],
+            [thicknesses[miss[0]] for miss, _, _ in pending],
+        )
+    intersections = []
+    for ((index_a, index_b, cache_key), _, intersection_body), info in zip(
+        pending, infos, strict=True
+    ):
+        cache_pair_result(cache_key, info, intersection_body)
+        if info:
+            intersections.append((index_a, index_b, info))
+    return intersections, len(pending)
+
+
+def run_background_job(work, snapshot, deliver):
+    """
+    Run work(snapshot) on the worker pool and call deliver(result) on the main
+    thread once it finishes. The snapshot must be plain data because work must
+    not touch the Fusion API. Returns the job id.
+    """
+    job_id = str(next(_background_job_ids))
+    future = worker_pool.submit(work, snapshot)
+    _background_jobs[job_id] = (future, deliver)
+    # Runs on the worker thread; fireCustomEvent is the thread-safe way back
+    future.add_done_callback(
+        lambda _: app.fireCustomEvent(config.WORKER_RESULT_EVENT_ID, job_id)
+    )
+    return job_id
+
+
+def cancel_background_jobs():
+    """Drop pending background jobs; results of jobs already running are ignored"""
+    for future, _ in _background_jobs.values():
+        future.cancel()
+    _background_jobs.clear()
+
+
+def worker_result_received(args: adsk.core.CustomEventArgs):
+    """Main thread: hand a finished background job's result to its deliver callback"""
+    job = _background_jobs.pop(args.additionalInfo, None)
+    if job is None:
+        return
+    future, deliver = job
+    if future.cancelled():
+        return
+    try:
+        deliver(future.result())
     except Exception as e:
-        futil.log(f"Error analyzing intersection geometry: {e!s}")
+        logger.error("Background job %s failed: %s", args.additionalInfo, e)
+
+
+def analyze_pair_snapshot(snapshot):
+    """
+    Worker side of prewarm_selection: kernel measurement and classification
+    of (cache_keys, slab_pairs, thicknesses). Returns a dict mapping cache key
+    to intersection info, or None for pairs without a usable joint.
+    """
+    cache_keys, slab_pairs, thicknesses = snapshot
+    measurements = slab_measurements(slab_pairs)
+    hits = [row for row, measurement in enumerate(measurements) if measurement]
+    results = dict.fromkeys(cache_keys)
+    if hits:
+        infos = classify_measurements(
+            [measurements[row] for row in hits], [thicknesses[row] for row in hits]
+        )
+        for row, info in zip(hits, infos, strict=True):
+            results[cache_keys[row]] = info
+    return results
+
+
+def store_prewarmed_pairs(results):
+    for cache_key, info in results.items():
+        intersection_cache.put(cache_key, info)
+    logger.debug("Prewarmed %s pair results in the background", len(results))
+
+
+@futil.traced()
+def prewarm_selection(bodies, tolerance):
+    """
+    Start analyzing the planar pairs of a dialog selection in the background so
+    the compute after OK finds them in the intersection cache. Bounds,
+    fingerprints and slabs are snapshotted here on the main thread.
+    Returns the job id, or None when there is nothing to analyze.
+    """
+    if (
+        len(bodies) < config.WORKER_PREWARM_MIN_BODIES
+        or not config.PLANAR_KERNEL_ENABLED
+    ):
+        return None
+
+    thicknesses, fingerprints = get_body_fingerprints(bodies)
+    bounds = [get_body_bounds(body) for body in bodies]
+    candidate_pairs, _ = find_candidate_pairs(bounds, tolerance)
+    candidate_pairs, _, _ = reject_parallel_pairs(
+        bodies, candidate_pairs, thicknesses, fingerprints
+    )
+    slabs = {}
+    cache_keys = []
+    slab_pairs = []
+    pair_thicknesses = []
+    for index_a, index_b in candidate_pairs:
+        cache_key = (fingerprints[index_a], fingerprints[index_b])
+        if not thicknesses[index_a] or intersection_cache.get(cache_key) is not MISS:
+            continue
+        for index in (index_a, index_b):
+            if index not in slabs:
+                slabs[index] = extract_body_slab(bodies[index])
+        if slabs[index_a] and slabs[index_b]:
+            cache_keys.append(cache_key)
+            slab_pairs.append((slabs[index_a], slabs[index_b]))
+            pair_thicknesses.append(thicknesses[index_a])
+
+    if not cache_keys:
+        return None
+    logger.debug("Prewarming %s pairs in the background", len(cache_keys))
+    return run_background_job(
+        analyze_pair_snapshot,
+        (cache_keys, slab_pairs, pair_thicknesses),
+        store_prewarmed_pairs,
+    )
+
+
+def compute_feature_intersections(
+    feature_token, dependency_ids, bodies, tab_width, tolerance
+):
+    """
+    Compute intersections for a feature's dependency bodies, recomputing only
+    pairs that touch a changed dependency when a previous snapshot exists.
+    Returns (results, snapshot) where results maps (dependency_id_a,
+    dependency_id_b) to the intersection analysis dict; the snapshot should be
+    stored once the compute succeeds. Pairs left over by a cancelled or
+    out-of-time compute are recorded as pending in the snapshot.
+    """
+    thicknesses, fingerprints = get_body_fingerprints(bodies)
+    fingerprints_by_id = dict(zip(dependency_ids, fingerprints, strict=True))
+    settings = (tab_width, tolerance)
+
+    dirty_ids = None
+    pending_ids = set()
+    reason = "incremental compute disabled"
+    if config.INCREMENTAL_COMPUTE:
+        dirty_ids, pending_ids, reason = plan_recompute(
+            compute_snapshots.get(feature_token), settings, fingerprints_by_id
+        )
+
+    if dirty_ids is None:
+        logger.info("Compute path: full (%s)", reason)
+        results = {}
+        dirty_indices = None
+        pending_pairs = set()
+    else:
+        results = reuse_clean_results(
+            compute_snapshots[feature_token], dirty_ids, set(dependency_ids)
+        )
+        logger.info(
+            "Compute path: incremental (%s, %s pair results reused)",
+            reason,
+            len(results),
+        )
+        dirty_indices = {
+            index for index, dep_id in enumerate(dependency_ids) if dep_id in dirty_ids
+        }
+        index_of = {dep_id: index for index, dep_id in enumerate(dependency_ids)}
+        pending_pairs = {
+            tuple(sorted((index_of[dep_a], index_of[dep_b])))
+            for dep_a, dep_b in pending_ids
+        }
+
+    run, close_progress = create_compute_run()
+    try:
+        for index_a, index_b, info in find_sheet_intersections(
+            bodies,
+            tolerance,
+            thicknesses,
+            fingerprints,
+            dirty_indices,
+            run,
+            pending_pairs,
+        ):
+            results[(dependency_ids[index_a], dependency_ids[index_b])] = info
+    finally:
+        close_progress()
+
+    pending = [
+        (dependency_ids[index_a], dependency_ids[index_b])
+        for index_a, index_b, _ in run.pending
+    ]
+    return results, make_snapshot(settings, fingerprints_by_id, results, pending)
+
+
+def create_compute_run():
+    """
+    ChunkedRun for the narrow phase that reports to a progress dialog with a
+    Cancel button. The dialog is only created once a second chunk starts and
+    Fusion shows it after COMPUTE_PROGRESS_DELAY seconds.
+    Compute never calls adsk.doEvents: pumping events there would let Fusion
+    run other handlers, or this compute again, in the middle of it. A Cancel
+    click is honoured when Fusion reports it; otherwise COMPUTE_TIME_BUDGET
+    bounds the run and the unevaluated pairs stay pending.
+    Returns (run, close) where close() hides the dialog again.
+    """
+    dialog = None
+
+    def on_progress(done, total):
+        nonlocal dialog
+        if dialog is None:
+            dialog = ui.createProgressDialog()
+            dialog.isCancelButtonShown = True
+            dialog.show(
+                CREATE_CMD_NAME,
+                "Analyzing body pairs: %v of %m",
+                0,
+                total,
+                config.COMPUTE_PROGRESS_DELAY,
+            )
+        # Later stages of the run add to its total
+        dialog.maximumValue = total
+        dialog.progressValue = done
+
+    def is_cancelled():
+        return dialog is not None and dialog.wasCancelled
+
+    def close():
+        if dialog is not None:
+            dialog.hide()
+
+    run = ChunkedRun(
+        config.COMPUTE_CHUNK_PAIRS,
+        config.COMPUTE_TIME_BUDGET,
+        on_progress,
+        is_cancelled,
+    )
+    return run, close
+
+
+@futil.traced()
+def layout_feature_joints(intersections, tab_width, tolerance):
+    """
+    Slice every intersection suitable for tabs into alternating finger and
+    slot segments along its longest dimension.
+    Returns (pair_keys, layout) where layout joint i belongs to pair_keys[i].
+    """
+    pair_keys = [
+        key for key, info in intersections.items() if info["suitable_for_tabs"]
+    ]
+    lengths = []
+    thicknesses = []
+    for key in pair_keys:
+        info = intersections[key]
+        dimensions = info["dimensions"]
+        lengths.append(
+            max(dimensions["width"], dimensions["height"], dimensions["depth"])
+        )
+        thicknesses.append(info["thickness"])
+
+    layout = layout_fingers(
+        lengths,
+        thicknesses,
+        tab_width,
+        tolerance,
+        config.DEFAULT_FINGER_RATIO,
+        config.DEFAULT_MIN_FINGER_COUNT,
+    )
+    return pair_keys, layout
+
+
+def create_tab_template(temp_brep_mgr, bounds):
+    """Create a temporary box body with the size of bounds, centered on the origin"""
+    box = adsk.core.OrientedBoundingBox3D.create(
+        adsk.core.Point3D.create(0.0, 0.0, 0.0),
+        adsk.core.Vector3D.create(1.0, 0.0, 0.0),
+        adsk.core.Vector3D.create(0.0, 1.0, 0.0),
+        bounds[3] - bounds[0],
+        bounds[4] - bounds[1],
+        bounds[5] - bounds[2],
+    )
+    return temp_brep_mgr.createBox(box)
+
+
+def create_cut_tool(temp_brep_mgr, bounds):
+    """
+    Place a temporary box body for one cut interval as a copy of the
+    template of its size, moved into position with a transform.
+    """
+    template = tab_templates.get(
+        template_key(bounds, config.FINGERPRINT_QUANTUM),
+        lambda: create_tab_template(temp_brep_mgr, bounds),
+    )
+    tool = temp_brep_mgr.copy(template)
+    placement = adsk.core.Matrix3D.create()
+    placement.translation = adsk.core.Vector3D.create(*box_center(bounds))
+    temp_brep_mgr.transform(tool, placement)
+    return tool
+
+
+@futil.traced()
+def update_joint_graph(feature_token, snapshot, body_tokens, joint_keys, layout):
+    """
+    Bring a feature's joint graph up to date with a compute: nodes follow the
+    dependencies, edges follow the intersection results (only changed pairs
+    are reinserted), every joint gets its finger layout and the pairs left
+    pending are recorded.
+    Returns the graph.
+    """
+    settings = snapshot["settings"]
+    graph = joint_graphs.get(feature_token)
+    if graph is None or graph.settings != settings:
+        graph = joint_graphs[feature_token] = JointGraph(settings)
+
+    removed_with_nodes = graph.sync_nodes(snapshot["fingerprints"], body_tokens)
+    inserted, removed = graph.sync_edges(snapshot["results"])
+    graph.pending = snapshot["pending"]
+    for joint, (dep_a, dep_b) in enumerate(joint_keys):
+        graph.set_layout(dep_a, dep_b, layout_record(layout, joint))
+
+    logger.debug(
+        "Joint graph: %s nodes, %s edges (%s inserted, %s removed)",
+        graph.node_count,
+        graph.edge_count,
+        inserted,
+        removed + removed_with_nodes,
+    )
+    _unsaved_graphs.add(feature_token)
+    return graph
+
+
+def load_joint_graph(custom_feature):
+    """The joint graph stored on a feature, or None"""
+    attr = custom_feature.attributes.itemByName(config.ADDIN_ID, GRAPH_ATTRIBUTE)
+    if not attr:
         return None
+    try:
+        return unpack_graph(attr.value)
+    except ValueError as e:
+        logger.warning("Ignoring stored joint graph: %s", e)
+        return None
+
+
+def restore_compute_snapshot(custom_feature):
+    """Seed the compute snapshot of a feature from its stored joint graph"""
+    graph = load_joint_graph(custom_feature)
+    if graph is None:
+        return False
+    feature_token = custom_feature.entityToken
+    joint_graphs[feature_token] = graph
+    compute_snapshots[feature_token] = make_snapshot(
+        graph.settings, graph.fingerprints(), graph.results(), graph.pending
+    )
+    logger.info(
+        "Restored joint graph with %s joints for %s",
+        graph.edge_count,
+        custom_feature.name,
+    )
+    return True
+
+
+@futil.traced()
+def store_joint_graph(custom_feature):
+    """Write a feature's joint graph into its graph attribute"""
+    feature_token = custom_feature.entityToken
+    graph = joint_graphs.get(feature_token)
+    if graph is None:
+        return False
+    custom_feature.attributes.add(config.ADDIN_ID, GRAPH_ATTRIBUTE, pack_graph(graph))
+    _unsaved_graphs.discard(feature_token)
+    return True
 
 
+def save_joint_graphs(_args):
+    """Before a document is saved, write every joint graph changed since the last write"""
+    design = app.activeProduct
+    for feature_token in list(_unsaved_graphs):
+        custom_feature = (
+            find_feature_by_token(design, feature_token) if design else None
+        )
+        if custom_feature:
+            store_joint_graph(custom_feature)
+        else:
+            _unsaved_graphs.discard(feature_token)
+
+
+@futil.traced()
+def cut_joint_bodies(bodies_by_id, joint_keys, layout, intersections):
+    """
+    Cut the laid out fingers and slots into temporary copies of the bodies.
+    All cut boxes for one target body are united in tree-reduction order and
+    subtracted with a single boolean.
+    Returns (cut_bodies, savings) where cut_bodies maps dependency id to the
+    cut temporary body and savings is the boolean call accounting.
+    """
+    plan = plan_cut_boxes(
+        layout, joint_keys, [intersections[key]["bounds"] for key in joint_keys]
+    )
+    temp_brep_mgr = adsk.fusion.TemporaryBRepManager.get()
+
+    def union(target, tool):
+        # A failed union poisons the rest of the reduction for this target
+        if target is None or tool is None:
+            return None
+        if not temp_brep_mgr.booleanOperation(
+            target, tool, adsk.fusion.BooleanTypes.UnionBooleanType
+        ):
+            return None
+        return target
+
+    cut_bodies = {}
+    for target_id, boxes in plan.items():
+        with futil.span("cut.tools", boxes=len(boxes)):
+            tools = [create_cut_tool(temp_brep_mgr, bounds) for bounds in boxes]
+            tool, _ = tree_reduce(tools, union)
+        if tool is None:
+            logger.warning("Uniting the joint cut tools for %s failed", target_id)
+            continue
+        with futil.span("cut.target"):
+            target = temp_brep_mgr.copy(bodies_by_id[target_id])
+            if temp_brep_mgr.booleanOperation(
+                target, tool, adsk.fusion.BooleanTypes.DifferenceBooleanType
+            ):
+                cut_bodies[target_id] = target
+            else:
+                logger.warning("Cutting joints into %s failed", target_id)
+
+    savings = batch_savings([len(boxes) for boxes in plan.values()])
+    logger.debug("Tab templates: %s", tab_templates.stats())
+    return cut_bodies, savings
+
 
 # Global custom feature definition - created once when add-in loads
 custom_feature_definition = None
@@ -169,67 +1254,94 @@ custom_feature_definition = None
 # Global variable to store the custom feature being edited
 _edited_custom_feature = None
 
+# Thickness warning (or None) per selected body entity token for the open
+# create dialog, so validateInputs only checks newly selected bodies
+_selection_validation = {}
+
+# Preview data of the open dialog: bounds and thickness per body entity
+# token, joint boxes keyed by (body tokens, tolerance) and tab boxes
+# additionally by tab width, so changing the tab width only redoes the layout
+_preview_cache = {}
+
 
 # Executed when add-in is run.
 def start():
+    global _worker_result_event, _worker_result_handler
     try:
-        futil.log(f"Starting {CREATE_CMD_NAME}...")
+        logger.info("Starting %s...", CREATE_CMD_NAME)
 
         # Perform version compatibility check
         if not perform_startup_version_check():
-            futil.log("ERROR: Version check failed, aborting add-in startup")
+            logger.error("ERROR: Version check failed, aborting add-in startup")
             return
 
         # Create the main command definition for creating new features
         cmd_def = ui.commandDefinitions.addButtonDefinition(
             CREATE_CMD_ID, CREATE_CMD_NAME, CREATE_CMD_Description, ICON_FOLDER
         )
-        futil.log(f"Created create command definition: {CREATE_CMD_ID}")
+        logger.debug("Created create command definition: %s", CREATE_CMD_ID)
         futil.add_handler(cmd_def.commandCreated, command_created)
 
         # Create the edit command definition for editing existing features
         edit_cmd_def = ui.commandDefinitions.addButtonDefinition(
             EDIT_CMD_ID, EDIT_CMD_NAME, EDIT_CMD_Description, ICON_FOLDER
         )
-        futil.log(f"Created edit command definition: {EDIT_CMD_ID}")
+        logger.debug("Created edit command definition: %s", EDIT_CMD_ID)
         futil.add_handler(edit_cmd_def.commandCreated, edit_command_created)
 
         # Now create the custom feature definition with the edit command ID
         create_custom_feature_definition()
 
+        # Background job results are delivered on the main thread by a custom event
+        _worker_result_event = app.registerCustomEvent(config.WORKER_RESULT_EVENT_ID)
+        _worker_result_handler = futil.add_handler(
+            _worker_result_event, worker_result_received
+        )
+
+        # Token lookups are only valid until the document or timeline changes
+        for event in (app.documentActivated, app.documentClosed, ui.commandTerminated):
+            handler = futil.add_handler(event, invalidate_entity_index)
+            _document_handlers.append((event, handler))
+        for event in (app.documentActivated, app.documentClosed):
+            handler = futil.add_handler(event, invalidate_metadata_index)
+            _document_handlers.append((event, handler))
+        handler = futil.add_handler(app.documentSaving, save_joint_graphs)
+        _document_handlers.append((app.documentSaving, handler))
+
         # ******** Add a button into the UI so the user can run the command. ********
         # Get the target workspace the button will be created in.
         workspace = ui.workspaces.itemById(WORKSPACE_ID)
         if not workspace:
-            futil.log(f"ERROR: Could not find workspace: {WORKSPACE_ID}")
+            logger.error("ERROR: Could not find workspace: %s", WORKSPACE_ID)
             return
-        futil.log(f"Found workspace: {WORKSPACE_ID}")
+        logger.debug("Found workspace: %s", WORKSPACE_ID)
 
         # Get the panel the button will be created in.
         panel = workspace.toolbarPanels.itemById(PANEL_ID)
         if not panel:
-            futil.log(f"ERROR: Could not find panel: {PANEL_ID}")
+            logger.error("ERROR: Could not find panel: %s", PANEL_ID)
             return
-        futil.log(f"Found panel: {PANEL_ID}")
+        logger.debug("Found panel: %s", PANEL_ID)
 
         # Create the button command control in the UI after the specified existing command.
         control = panel.controls.addCommand(cmd_def, COMMAND_BESIDE_ID, False)
         if not control:
-            futil.log("ERROR: Failed to add command to panel")
+            logger.error("ERROR: Failed to add command to panel")
             return
-        futil.log("Added command control to panel")
+        logger.debug("Added command control to panel")
 
         # Specify if the command is promoted to the main toolbar.
         control.isPromoted = IS_PROMOTED
-        futil.log(f"Command setup complete - promoted: {IS_PROMOTED}")
+        logger.info("Command setup complete - promoted: %s", IS_PROMOTED)
 
     except Exception as e:
-        futil.log(f"ERROR in start(): {e!s}")
+        logger.error("ERROR in start(): %s", e)
         ui.messageBox(f"Failed to start Hello World command: {e!s}")
 
 
 # Executed when add-in is stopped.
 def stop():
+    global _worker_result_event, _worker_result_handler
     # Get the various UI elements for this command
     workspace = ui.workspaces.itemById(WORKSPACE_ID)
     panel = workspace.toolbarPanels.itemById(PANEL_ID) if workspace else None
@@ -248,34 +1360,186 @@ def stop():
     if edit_command_definition:
         edit_command_definition.deleteMe()
 
+    for event, handler in _document_handlers:
+        event.remove(handler)
+    _document_handlers.clear()
+
+    cancel_background_jobs()
+    worker_pool.shutdown()
+    if _worker_result_event:
+        _worker_result_event.remove(_worker_result_handler)
+        app.unregisterCustomEvent(config.WORKER_RESULT_EVENT_ID)
+        _worker_result_event = None
+        _worker_result_handler = None
+
+    futil.flush_logs()
+
+    if futil.is_tracing_enabled() and config.TRACE_EXPORT_PATH:
+        futil.export_chrome_trace(config.TRACE_EXPORT_PATH)
+
+    # Release cached intersection results (and any temporary BReps they hold)
+    intersection_cache.clear()
+    compute_snapshots.clear()
+    joint_graphs.clear()
+    _unsaved_graphs.clear()
+    thickness_cache.clear()
+    plane_cache.clear()
+    component_joint_cache.clear()
+    feature_parameters_cache.clear()
+    entity_index.invalidate()
+    metadata_index.invalidate()
+    tab_templates.clear()
+    _preview_cache.clear()
+
+
+def invalidate_entity_index(_args):
+    """Document or timeline changed: drop all token lookups"""
+    entity_index.invalidate()
+
+
+def invalidate_metadata_index(_args):
+    """Another document is active: the next metadata lookup sweeps it again"""
+    metadata_index.invalidate()
+
+
+def _face_attribute_records(attributes):
+    """Index records for the face attributes among the given attributes"""
+    for attribute in attributes:
+        if attribute.name not in metadata_index.names:
+            continue
+        face = attribute.parent
+        if face is None or face.objectType != adsk.fusion.BRepFace.classType():
+            continue
+        yield (
+            face.body.entityToken,
+            face.entityToken,
+            face,
+            attribute.name,
+            attribute.value,
+        )
+
+
+def _sweep_indexed_attributes(design):
+    """
+    The add-in's attributes with an indexed name, one findAttributes call per
+    name, so joint graphs, parameters and other attributes are never fetched
+    """
+    for name in metadata_index.names:
+        yield from design.findAttributes(config.ADDIN_ID, name)
+
+
+@futil.traced()
+def get_metadata_index(design):
+    """
+    The face metadata index of the design, built from a sweep over the
+    indexed attribute names on first use. Bodies marked dirty by recomputes
+    since are refreshed from one more sweep. Lookups go through the index,
+    e.g. get_metadata_index(design).faces(JOINT_ID_ATTRIBUTE, joint_id).
+    """
+    if not metadata_index.is_built:
+        metadata_index.build(_face_attribute_records(_sweep_indexed_attributes(design)))
+        logger.info("Metadata index built: %s", metadata_index.stats())
+    elif metadata_index.is_dirty:
+        metadata_index.refresh(
+            _face_attribute_records(_sweep_indexed_attributes(design))
+        )
+    return metadata_index
+
+
+def mark_metadata_dirty(bodies):
+    """
+    Mark the given bodies' metadata entries stale after a recompute; the next
+    lookup refreshes them. Attributes live on the native bodies, so proxies
+    are marked through nativeObject.
+    """
+    metadata_index.mark_dirty(
+        (body.nativeObject or body).entityToken for body in bodies
+    )
+
+
+def _resolve_entity_token(design, token):
+    entities = design.findEntityByToken(token)
+    return entities[0] if entities else None
+
+
+def find_feature_by_token(design, feature_token):
+    """
+    Look up a Join Sheets custom feature by entity token through the index.
+    Falls back to one traversal of the root component's custom features,
+    indexing all of them.
+    """
+
+    def all_features():
+        for feature in design.rootComponent.features.customFeatures:
+            yield feature.entityToken, feature
+
+    return entity_index.get(
+        feature_token,
+        lambda token: _resolve_entity_token(design, token),
+        all_features,
+    )
+
+
+def find_body_by_token(design, body_token):
+    """Look up a body by entity token through the index"""
+    return entity_index.get(
+        body_token, lambda token: _resolve_entity_token(design, token)
+    )
+
+
+def resolve_feature_bodies(design, custom_feature):
+    """
+    Resolve the body tokens stored with a feature.
+    Returns (bodies, missing_count) with bodies in stored order.
+    """
+    parameters = load_feature_parameters(custom_feature)
+    bodies = []
+    missing = 0
+    for token in parameters["body_tokens"] if parameters else []:
+        body = find_body_by_token(design, token) if token else None
+        if body is None:
+            missing += 1
+        else:
+            bodies.append(body)
+    return bodies, missing
+
 
 # Function that is called when a user clicks the corresponding button in the UI.
 # This defines the contents of the command dialog and connects to the command related events.
 def command_created(args: adsk.core.CommandCreatedEventArgs):
     # General logging for debug.
-    futil.log(f"{CREATE_CMD_NAME} Command Created Event")
+    logger.debug("%s Command Created Event", CREATE_CMD_NAME)
 
     # https://help.autodesk.com/view/fusion360/ENU/?contextId=CommandInputs
     inputs = args.command.commandInputs
 
     # Add selection input for sheet metal bodies only
     body_selection = inputs.addSelectionInput(
-        "target_bodies", 
-        "Sheet Metal Bodies", 
-        "Select sheet metal bodies to process for joinery (minimum 2 required)"
+        "target_bodies",
+        "Sheet Metal Bodies",
+        "Select sheet metal bodies to process for joinery (minimum 2 required)",
     )
     # Use SolidBodies filter as base, custom handler will filter to sheet metal only
     body_selection.addSelectionFilter("SolidBodies")
     body_selection.setSelectionLimits(2, 0)  # Require at least 2 bodies, no maximum
-    
+
+    # Alternative to picking: every visible sheet metal body in the design
+    inputs.addBoolValueInput(
+        "all_sheet_bodies", "All Sheet Bodies in Design", True, "", False
+    )
+
     # Add tab width parameter
     defaultLengthUnits = app.activeProduct.unitsManager.defaultLengthUnits
     default_tab_width = adsk.core.ValueInput.createByString("10 mm")
-    inputs.addValueInput("tab_width", "Tab Width", defaultLengthUnits, default_tab_width)
-    
-    # Add tolerance parameter  
+    inputs.addValueInput(
+        "tab_width", "Tab Width", defaultLengthUnits, default_tab_width
+    )
+
+    # Add tolerance parameter
     default_tolerance = adsk.core.ValueInput.createByString("0.1 mm")
-    inputs.addValueInput("tolerance", "Joint Tolerance", defaultLengthUnits, default_tolerance)
+    inputs.addValueInput(
+        "tolerance", "Joint Tolerance", defaultLengthUnits, default_tolerance
+    )
 
     # Connect to the events that are needed by this command.
     futil.add_handler(
@@ -295,35 +1559,40 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
     futil.add_handler(
         args.command.destroy, command_destroy, local_handlers=local_handlers
     )
-    
+
     # Add custom selection handler to filter for sheet metal bodies only
     def sheet_metal_selection_handler(args):
         try:
             eventArgs = adsk.core.SelectionEventArgs.cast(args)
             selection = eventArgs.selection
             entity = selection.entity
-            
+
             # Check if it's a BRepBody
             if entity.objectType == adsk.fusion.BRepBody.classType():
                 body = adsk.fusion.BRepBody.cast(entity)
-                
+
                 # Only allow sheet metal bodies
                 if not body.isSheetMetal:
                     eventArgs.isSelectable = False
-                    futil.log(f"Rejected non-sheet-metal body: {body.name if hasattr(body, 'name') else 'unnamed'}")
+                    logger.debug(
+                        "Rejected non-sheet-metal body: %s",
+                        body.name if hasattr(body, "name") else "unnamed",
+                    )
                     return
             else:
                 # Reject non-body selections
                 eventArgs.isSelectable = False
-                futil.log("Rejected non-body selection")
+                logger.debug("Rejected non-body selection")
                 return
-                
+
         except Exception as e:
-            futil.log(f"Error in sheet metal selection handler: {e!s}")
+            logger.error("Error in sheet metal selection handler: %s", e)
             eventArgs.isSelectable = False
 
     futil.add_handler(
-        args.command.selectionEvent, sheet_metal_selection_handler, local_handlers=local_handlers
+        args.command.selectionEvent,
+        sheet_metal_selection_handler,
+        local_handlers=local_handlers,
     )
 
 
@@ -331,7 +1600,7 @@ def command_created(args: adsk.core.CommandCreatedEventArgs):
 # is immediately called after the created event not command inputs were created for the dialog.
 def command_execute(args: adsk.core.CommandEventArgs):
     # General logging for debug.
-    futil.log(f"{CREATE_CMD_NAME} Command Execute Event")
+    logger.debug("%s Command Execute Event", CREATE_CMD_NAME)
 
     try:
         # Get a reference to your command's inputs.
@@ -348,10 +1617,8 @@ def command_execute(args: adsk.core.CommandEventArgs):
         if not isinstance(tolerance_input, adsk.core.ValueCommandInput):
             raise TypeError("tolerance is not a ValueCommandInput")
 
-        # Get selected bodies
-        selected_bodies = []
-        for i in range(body_selection.selectionCount):
-            selected_bodies.append(body_selection.selection(i).entity)
+        # Get selected (or discovered) bodies
+        selected_bodies = list(get_dialog_bodies(inputs))
 
         # Get parameter values
         tab_width = tab_width_input.value
@@ -367,112 +1634,241 @@ def command_execute(args: adsk.core.CommandEventArgs):
         create_join_sheets_feature(design, selected_bodies, tab_width, tolerance)
 
     except Exception as e:
-        futil.log(f"Error in command_execute: {e!s}")
+        logger.error("Error in command_execute: %s", e)
         ui.messageBox(f"Error creating feature: {e!s}")
 
 
 # This event handler is called when the command needs to compute a new preview in the graphics window.
 def command_preview(args: adsk.core.CommandEventArgs):
     # General logging for debug.
-    futil.log(f"{CREATE_CMD_NAME} Command Preview Event")
-    _ = args.command.commandInputs
+    logger.debug("%s Command Preview Event", CREATE_CMD_NAME)
+    inputs = args.command.commandInputs
+    tab_width_input = inputs.itemById("tab_width")
+    tolerance_input = inputs.itemById("tolerance")
+    if not (
+        config.PREVIEW_ENABLED
+        and isinstance(tab_width_input, adsk.core.ValueCommandInput)
+        and isinstance(tolerance_input, adsk.core.ValueCommandInput)
+    ):
+        return
+
+    draw_joint_preview(
+        list(get_dialog_bodies(inputs)), tab_width_input.value, tolerance_input.value
+    )
 
 
 # This event handler is called when the user changes anything in the command dialog
 # allowing you to modify values of other inputs based on that change.
 def command_input_changed(args: adsk.core.InputChangedEventArgs):
     changed_input = args.input
-    _ = args.inputs
 
     # General logging for debug.
-    futil.log(
-        f"{CREATE_CMD_NAME} Input Changed Event fired from a change to {changed_input.id}"
+    logger.debug(
+        "%s Input Changed Event fired from a change to %s",
+        CREATE_CMD_NAME,
+        changed_input.id,
+    )
+
+    if changed_input.id == "all_sheet_bodies":
+        # Picking is pointless while every sheet body is used
+        auto_discover = adsk.core.BoolValueCommandInput.cast(changed_input).value
+        body_selection = args.inputs.itemById("target_bodies")
+        if isinstance(body_selection, adsk.core.SelectionCommandInput):
+            body_selection.isVisible = not auto_discover
+            body_selection.setSelectionLimits(0 if auto_discover else 2, 0)
+
+    if (
+        changed_input.id in ("target_bodies", "all_sheet_bodies")
+        and config.WORKER_POOL_ENABLED
+    ):
+        tolerance_input = args.inputs.itemById("tolerance")
+        if isinstance(tolerance_input, adsk.core.ValueCommandInput):
+            # Only the latest selection is worth finishing
+            cancel_background_jobs()
+            prewarm_selection(
+                list(get_dialog_bodies(args.inputs)), tolerance_input.value
+            )
+
+
+def validate_selected_body(entity):
+    """
+    Check one selected body's thickness against the tested range.
+    Returns a warning message or None if the body is within range.
+    """
+    body = adsk.fusion.BRepBody.cast(entity)
+    if not (body and body.isSheetMetal):
+        return None
+    thickness = get_sheet_metal_thickness(body)
+    if thickness and (thickness < 0.2 or thickness > 2.0):  # 2mm to 20mm in cm
+        return f"Body {body.name}: {thickness * 10:.1f}mm thickness outside tested range (2-20mm)"
+    return None
+
+
+def update_selection_validation(bodies):
+    """
+    Incrementally validate the current selection set.
+    Only bodies added since the last validateInputs event are checked; results
+    for deselected bodies are dropped. Returns warnings for newly checked
+    bodies only, so each warning is emitted once per body.
+    """
+    selected = {entity.entityToken: entity for entity in bodies}
+
+    for token in _selection_validation.keys() - selected.keys():
+        del _selection_validation[token]
+
+    new_warnings = []
+    for token in selected.keys() - _selection_validation.keys():
+        warning = validate_selected_body(selected[token])
+        _selection_validation[token] = warning
+        if warning:
+            new_warnings.append(warning)
+    return new_warnings
+
+
+def _visible_sheet_bodies(bodies):
+    for i in range(bodies.count):
+        body = bodies.item(i)
+        if body.isSheetMetal and body.isLightBulbOn:
+            yield body
+
+
+def iter_design_sheet_bodies(design):
+    """
+    Lazily yield every visible sheet metal body of a design: the root
+    component's own bodies, then each occurrence's bodies as proxies in
+    assembly context, walking the occurrence tree depth first. Occurrences
+    rather than design.allComponents, so every instance of a component
+    contributes its bodies at its own position. Hidden or suppressed
+    occurrences are skipped with everything below them, and bodies are
+    filtered on isSheetMetal before anything else is read from them.
+    """
+    root = design.rootComponent
+    yield from _visible_sheet_bodies(root.bRepBodies)
+
+    stack = [root.occurrences]
+    while stack:
+        occurrences = stack.pop()
+        for i in range(occurrences.count):
+            occurrence = occurrences.item(i)
+            if occurrence.isSuppressed or not occurrence.isLightBulbOn:
+                continue
+            yield from _visible_sheet_bodies(occurrence.bRepBodies)
+            stack.append(occurrence.childOccurrences)
+
+
+def is_discovering_bodies(inputs):
+    """True when the create dialog's "All Sheet Bodies in Design" is checked"""
+    auto_discover = inputs.itemById("all_sheet_bodies")
+    return (
+        isinstance(auto_discover, adsk.core.BoolValueCommandInput)
+        and auto_discover.value
     )
 
 
+def get_dialog_bodies(inputs):
+    """
+    Bodies the create dialog works on: the picked selection as a list, or a
+    lazy walk of the design's sheet metal bodies when "All Sheet Bodies in
+    Design" is checked. Nothing is kept between dialog events; a caller that
+    needs every body materializes the walk for its own use.
+    """
+    if is_discovering_bodies(inputs):
+        return iter_design_sheet_bodies(app.activeProduct)
+
+    body_selection = inputs.itemById("target_bodies")
+    if not isinstance(body_selection, adsk.core.SelectionCommandInput):
+        return []
+    return [
+        body_selection.selection(i).entity for i in range(body_selection.selectionCount)
+    ]
+
+
 # This event handler is called when the user interacts with any of the inputs in the dialog
 # which allows you to verify that all of the inputs are valid and enables the OK button.
 def command_validate_input(args: adsk.core.ValidateInputsEventArgs):
     # General logging for debug.
-    futil.log(f"{CREATE_CMD_NAME} Validate Input Event")
+    logger.debug("%s Validate Input Event", CREATE_CMD_NAME)
 
     inputs = args.inputs
 
     # Verify the validity of the input values. This controls if the OK button is enabled or not.
-    body_selection = inputs.itemById("target_bodies")
+    bodies = get_dialog_bodies(inputs)
     tab_width_input = inputs.itemById("tab_width")
     tolerance_input = inputs.itemById("tolerance")
-    
-    # Check that we have at least 2 bodies selected and valid parameters
-    valid_selection = (isinstance(body_selection, adsk.core.SelectionCommandInput) and 
-                      body_selection.selectionCount >= 2)
-    
-    # Validate thickness ranges (selection handler ensures only sheet metal bodies)
+
+    # Check that we have at least 2 bodies and valid parameters; a discovery
+    # walk stops at the second body
+    valid_selection = len(list(itertools.islice(bodies, 2))) == 2
+
+    # Validate thickness ranges of the picked selection only (selection
+    # handler ensures only sheet metal bodies)
     thickness_warnings = []
-    if valid_selection:
-        for i in range(body_selection.selectionCount):
-            body = adsk.fusion.BRepBody.cast(body_selection.selection(i).entity)
-            if body and body.isSheetMetal:
-                thickness = get_sheet_metal_thickness(body)
-                if thickness and (thickness < 0.2 or thickness > 2.0):  # 2mm to 20mm in cm
-                    thickness_warnings.append(f"Body {i+1}: {thickness*10:.1f}mm thickness outside tested range (2-20mm)")
-                
-    valid_tab_width = (isinstance(tab_width_input, adsk.core.ValueCommandInput) and 
-                      tab_width_input.value > 0)
-    valid_tolerance = (isinstance(tolerance_input, adsk.core.ValueCommandInput) and 
-                      tolerance_input.value >= 0)
-    
+    if valid_selection and not is_discovering_bodies(inputs):
+        thickness_warnings = update_selection_validation(bodies)
+
+    valid_tab_width = (
+        isinstance(tab_width_input, adsk.core.ValueCommandInput)
+        and tab_width_input.value > 0
+    )
+    valid_tolerance = (
+        isinstance(tolerance_input, adsk.core.ValueCommandInput)
+        and tolerance_input.value >= 0
+    )
+
     args.areInputsValid = valid_selection and valid_tab_width and valid_tolerance
-    
+
     # Log thickness warnings (but don't invalidate inputs)
     if thickness_warnings:
         for warning in thickness_warnings:
-            futil.log(f"THICKNESS WARNING: {warning}")
+            logger.warning("THICKNESS WARNING: %s", warning)
 
 
 # This event handler is called when the command terminates.
 def command_destroy(_: adsk.core.CommandEventArgs):
     # General logging for debug.
-    futil.log(f"{CREATE_CMD_NAME} Command Destroy Event")
+    logger.debug("%s Command Destroy Event", CREATE_CMD_NAME)
 
     global local_handlers
     local_handlers = []
+    _selection_validation.clear()
+    _preview_cache.clear()
 
 
 # Edit command handlers
 def edit_command_created(args: adsk.core.CommandCreatedEventArgs):
     # General logging for debug.
-    futil.log(f"{EDIT_CMD_NAME} Command Created Event")
+    logger.debug("%s Command Created Event", EDIT_CMD_NAME)
 
     # Get the specific custom feature being edited (per API documentation)
     global _edited_custom_feature
     _edited_custom_feature = None
 
     try:
-        futil.log(f"ActiveSelections count: {ui.activeSelections.count}")
+        logger.debug("ActiveSelections count: %s", ui.activeSelections.count)
 
         if ui.activeSelections.count > 0:
             _edited_custom_feature = ui.activeSelections.item(0).entity
             if _edited_custom_feature:
                 try:
                     name = _edited_custom_feature.name  # type: ignore
-                    futil.log(f"Successfully found custom feature to edit: {name}")
+                    logger.debug("Successfully found custom feature to edit: %s", name)
 
                     try:
                         token = _edited_custom_feature.entityToken  # type: ignore
-                        futil.log(f"Custom feature entity token: {token}")
+                        logger.debug("Custom feature entity token: %s", token)
+                        entity_index.add(token, _edited_custom_feature)
                     except AttributeError:
-                        futil.log("Custom feature has no entityToken attribute")
+                        logger.debug("Custom feature has no entityToken attribute")
 
                 except AttributeError:
-                    futil.log("Custom feature has no name attribute")
+                    logger.debug("Custom feature has no name attribute")
             else:
-                futil.log("activeSelections.item(0).entity is None")
+                logger.debug("activeSelections.item(0).entity is None")
         else:
-            futil.log("No active selections found")
+            logger.debug("No active selections found")
 
     except Exception as e:
-        futil.log(f"Error getting edited custom feature: {e!s}")
+        logger.error("Error getting edited custom feature: %s", e)
         _edited_custom_feature = None
 
     # https://help.autodesk.com/view/fusion360/ENU/?contextId=CommandInputs
@@ -480,25 +1876,45 @@ def edit_command_created(args: adsk.core.CommandCreatedEventArgs):
 
     # Create the same inputs as the create command
     # Note: Selection inputs for editing are more complex - for now use value inputs to show stored data
-    
+
     defaultLengthUnits = app.activeProduct.unitsManager.defaultLengthUnits
     default_tab_width = adsk.core.ValueInput.createByString("10 mm")
-    tab_width_input = inputs.addValueInput("tab_width", "Tab Width", defaultLengthUnits, default_tab_width)
-    
+    tab_width_input = inputs.addValueInput(
+        "tab_width", "Tab Width", defaultLengthUnits, default_tab_width
+    )
+
     default_tolerance = adsk.core.ValueInput.createByString("0.1 mm")
-    tolerance_input = inputs.addValueInput("tolerance", "Joint Tolerance", defaultLengthUnits, default_tolerance)
-    
+    tolerance_input = inputs.addValueInput(
+        "tolerance", "Joint Tolerance", defaultLengthUnits, default_tolerance
+    )
+
     # Add info display for selected entities (read-only for now)
-    body_info = inputs.addTextBoxCommandInput("body_info", "Selected Bodies", "Loading...", 2, True)
+    body_info = inputs.addTextBoxCommandInput(
+        "body_info", "Selected Bodies", "Loading...", 2, True
+    )
 
     # Populate with current values from the feature being edited
     if _edited_custom_feature:
-        body_count, tab_width, tolerance = get_feature_parameters(_edited_custom_feature)
+        body_count, tab_width, tolerance = get_feature_parameters(
+            _edited_custom_feature
+        )
         tab_width_input.expression = str(tab_width)
         tolerance_input.expression = str(tolerance)
         body_info.text = f"Bodies: {body_count} selected"
-        futil.log(
-            f'Populated edit dialog with: bodies={body_count}, tab_width={tab_width}, tolerance={tolerance}'
+        try:
+            bodies, missing = resolve_feature_bodies(
+                app.activeProduct, _edited_custom_feature
+            )
+            if missing:
+                body_info.text += f" ({missing} no longer found)"
+            logger.debug("Edited feature bodies: %s", [body.name for body in bodies])
+        except Exception as e:
+            logger.warning("Could not resolve edited feature bodies: %s", e)
+        logger.info(
+            "Populated edit dialog with: bodies=%s, tab_width=%s, tolerance=%s",
+            body_count,
+            tab_width,
+            tolerance,
         )
 
     # Connect to the edit-specific event handlers
@@ -525,7 +1941,7 @@ def edit_command_created(args: adsk.core.CommandCreatedEventArgs):
 
 def edit_command_execute(args: adsk.core.CommandEventArgs):
     # General logging for debug.
-    futil.log(f"{EDIT_CMD_NAME} Command Execute Event")
+    logger.debug("%s Command Execute Event", EDIT_CMD_NAME)
 
     try:
         # Get a reference to your command's inputs.
@@ -559,48 +1975,180 @@ def edit_command_execute(args: adsk.core.CommandEventArgs):
 
                 try:
                     name = _edited_custom_feature.name  # type: ignore
-                    futil.log(f"Successfully updated feature: {name}")
+                    logger.info("Successfully updated feature: %s", name)
                 except AttributeError:
-                    futil.log("Successfully updated feature (name unavailable)")
+                    logger.info("Successfully updated feature (name unavailable)")
 
             except AttributeError:
-                futil.log("_edited_custom_feature has no entityToken attribute")
+                logger.info("_edited_custom_feature has no entityToken attribute")
         else:
-            futil.log("_edited_custom_feature is None in execute handler")
+            logger.info("_edited_custom_feature is None in execute handler")
 
     except Exception as e:
-        futil.log(f"Error in edit_command_execute: {e!s}")
+        logger.error("Error in edit_command_execute: %s", e)
         ui.messageBox(f"Error updating feature: {e!s}")
 
 
-def edit_command_preview(_: adsk.core.CommandEventArgs):
-    futil.log(f"{EDIT_CMD_NAME} Command Preview Event")
+def edit_command_preview(args: adsk.core.CommandEventArgs):
+    logger.debug("%s Command Preview Event", EDIT_CMD_NAME)
+    inputs = args.command.commandInputs
+    tab_width_input = inputs.itemById("tab_width")
+    tolerance_input = inputs.itemById("tolerance")
+    if not (
+        config.PREVIEW_ENABLED
+        and _edited_custom_feature
+        and isinstance(tab_width_input, adsk.core.ValueCommandInput)
+        and isinstance(tolerance_input, adsk.core.ValueCommandInput)
+    ):
+        return
+
+    bodies, _ = resolve_feature_bodies(app.activeProduct, _edited_custom_feature)
+    draw_joint_preview(bodies, tab_width_input.value, tolerance_input.value)
 
 
 def edit_command_input_changed(args: adsk.core.InputChangedEventArgs):
     changed_input = args.input
-    futil.log(
-        f"{EDIT_CMD_NAME} Input Changed Event fired from a change to {changed_input.id}"
+    logger.debug(
+        "%s Input Changed Event fired from a change to %s",
+        EDIT_CMD_NAME,
+        changed_input.id,
     )
 
 
 def edit_command_validate_input(args: adsk.core.ValidateInputsEventArgs):
-    futil.log(f"{EDIT_CMD_NAME} Validate Input Event")
+    logger.debug("%s Validate Input Event", EDIT_CMD_NAME)
     inputs = args.inputs
     tab_width_input = inputs.itemById("tab_width")
     tolerance_input = inputs.itemById("tolerance")
-    
+
     # Check that parameters are valid
-    valid_tab_width = (isinstance(tab_width_input, adsk.core.ValueCommandInput) and 
-                      tab_width_input.value > 0)
-    valid_tolerance = (isinstance(tolerance_input, adsk.core.ValueCommandInput) and 
-                      tolerance_input.value >= 0)
-    
+    valid_tab_width = (
+        isinstance(tab_width_input, adsk.core.ValueCommandInput)
+        and tab_width_input.value > 0
+    )
+    valid_tolerance = (
+        isinstance(tolerance_input, adsk.core.ValueCommandInput)
+        and tolerance_input.value >= 0
+    )
+
     args.areInputsValid = valid_tab_width and valid_tolerance
 
 
 def edit_command_destroy(_: adsk.core.CommandEventArgs):
-    futil.log(f"{EDIT_CMD_NAME} Command Destroy Event")
+    logger.debug("%s Command Destroy Event", EDIT_CMD_NAME)
+    _preview_cache.clear()
+
+
+@futil.traced()
+def get_preview_joints(bodies, tolerance):
+    """
+    Bounding-box joint regions between the given bodies for the preview:
+    broad-phase candidate pairs and the overlap box of each, with no booleans.
+    Body bounds are measured within PREVIEW_TIME_BUDGET per preview and kept
+    for the dialog, so a large selection is completed by later previews.
+    Returns (boxes, thicknesses) or None when the budget ran out first.
+    Results are cached per selection and tolerance.
+    """
+    tokens = tuple(body.entityToken for body in bodies)
+    key = (tokens, tolerance)
+    cached = _preview_cache.get("joints")
+    if cached and cached[0] == key:
+        return cached[1]
+
+    measured = _preview_cache.setdefault("bodies", {})
+    run = ChunkedRun(config.PREVIEW_CHUNK_BODIES, config.PREVIEW_TIME_BUDGET)
+    for chunk in run.chunks(
+        [
+            (token, body)
+            for token, body in zip(tokens, bodies, strict=True)
+            if token not in measured
+        ]
+    ):
+        for token, body in chunk:
+            measured[token] = (
+                get_body_bounds(body),
+                get_sheet_metal_thickness(body) or 0.0,
+            )
+    if not run.is_complete:
+        return None
+
+    bounds = [measured[token][0] for token in tokens]
+    pairs, _ = find_candidate_pairs(bounds, tolerance)
+    pairs, boxes = joint_boxes(bounds, pairs)
+    joints = (boxes, [measured[tokens[index_a]][1] for index_a, _ in pairs])
+    _preview_cache["joints"] = (key, joints)
+    _preview_cache.pop("tabs", None)
+    return joints
+
+
+@futil.traced()
+def get_preview_tabs(joints, tab_width, tolerance):
+    """Finger boxes laid out on the preview joint boxes, cached per tab width and tolerance"""
+    key = (tab_width, tolerance)
+    cached = _preview_cache.get("tabs")
+    if cached and cached[0] == key:
+        return cached[1]
+
+    boxes, thicknesses = joints
+    lengths = [max(box[3] - box[0], box[4] - box[1], box[5] - box[2]) for box in boxes]
+    layout = layout_fingers(
+        lengths,
+        thicknesses,
+        tab_width,
+        tolerance,
+        config.DEFAULT_FINGER_RATIO,
+        config.DEFAULT_MIN_FINGER_COUNT,
+    )
+    tabs = (
+        finger_boxes(layout, boxes)
+        if layout.segment_count <= config.PREVIEW_MAX_TAB_SEGMENTS
+        else []
+    )
+    _preview_cache["tabs"] = (key, tabs)
+    return tabs
+
+
+def add_preview_lines(group, boxes, color):
+    """Draw boxes as one wireframe line set"""
+    coordinates, indices = box_lines(boxes)
+    lines = group.addLines(
+        adsk.fusion.CustomGraphicsCoordinates.create(coordinates), indices, False
+    )
+    lines.color = adsk.fusion.CustomGraphicsSolidColorEffect.create(color)
+    return lines
+
+
+def draw_joint_preview(bodies, tab_width, tolerance):
+    """
+    Draw candidate joint boxes and approximate tab positions as custom
+    graphics. Graphics made during executePreview are discarded by Fusion when
+    the preview ends. Returns False if the preview ran out of time.
+    executePreview must not call adsk.doEvents, so newer input is only seen
+    by the next preview; the time budget keeps each one short instead.
+    """
+    if len(bodies) < 2 or tab_width <= 0:
+        return True
+    try:
+        with futil.span("preview", bodies=len(bodies)):
+            joints = get_preview_joints(bodies, tolerance)
+            if joints is None:
+                logger.debug("Preview out of time, continued by the next preview")
+                return False
+            tabs = get_preview_tabs(joints, tab_width, tolerance)
+
+            group = app.activeProduct.rootComponent.customGraphicsGroups.add()
+            if joints[0]:
+                add_preview_lines(
+                    group, joints[0], adsk.core.Color.create(255, 140, 0, 255)
+                )
+            if tabs:
+                add_preview_lines(group, tabs, adsk.core.Color.create(0, 120, 255, 255))
+        logger.debug("Preview: %s joint boxes, %s tabs", len(joints[0]), len(tabs))
+        return True
+
+    except Exception as e:
+        logger.error("Error drawing preview: %s", e)
+        return False
 
 
 def create_custom_feature_definition():
@@ -626,10 +2174,10 @@ def create_custom_feature_definition():
             local_handlers=local_handlers,
         )
 
-        futil.log(f"Created CustomFeatureDefinition: {feature_id}")
+        logger.info("Created CustomFeatureDefinition: %s", feature_id)
 
     except Exception as e:
-        futil.log(f"Error creating CustomFeatureDefinition: {e!s}")
+        logger.error("Error creating CustomFeatureDefinition: %s", e)
         raise
 
 
@@ -645,23 +2193,42 @@ def create_join_sheets_feature(design, selected_bodies, tab_width, tolerance):
 
         # Create the custom feature input using the pre-created definition
         custom_feature_input = custom_features.createInput(custom_feature_definition)
-        
+
         # Add dependencies on the selected bodies
         for i, body in enumerate(selected_bodies):
             custom_feature_input.addDependency(f"body_{i}", body)
-        
+
+        # Fusion computes the feature inside add(), before anything can be
+        # stored on it, so the parameters that compute needs go on the input
+        units = design.unitsManager.defaultLengthUnits
+        custom_feature_input.addCustomParameter(
+            TAB_WIDTH_PARAMETER,
+            "Tab Width",
+            adsk.core.ValueInput.createByReal(tab_width),
+            units,
+            True,
+        )
+        custom_feature_input.addCustomParameter(
+            TOLERANCE_PARAMETER,
+            "Joint Tolerance",
+            adsk.core.ValueInput.createByReal(tolerance),
+            units,
+            True,
+        )
+
         custom_feature = custom_features.add(custom_feature_input)
 
         # Store the parameters in the feature for later retrieval
         store_feature_parameters(custom_feature, selected_bodies, tab_width, tolerance)
+        store_joint_graph(custom_feature)
 
-        futil.log(
-            f"Successfully created Join Sheets custom feature: {custom_feature.name}"
+        logger.info(
+            "Successfully created Join Sheets custom feature: %s", custom_feature.name
         )
         return custom_feature
 
     except Exception as e:
-        futil.log(f"Error creating Join Sheets feature: {e!s}")
+        logger.error("Error creating Join Sheets feature: %s", e)
         raise
 
 
@@ -669,212 +2236,373 @@ def update_join_sheets_feature(design, feature_token, tab_width, tolerance):
     """Update an existing Join Sheets custom feature (parameters only)"""
     try:
         # Find the existing feature by its token
-        root_comp = design.rootComponent
-        custom_features = root_comp.features.customFeatures
-
-        existing_feature = None
-        for feature in custom_features:
-            if feature.entityToken == feature_token:
-                existing_feature = feature
-                break
+        existing_feature = find_feature_by_token(design, feature_token)
 
         if not existing_feature:
-            futil.log(f"Could not find existing feature with token: {feature_token}")
+            logger.info("Could not find existing feature with token: %s", feature_token)
             ui.messageBox("Could not find feature to update")
             return None
 
-        # Get current parameters to preserve body selections
-        body_count, current_tab_width, current_tolerance = get_feature_parameters(existing_feature)
-        
-        # Update only the tab width and tolerance parameters
-        attrs = existing_feature.attributes
-        group_name = config.ADDIN_ID
-        
-        # Update the attributes
-        tab_width_attr = attrs.itemByName(group_name, "tab_width")
-        tolerance_attr = attrs.itemByName(group_name, "tolerance")
-        
-        if tab_width_attr:
-            tab_width_attr.value = str(tab_width)
-        else:
-            attrs.add(group_name, "tab_width", str(tab_width))
-            
-        if tolerance_attr:
-            tolerance_attr.value = str(tolerance)
-        else:
-            attrs.add(group_name, "tolerance", str(tolerance))
+        # Keep the stored body tokens, replace tab width and tolerance
+        migrate_legacy_parameters(existing_feature)
+        parameters = load_feature_parameters(existing_feature)
+        body_tokens = parameters["body_tokens"] if parameters else []
+        write_feature_parameters(
+            existing_feature, make_parameters(tab_width, tolerance, body_tokens)
+        )
 
         # The feature will automatically recompute when parameters change
         # No need to rollTo which moves the timeline marker
-
-        futil.log(
-            f"Successfully updated Join Sheets custom feature: {existing_feature.name}"
+        for parameter_id, value in (
+            (TAB_WIDTH_PARAMETER, tab_width),
+            (TOLERANCE_PARAMETER, tolerance),
+        ):
+            parameter = existing_feature.parameters.itemById(parameter_id)
+            if parameter:
+                parameter.value = value
+
+        logger.info(
+            "Successfully updated Join Sheets custom feature: %s", existing_feature.name
         )
         return existing_feature
 
     except Exception as e:
-        futil.log(f"Error updating Join Sheets feature: {e!s}")
+        logger.error("Error updating Join Sheets feature: %s", e)
         raise
 
 
+def write_feature_parameters(custom_feature, parameters):
+    """Store parameters in the feature's single packed attribute"""
+    packed = pack_parameters(parameters)
+    custom_feature.attributes.add(config.ADDIN_ID, PARAMS_ATTRIBUTE, packed)
+    feature_parameters_cache[custom_feature.entityToken] = (packed, parameters)
+
+
+@futil.traced()
 def store_feature_parameters(custom_feature, selected_bodies, tab_width, tolerance):
     """Store parameters in the custom feature for later retrieval"""
     try:
-        # Use attributes to store our parameters
-        attrs = custom_feature.attributes
-        group_name = config.ADDIN_ID
-
-        # Store the parameters as attributes
-        attrs.add(group_name, "body_count", str(len(selected_bodies)))
-        attrs.add(group_name, "tab_width", str(tab_width))
-        attrs.add(group_name, "tolerance", str(tolerance))
-        
-        # Store entity tokens for bodies (for edit functionality)
-        for i, body in enumerate(selected_bodies):
-            attrs.add(group_name, f"body_{i}_token", body.entityToken)
+        # One packed attribute holds every parameter and the body entity
+        # tokens (for edit functionality)
+        body_tokens = [body.entityToken for body in selected_bodies]
+        write_feature_parameters(
+            custom_feature, make_parameters(tab_width, tolerance, body_tokens)
+        )
 
-        futil.log(
-            f'Stored parameters in feature: bodies={len(selected_bodies)}, tab_width={tab_width}, tolerance={tolerance}'
+        logger.info(
+            "Stored parameters in feature: bodies=%s, tab_width=%s, tolerance=%s",
+            len(selected_bodies),
+            tab_width,
+            tolerance,
         )
 
     except Exception as e:
-        futil.log(f"Error storing feature parameters: {e!s}")
+        logger.error("Error storing feature parameters: %s", e)
 
 
-def get_feature_parameters(custom_feature):
-    """Retrieve stored parameters from a custom feature"""
+def read_legacy_parameters(custom_feature):
+    """
+    Read the per-key attributes written by older versions without changing
+    them. Returns (parameters, legacy_attributes); parameters is None when
+    the feature has no legacy attributes either.
+    """
+    legacy_attrs = [
+        attr
+        for attr in custom_feature.attributes.itemsByGroup(config.ADDIN_ID)
+        if is_legacy_attribute(attr.name)
+    ]
+    parameters = legacy_parameters({attr.name: attr.value for attr in legacy_attrs})
+    return parameters, legacy_attrs
+
+
+def migrate_legacy_parameters(custom_feature):
+    """
+    Convert a feature from older versions to the packed attribute.
+    Only called from command handlers: compute must not modify the
+    document, so it reads legacy attributes in place instead.
+    Returns True when the feature was migrated.
+    """
+    if custom_feature.attributes.itemByName(config.ADDIN_ID, PARAMS_ATTRIBUTE):
+        return False
+    parameters, legacy_attrs = read_legacy_parameters(custom_feature)
+    if parameters is None:
+        return False
+
     try:
-        attrs = custom_feature.attributes
-        group_name = config.ADDIN_ID
+        write_feature_parameters(custom_feature, parameters)
+        for attr in legacy_attrs:
+            attr.deleteMe()
+        logger.info("Migrated %s legacy parameter attributes", len(legacy_attrs))
+        return True
+    except Exception as e:
+        # Still usable read-only; migration is retried on the next edit
+        logger.warning("Could not migrate legacy feature parameters: %s", e)
+        return False
 
-        # Get parameter counts
-        body_count_attr = attrs.itemByName(group_name, "body_count")
-        tab_width_attr = attrs.itemByName(group_name, "tab_width") 
-        tolerance_attr = attrs.itemByName(group_name, "tolerance")
 
-        body_count = int(body_count_attr.value) if body_count_attr else 0
-        tab_width = float(tab_width_attr.value) if tab_width_attr else 10.0
-        tolerance = float(tolerance_attr.value) if tolerance_attr else 0.1
+@futil.traced()
+def load_feature_parameters(custom_feature):
+    """
+    Return the feature's parameters dict (tab_width, tolerance, body_tokens),
+    or None when nothing is stored yet.
+    Reads the packed attribute once and reuses the parsed result while its
+    text is unchanged. Features from older versions are read in place and
+    only migrated by the edit command, so this never writes.
+    """
+    token = custom_feature.entityToken
+    attr = custom_feature.attributes.itemByName(config.ADDIN_ID, PARAMS_ATTRIBUTE)
+    if attr:
+        packed = attr.value
+        cached = feature_parameters_cache.get(token)
+        if cached and cached[0] == packed:
+            return cached[1]
+        parameters = unpack_parameters(packed)
+        feature_parameters_cache[token] = (packed, parameters)
+        return parameters
+
+    parameters, _ = read_legacy_parameters(custom_feature)
+    return parameters
 
-        # Note: For edit functionality, we would need to find entities by token
-        # This is a simplified version for now
-        
-        return body_count, tab_width, tolerance
+
+def get_feature_parameters(custom_feature):
+    """
+    Retrieve (body_count, tab_width, tolerance) of a custom feature.
+    Tab width and tolerance come from the feature's custom parameters, which
+    exist from its first compute; features created before those were added
+    keep them in the packed attribute only.
+    """
+    try:
+        tab_width = custom_feature.parameters.itemById(TAB_WIDTH_PARAMETER)
+        tolerance = custom_feature.parameters.itemById(TOLERANCE_PARAMETER)
+        if tab_width and tolerance:
+            return custom_feature.dependencies.count, tab_width.value, tolerance.value
+
+        parameters = load_feature_parameters(custom_feature)
+        if parameters is None:
+            logger.warning("Feature has no stored parameters, using defaults")
+            return 0, 10.0, 0.1
+        return (
+            len(parameters["body_tokens"]),
+            parameters["tab_width"],
+            parameters["tolerance"],
+        )
 
     except Exception as e:
-        futil.log(f"Error retrieving feature parameters: {e!s}")
+        logger.error("Error retrieving feature parameters: %s", e)
         return 0, 10.0, 0.1
 
 
+@futil.traced()
 def compute_join_sheets_feature(args):
     """Compute handler for the Join Sheets custom feature"""
     try:
         custom_feature = args.customFeature
-        futil.log(f"=== COMPUTE HANDLER CALLED ===")
-        futil.log(f"Computing Join Sheets feature: {custom_feature.name}")
+        logger.debug("=== COMPUTE HANDLER CALLED ===")
+        logger.info("Computing Join Sheets feature: %s", custom_feature.name)
 
         # Get stored parameters
         body_count, tab_width, tolerance = get_feature_parameters(custom_feature)
-        futil.log(f"Feature parameters: bodies={body_count}, tab_width={tab_width}, tolerance={tolerance}")
+        logger.info(
+            "Feature parameters: bodies=%s, tab_width=%s, tolerance=%s",
+            body_count,
+            tab_width,
+            tolerance,
+        )
 
         # Get dependencies (the selected bodies)
         dependencies = custom_feature.dependencies
-        futil.log(f"Feature has {dependencies.count} dependencies")
+        logger.debug("Feature has %s dependencies", dependencies.count)
 
         if dependencies.count < 2:
-            futil.log("WARNING: Feature needs at least 2 body dependencies")
+            logger.warning("WARNING: Feature needs at least 2 body dependencies")
             args.isComputed = True  # Don't fail, just warn
             return
 
-        # Collect the dependent bodies
-        bodies = []
-        
-        for i in range(dependencies.count):
-            dependency = dependencies.item(i)
-            entity = dependency.entity
-            
-            futil.log(f"Processing dependency {i}: {entity.objectType}")
-            
-            # All dependencies should be bodies since we only added bodies
-            if entity.objectType == adsk.fusion.BRepBody.classType():
-                bodies.append(entity)
-
-        futil.log(f"Found {len(bodies)} bodies in dependencies")
+        bodies, dependency_ids = collect_dependency_bodies(dependencies)
+        logger.info("Found %s bodies in dependencies", len(bodies))
 
         if len(bodies) >= 2:
-            # Create intersection body using TemporaryBRepManager (internal to Custom Feature)
-            futil.log(f"Creating temporary intersection between {len(bodies)} bodies")
-            intersection_body = create_intersection_body_temporary(bodies[0], bodies[1])
-            
-            if not intersection_body:
-                futil.log("No intersection found between bodies - cannot create joint")
+            # Broad phase + boolean intersection for every overlapping pair
+            logger.info("Finding intersections between %s bodies", len(bodies))
+            feature_token = custom_feature.entityToken
+            if feature_token not in compute_snapshots:
+                # After reopening a document the stored graph stands in for the
+                # snapshot of the last compute
+                restore_compute_snapshot(custom_feature)
+            intersections, snapshot = compute_feature_intersections(
+                feature_token, dependency_ids, bodies, tab_width, tolerance
+            )
+            if snapshot["pending"]:
+                # Partial results are kept; the next compute resumes the pending pairs
+                logger.warning(
+                    "%s body pairs left pending, recompute the feature to finish them",
+                    len(snapshot["pending"]),
+                )
+
+            if not intersections:
+                logger.info(
+                    "No intersections suitable for joinery found between bodies"
+                )
+                compute_snapshots.pop(feature_token, None)
                 args.isComputed = False
                 return
-                
-            # Analyze intersection geometry
-            thickness = get_sheet_metal_thickness(bodies[0])  # Use first body's thickness
-            intersection_info = analyze_intersection_geometry(intersection_body, thickness)
-            
-            if not intersection_info:
-                futil.log("Intersection geometry is not suitable for joinery")
-                args.isComputed = False
-                return
-                
-            futil.log(f"Valid intersection found: {intersection_info['description']}")
-            futil.log(f"Intersection volume: {intersection_body.volume*1000:.2f} cm³")
-            
+
+            for (dep_a, dep_b), intersection_info in intersections.items():
+                logger.debug(
+                    "Valid intersection between %s and %s: %s",
+                    dep_a,
+                    dep_b,
+                    intersection_info["description"],
+                )
+
+            # Alternating tab/slot segments with tolerance-widened cuts
+            joint_keys, layout = layout_feature_joints(
+                intersections, tab_width, tolerance
+            )
+            last_compute_stats.update(
+                joints=layout.joint_count, segments=layout.segment_count
+            )
+            logger.info(
+                "Finger layout: %s segments across %s joints",
+                layout.segment_count,
+                layout.joint_count,
+            )
+            for joint, (dep_a, dep_b) in enumerate(joint_keys):
+                logger.debug(
+                    "Joint %s-%s: %s segments",
+                    dep_a,
+                    dep_b,
+                    len(layout.segments(joint)),
+                )
+
+            graph = update_joint_graph(
+                feature_token,
+                snapshot,
+                {
+                    dep_id: body.entityToken
+                    for dep_id, body in zip(dependency_ids, bodies, strict=True)
+                },
+                joint_keys,
+                layout,
+            )
+            last_compute_stats.update(
+                graph_nodes=graph.node_count, graph_edges=graph.edge_count
+            )
+
+            if config.JOINT_CUTS_ENABLED and layout.segment_count:
+                cut_feature_joints(
+                    dependency_ids, bodies, joint_keys, layout, intersections
+                )
+
             # TODO: Create persistent geometry for final joinery result
-            # TODO: Slice intersection body into segments for alternating tabs/slots  
-            # TODO: Create tabs on one body and slots on the other using boolean operations
-            # TODO: Apply tolerance adjustments and material-aware sizing
-            
-            futil.log("Temporary intersection analysis completed successfully")
+            # TODO: Material-aware sizing
+
+            logger.info(
+                "Temporary intersection analysis completed: %s intersections",
+                len(intersections),
+            )
+            mark_metadata_dirty(bodies)
+            compute_snapshots[feature_token] = snapshot
             args.isComputed = True
         else:
-            futil.log("ERROR: Need at least 2 bodies to generate joints")
+            logger.error("ERROR: Need at least 2 bodies to generate joints")
             args.isComputed = False
 
     except Exception as e:
-        futil.log(f"Error computing Join Sheets feature: {e!s}")
+        logger.error("Error computing Join Sheets feature: %s", e)
         args.isComputed = False
 
 
+def collect_dependency_bodies(dependencies):
+    """
+    Bodies among a custom feature's dependencies.
+    Returns (bodies, dependency_ids) as parallel lists.
+    """
+    bodies = []
+    dependency_ids = []
+    for i in range(dependencies.count):
+        dependency = dependencies.item(i)
+        entity = dependency.entity
+
+        logger.debug("Processing dependency %s: %s", i, entity.objectType)
+
+        # All dependencies should be bodies since we only added bodies
+        if entity.objectType == adsk.fusion.BRepBody.classType():
+            bodies.append(entity)
+            dependency_ids.append(dependency.id)
+    return bodies, dependency_ids
+
+
+def cut_feature_joints(dependency_ids, bodies, joint_keys, layout, intersections):
+    """
+    Cut the laid out joints into the feature's bodies and record the boolean savings.
+    Only runs with config.JOINT_CUTS_ENABLED: the cut temporary bodies are
+    not yet written to the feature's output, so the cuts serve the boolean
+    accounting in last_compute_stats and the benchmarks.
+    """
+    cut_bodies, savings = cut_joint_bodies(
+        dict(zip(dependency_ids, bodies, strict=True)),
+        joint_keys,
+        layout,
+        intersections,
+    )
+    last_compute_stats.update(savings)
+    logger.info(
+        "Cut %s tools into %s bodies with %s target booleans (%s saved, %s tool unions)",
+        savings["tools"],
+        len(cut_bodies),
+        savings["target_booleans"],
+        savings["target_booleans_saved"],
+        savings["tool_unions"],
+    )
+    return cut_bodies
+
+
 def generate_single_intersection_joint(body1, body2, tab_width, tolerance):
     """Generate slot-and-tab joint between two sheet bodies"""
     try:
-        futil.log(f"=== STARTING JOINT GENERATION ===")
-        futil.log(f"Body1: {body1.name if hasattr(body1, 'name') else 'unnamed'}")
-        futil.log(f"Body2: {body2.name if hasattr(body2, 'name') else 'unnamed'}")
-        futil.log(f"Tab width: {tab_width*10:.1f}mm, Tolerance: {tolerance*10:.1f}mm")
-        
+        logger.debug("=== STARTING JOINT GENERATION ===")
+        logger.debug("Body1: %s", body1.name if hasattr(body1, "name") else "unnamed")
+        logger.debug("Body2: %s", body2.name if hasattr(body2, "name") else "unnamed")
+        logger.debug(
+            "Tab width: %.1fmm, Tolerance: %.1fmm", tab_width * 10, tolerance * 10
+        )
+
         # Selection handler guarantees these are sheet metal bodies
         for i, body in enumerate([body1, body2], 1):
             if not body:
-                futil.log(f"ERROR: Body {i} is invalid")
+                logger.error("ERROR: Body %s is invalid", i)
                 return False
-                
+
             # Cast to BRepBody and verify it's still a sheet metal body
             sheet_body = adsk.fusion.BRepBody.cast(body)
             if not (sheet_body and sheet_body.isSheetMetal):
-                futil.log(f"ERROR: Body {i} lost sheet metal classification during processing")
+                logger.error(
+                    "ERROR: Body %s lost sheet metal classification during processing",
+                    i,
+                )
                 return False
-                
+
             # Get thickness from sheet metal rule or geometry
             thickness = get_sheet_metal_thickness(sheet_body)
             if not thickness:
-                futil.log(f"ERROR: Could not determine thickness for Body {i}")
+                logger.error("ERROR: Could not determine thickness for Body %s", i)
                 return False
-            
+
             # Warn if outside tested range but continue processing
             if thickness < 0.2 or thickness > 2.0:  # 2mm to 20mm in cm
-                futil.log(f"WARNING: Body {i} thickness {thickness*10:.1f}mm outside tested range (2-20mm)")
-        
+                logger.warning(
+                    "WARNING: Body %s thickness %.1fmm outside tested range (2-20mm)",
+                    i,
+                    thickness * 10,
+                )
+
         # This function now only validates sheet metal bodies
         # Intersection creation moved to compute handler for proper timeline integration
-        
-        futil.log("Sheet metal body validation completed successfully")
+
+        logger.info("Sheet metal body validation completed successfully")
         return True
-        
+
     except Exception as e:
-        futil.log(f"Error in generate_single_intersection_joint: {e!s}")
+        logger.error("Error in generate_single_intersection_joint: %s", e)
         return False
@@ -50,3 +50,82 @@ JOINT_TYPES = {
 DOGBONE_TYPES = {"CORNER": "CornerDogbone", "FACE": "FaceDogbone", "NONE": "NoDogbone"}
 
 # Metadata storage uses ADDIN_ID as the attribute group name
+
+# Intersection cache settings
+# Fingerprints quantize lengths/areas/volumes to this grid (in cm, Fusion's internal units)
+FINGERPRINT_QUANTUM = 1e-5
+INTERSECTION_CACHE_MAX_ENTRIES = 4096
+INTERSECTION_CACHE_MAX_BYTES = 32 * 1024 * 1024  # 32 MB
+# Keeping temporary BReps makes cache hits reusable for geometry, at a memory cost
+INTERSECTION_CACHE_KEEP_BREP = False
+# Rough per-face memory estimate used to charge cached BReps against the cap
+INTERSECTION_CACHE_BREP_BYTES_PER_FACE = 4096
+
+# Incremental recompute - only re-evaluate body pairs touching a changed dependency
+INCREMENTAL_COMPUTE = True
+
+# Planar slab kernel - intersect convex flat sheets without BRep booleans
+PLANAR_KERNEL_ENABLED = True
+PLANAR_KERNEL_EPSILON = 1e-6  # cm
+
+# Geometric sheet thickness cache size (entries keyed by body fingerprint)
+THICKNESS_CACHE_MAX_ENTRIES = 8192
+
+# Logging - records are buffered in a ring buffer and written in batches
+# Default level for all modules: "DEBUG", "INFO", "WARNING", "ERROR" or "OFF"
+LOG_LEVEL = "DEBUG" if DEBUG else "INFO"
+# Per-module overrides keyed by logger name or dotted suffix, e.g. {"joinSheets.entry": "INFO"}
+LOG_LEVELS = {}
+LOG_BUFFER_SIZE = 2048  # records kept in memory
+LOG_FLUSH_BATCH = 64  # records per write to the Text Command window
+LOG_FILE = None  # optional path to also append log batches to
+
+# Tracing - timing spans around the compute pipeline and event handlers.
+# Can also be switched at runtime with futil.enable_tracing()/disable_tracing().
+TRACING = False
+TRACE_MAX_EVENTS = 100_000  # span events kept for trace export
+TRACE_MAX_SAMPLES = 10_000  # durations sampled per span name for percentiles
+TRACE_EXPORT_PATH = None  # Chrome trace/Perfetto JSON written on add-in stop
+
+# Joint cutting - finger/slot cut boxes are united per target body and
+# subtracted with one boolean per target. Off until the feature outputs the
+# cut bodies: compute discards them and only records the boolean counts in
+# its stats, so every regen would pay for booleans nothing uses. Turn on only
+# to measure the batched cuts
+JOINT_CUTS_ENABLED = False
+# Tab/slot solids are built once per distinct size and placed by copy + transform
+TAB_TEMPLATE_CACHE_MAX_ENTRIES = 256
+
+# Command preview - bounding-box joints and tab positions drawn as custom graphics
+PREVIEW_ENABLED = True
+PREVIEW_MAX_TAB_SEGMENTS = 5000  # above this only joint boxes are drawn
+PREVIEW_CHUNK_BODIES = 32  # bodies measured between time budget checks
+PREVIEW_TIME_BUDGET = 0.25  # seconds of body measurement per preview
+
+# Background prewarm - while the create dialog is open, the planar pairs of the
+# selection are analyzed on a worker thread from main-thread snapshots, so the
+# compute after OK finds them cached. Compute itself runs on the main thread:
+# the kernel is pure Python and gains nothing from threads under the GIL
+WORKER_POOL_ENABLED = True
+WORKER_POOL_MAX_WORKERS = 1  # only the latest selection's job is worth running
+# Background analysis of the dialog selection; results arrive through this custom event
+WORKER_RESULT_EVENT_ID = f"{ADDIN_ID}_workerResult"
+WORKER_PREWARM_MIN_BODIES = 8
+
+# Chunked compute - body pairs are processed in chunks with progress, cancellation
+# and a time budget; unfinished pairs stay pending for the next compute. Compute
+# does not pump Fusion's events, so the budget is what bounds a long compute
+COMPUTE_CHUNK_PAIRS = 256
+COMPUTE_TIME_BUDGET = 30.0  # seconds, 0 = no limit
+COMPUTE_PROGRESS_DELAY = 1  # seconds before the progress dialog appears
+
+# Orientation pre-filter - pairs of parallel sheets are dropped before the narrow
+# phase unless they are coplanar (edge joints)
+ORIENTATION_FILTER_ENABLED = True
+ORIENTATION_ANGLE_TOLERANCE_DEG = 1.0
+PLANE_CACHE_MAX_ENTRIES = 8192
+
+# Component partitioning - joints between bodies of one occurrence are computed once
+# per component definition in local coordinates and placed into every occurrence
+PARTITION_BY_COMPONENT = True
+COMPONENT_CACHE_MAX_ENTRIES = 1024
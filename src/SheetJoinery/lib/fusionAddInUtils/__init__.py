@@ -2,5 +2,34 @@ from .event_utils import add_handler as add_handler
 from .event_utils import clear_handlers as clear_handlers
 from .general_utils import handle_error as handle_error
 from .general_utils import log as log
+from .log_utils import flush_logs as flush_logs
+from .log_utils import get_logger as get_logger
+from .log_utils import set_log_level as set_log_level
+from .trace_utils import disable_tracing as disable_tracing
+from .trace_utils import enable_tracing as enable_tracing
+from .trace_utils import export_chrome_trace as export_chrome_trace
+from .trace_utils import format_span_stats as format_span_stats
+from .trace_utils import is_tracing_enabled as is_tracing_enabled
+from .trace_utils import reset_tracing as reset_tracing
+from .trace_utils import span as span
+from .trace_utils import span_stats as span_stats
+from .trace_utils import traced as traced
 
-__all__ = ["add_handler", "clear_handlers", "handle_error", "log"]
+__all__ = [
+    "add_handler",
+    "clear_handlers",
+    "disable_tracing",
+    "enable_tracing",
+    "export_chrome_trace",
+    "flush_logs",
+    "format_span_stats",
+    "get_logger",
+    "handle_error",
+    "is_tracing_enabled",
+    "log",
+    "reset_tracing",
+    "set_log_level",
+    "span",
+    "span_stats",
+    "traced",
+]
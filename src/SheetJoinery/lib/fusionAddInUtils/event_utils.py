@@ -15,6 +15,8 @@ from collections.abc import Callable
 import adsk.core
 
 from .general_utils import handle_error
+from .log_utils import flush_logs
+from .trace_utils import span
 
 # Global Variable to hold Event Handlers
 _handlers = []
@@ -83,8 +85,12 @@ def _define_handler(handler_type, callback, name: str | None = None):
 
         def notify(self, args):
             try:
-                callback(args)
+                with span(f"event:{name}"):
+                    callback(args)
             except Exception:
                 handle_error(name or "Unknown Event Handler")
+            finally:
+                # Write out log records buffered while handling the event
+                flush_logs()
 
     return Handler
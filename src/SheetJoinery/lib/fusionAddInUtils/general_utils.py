@@ -13,16 +13,12 @@ import traceback
 
 import adsk.core
 
+from .log_utils import from_fusion_level, get_logger
+
 app = adsk.core.Application.get()
 ui = app.userInterface
 
-# Attempt to read DEBUG flag from parent config.
-try:
-    from ... import config
-
-    DEBUG = config.DEBUG
-except Exception:
-    DEBUG = False
+_logger = get_logger("fusionAddInUtils")
 
 
 def log(
@@ -32,23 +28,17 @@ def log(
 ):
     """Utility function to easily handle logging in your app.
 
+    Messages go through the buffered logger in log_utils: they are printed,
+    written to the Text Command window when config.DEBUG is True and, for
+    errors, to the Fusion log file, in batches. Errors flush immediately.
+    Prefer get_logger(__name__) with lazy %-style arguments in hot paths.
+
     Arguments:
     message -- The message to log.
     level -- The logging severity level.
     force_console -- Forces the message to be written to the Text Command window.
     """
-    # Always print to console, only seen through IDE.
-    print(message)
-
-    # Log all errors to Fusion log file.
-    if level == adsk.core.LogLevels.ErrorLogLevel:
-        log_type = adsk.core.LogTypes.FileLogType
-        app.log(message, level, log_type)  # type: ignore
-
-    # If config.DEBUG is True write all log messages to the console.
-    if DEBUG or force_console:
-        log_type = adsk.core.LogTypes.ConsoleLogType
-        app.log(message, level, log_type)  # type: ignore
+    _logger.log(from_fusion_level(level), message, force_console=force_console)
 
 
 def handle_error(name: str, show_message_box: bool = False):
@@ -0,0 +1,238 @@
+import time
+from collections import deque
+
+import adsk.core
+
+from .trace_utils import span
+
+app = adsk.core.Application.get()
+
+# Attempt to read logging settings from parent config.
+try:
+    from ... import config
+
+    DEBUG = config.DEBUG
+    _DEFAULT_LEVEL = getattr(config, "LOG_LEVEL", "DEBUG" if DEBUG else "INFO")
+    _MODULE_LEVELS = dict(getattr(config, "LOG_LEVELS", {}))
+    _BUFFER_SIZE = getattr(config, "LOG_BUFFER_SIZE", 2048)
+    _FLUSH_BATCH = getattr(config, "LOG_FLUSH_BATCH", 64)
+    _LOG_FILE = getattr(config, "LOG_FILE", None)
+except Exception:
+    DEBUG = False
+    _DEFAULT_LEVEL = "INFO"
+    _MODULE_LEVELS = {}
+    _BUFFER_SIZE = 2048
+    _FLUSH_BATCH = 64
+    _LOG_FILE = None
+
+DEBUG_LEVEL = 10
+INFO_LEVEL = 20
+WARNING_LEVEL = 30
+ERROR_LEVEL = 40
+DISABLED_LEVEL = 100
+
+LEVELS = {
+    "DEBUG": DEBUG_LEVEL,
+    "INFO": INFO_LEVEL,
+    "WARNING": WARNING_LEVEL,
+    "ERROR": ERROR_LEVEL,
+    "OFF": DISABLED_LEVEL,
+}
+_LEVEL_NAMES = {value: name for name, value in LEVELS.items()}
+
+# Records are (timestamp, level, logger name, message, args, fields); formatting
+# is deferred until the buffer is flushed.
+_records = deque(maxlen=_BUFFER_SIZE)
+_unflushed = 0
+_loggers = {}
+
+
+def _noop(*_args, **_kwargs):
+    pass
+
+
+def _to_level(level: int | str) -> int:
+    return LEVELS[level.upper()] if isinstance(level, str) else level
+
+
+def _to_fusion_level(level: int) -> int:
+    if level >= ERROR_LEVEL:
+        return adsk.core.LogLevels.ErrorLogLevel  # type: ignore
+    if level >= WARNING_LEVEL:
+        return adsk.core.LogLevels.WarningLogLevel  # type: ignore
+    return adsk.core.LogLevels.InfoLogLevel  # type: ignore
+
+
+def from_fusion_level(level: int) -> int:
+    """Map an adsk.core.LogLevels value onto this module's levels."""
+    if level == adsk.core.LogLevels.ErrorLogLevel:
+        return ERROR_LEVEL
+    if level == adsk.core.LogLevels.WarningLogLevel:
+        return WARNING_LEVEL
+    return INFO_LEVEL
+
+
+def _module_level(name: str) -> int:
+    """Resolve the most specific configured level for a logger name.
+
+    A key matches a logger if it equals the name or is a dotted suffix of it,
+    e.g. "joinSheets.entry" matches "SheetJoinery.commands.joinSheets.entry".
+    """
+    best_key = None
+    for key in _MODULE_LEVELS:
+        if (name == key or name.endswith("." + key)) and (
+            best_key is None or len(key) > len(best_key)
+        ):
+            best_key = key
+    return _to_level(_MODULE_LEVELS[best_key] if best_key else _DEFAULT_LEVEL)
+
+
+def _format_record(record: tuple) -> str:
+    timestamp, level, name, message, args, fields = record
+    if args:
+        try:
+            message = message % args
+        except Exception:
+            message = f"{message} {args!r}"
+    if fields:
+        message += " " + " ".join(f"{key}={value!r}" for key, value in fields.items())
+    clock = time.strftime("%H:%M:%S", time.localtime(timestamp))
+    return f"{clock} {_LEVEL_NAMES.get(level, level)} {name}: {message}"
+
+
+def flush_logs(force_console: bool = False):
+    """Write all buffered, not yet flushed records to the outputs in one batch.
+
+    Arguments:
+    force_console -- Forces the batch to be written to the Text Command window.
+    """
+    global _unflushed
+    if not _unflushed:
+        return
+    pending = list(_records)[-_unflushed:]
+    dropped = _unflushed - len(pending)
+    _unflushed = 0
+
+    with span("log.flush", records=len(pending)):
+        _write_records(pending, dropped, force_console)
+
+
+def _write_records(pending: list, dropped: int, force_console: bool):
+    lines = [_format_record(record) for record in pending]
+    if dropped > 0:
+        lines.insert(0, f"... {dropped} log records dropped (buffer full)")
+    text = "\n".join(lines)
+
+    # Always print to console, only seen through IDE.
+    print(text)
+
+    # Log all errors to Fusion log file.
+    errors = [
+        line
+        for line, record in zip(lines[-len(pending) :], pending, strict=True)
+        if record[1] >= ERROR_LEVEL
+    ]
+    if errors:
+        log_type = adsk.core.LogTypes.FileLogType
+        app.log("\n".join(errors), adsk.core.LogLevels.ErrorLogLevel, log_type)  # type: ignore
+
+    # If config.DEBUG is True write all log messages to the console.
+    if DEBUG or force_console:
+        level = _to_fusion_level(max(record[1] for record in pending))
+        log_type = adsk.core.LogTypes.ConsoleLogType
+        app.log(text, level, log_type)  # type: ignore
+
+    if _LOG_FILE:
+        try:
+            with open(_LOG_FILE, "a", encoding="utf-8") as log_file:
+                log_file.write(text + "\n")
+        except OSError:
+            pass
+
+
+def recent_records(count: int | None = None) -> list:
+    """Return the most recent buffered records formatted as strings."""
+    records = list(_records)
+    if count is not None:
+        records = records[-count:]
+    return [_format_record(record) for record in records]
+
+
+class Logger:
+    """Leveled logger with lazy %-style formatting and a shared ring buffer.
+
+    Methods for disabled levels are replaced with a no-op, so a disabled
+    logger.debug("...%s", value) call costs one attribute lookup and call.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.level = _module_level(name)
+        self._bind_methods()
+
+    def _bind_methods(self):
+        for method, level in (
+            ("debug", DEBUG_LEVEL),
+            ("info", INFO_LEVEL),
+            ("warning", WARNING_LEVEL),
+            ("error", ERROR_LEVEL),
+        ):
+            if level < self.level:
+                setattr(self, method, _noop)
+            else:
+                self.__dict__.pop(method, None)
+
+    def set_level(self, level: int | str):
+        self.level = _to_level(level)
+        self._bind_methods()
+
+    def is_enabled_for(self, level: int | str) -> bool:
+        return _to_level(level) >= self.level
+
+    def log(
+        self, level: int, message: str, *args, force_console: bool = False, **fields
+    ):
+        """Buffer a record; errors and forced console messages flush immediately."""
+        global _unflushed
+        if level < self.level and not force_console:
+            return
+        _records.append((time.time(), level, self.name, message, args, fields))
+        _unflushed += 1
+        if level >= ERROR_LEVEL or force_console or _unflushed >= _FLUSH_BATCH:
+            flush_logs(force_console)
+
+    def debug(self, message: str, *args, **fields):
+        self.log(DEBUG_LEVEL, message, *args, **fields)
+
+    def info(self, message: str, *args, **fields):
+        self.log(INFO_LEVEL, message, *args, **fields)
+
+    def warning(self, message: str, *args, **fields):
+        self.log(WARNING_LEVEL, message, *args, **fields)
+
+    def error(self, message: str, *args, **fields):
+        self.log(ERROR_LEVEL, message, *args, **fields)
+
+
+def get_logger(name: str) -> Logger:
+    """Get (or create) the logger for a module, usually called with __name__."""
+    logger = _loggers.get(name)
+    if logger is None:
+        logger = _loggers[name] = Logger(name)
+    return logger
+
+
+def set_log_level(level: int | str, module: str | None = None):
+    """Change the log level at runtime for one module key or, if None, the default.
+
+    Arguments:
+    level -- A level name ("DEBUG", "INFO", "WARNING", "ERROR", "OFF") or value.
+    module -- A logger name or dotted suffix as used in config.LOG_LEVELS.
+    """
+    global _DEFAULT_LEVEL
+    if module is None:
+        _DEFAULT_LEVEL = level
+    else:
+        _MODULE_LEVELS[module] = level
+    for logger in _loggers.values():
+        logger.set_level(_module_level(logger.name))
@@ -0,0 +1,227 @@
+import functools
+import json
+import os
+import random
+import threading
+import time
+from collections.abc import Callable
+
+# Attempt to read tracing settings from parent config.
+try:
+    from ... import config
+
+    _enabled = getattr(config, "TRACING", False)
+    _MAX_EVENTS = getattr(config, "TRACE_MAX_EVENTS", 100_000)
+    _MAX_SAMPLES = getattr(config, "TRACE_MAX_SAMPLES", 10_000)
+except Exception:
+    _enabled = False
+    _MAX_EVENTS = 100_000
+    _MAX_SAMPLES = 10_000
+
+# Completed spans as (name, start_ns, duration_ns, thread_id, args)
+_events = []
+# Per span name: [count, total_ns, max_ns, samples], where samples is a
+# reservoir of at most _MAX_SAMPLES durations for the percentiles
+_durations = {}
+_dropped_events = 0
+_origin_ns = time.perf_counter_ns()
+
+
+class _NullSpan:
+    """Shared do-nothing span returned while tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("args", "name", "start")
+
+    def __init__(self, name: str, args: dict):
+        self.name = name
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *_):
+        _record(self.name, self.start, time.perf_counter_ns() - self.start, self.args)
+        return False
+
+
+def _record(name: str, start_ns: int, duration_ns: int, args: dict):
+    global _dropped_events
+    aggregate = _durations.get(name)
+    if aggregate is None:
+        aggregate = _durations[name] = [0, 0, 0, []]
+    aggregate[0] += 1
+    aggregate[1] += duration_ns
+    aggregate[2] = max(aggregate[2], duration_ns)
+    samples = aggregate[3]
+    if len(samples) < _MAX_SAMPLES:
+        samples.append(duration_ns)
+    else:
+        slot = random.randrange(aggregate[0])
+        if slot < _MAX_SAMPLES:
+            samples[slot] = duration_ns
+    if len(_events) < _MAX_EVENTS:
+        _events.append((name, start_ns, duration_ns, threading.get_ident(), args))
+    else:
+        _dropped_events += 1
+
+
+def enable_tracing():
+    """Start recording spans."""
+    global _enabled
+    _enabled = True
+
+
+def disable_tracing():
+    """Stop recording spans. Already recorded spans are kept until reset_tracing."""
+    global _enabled
+    _enabled = False
+
+
+def is_tracing_enabled() -> bool:
+    return _enabled
+
+
+def reset_tracing():
+    """Discard all recorded spans and statistics."""
+    global _dropped_events, _origin_ns
+    _events.clear()
+    _durations.clear()
+    _dropped_events = 0
+    _origin_ns = time.perf_counter_ns()
+
+
+def span(name: str, **args):
+    """Context manager timing the enclosed block as a named span.
+
+    While tracing is disabled this returns a shared no-op context manager.
+
+    Arguments:
+    name -- The span name used for aggregation and in the exported trace.
+    args -- Optional values attached to the span in the exported trace.
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def traced(name: str | None = None):
+    """Decorator recording a span around every call of the decorated function.
+
+    While tracing is disabled the wrapper only checks one flag before calling
+    the function.
+
+    Arguments:
+    name -- The span name. Defaults to the function's qualified name.
+    """
+
+    def decorator(func: Callable):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(span_name, start, time.perf_counter_ns() - start, {})
+
+        return wrapper
+
+    return decorator
+
+
+def _percentile(sorted_values: list, fraction: float) -> int:
+    # Nearest-rank percentile
+    index = max(
+        0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1)
+    )
+    return sorted_values[index]
+
+
+def span_stats() -> dict:
+    """Aggregate recorded spans per name.
+
+    Returns a dict mapping span name to count, total, mean, p50, p95, p99 and
+    max durations in milliseconds. Count, total, mean and max are exact; the
+    percentiles come from a uniform sample once a span exceeds
+    TRACE_MAX_SAMPLES calls.
+    """
+    stats = {}
+    for name, (count, total, longest, samples) in _durations.items():
+        ordered = sorted(samples)
+        stats[name] = {
+            "count": count,
+            "total_ms": total / 1e6,
+            "mean_ms": total / count / 1e6,
+            "p50_ms": _percentile(ordered, 0.50) / 1e6,
+            "p95_ms": _percentile(ordered, 0.95) / 1e6,
+            "p99_ms": _percentile(ordered, 0.99) / 1e6,
+            "max_ms": longest / 1e6,
+        }
+    return stats
+
+
+def format_span_stats() -> str:
+    """Render span statistics as a text table sorted by total time."""
+    lines = [
+        f"{'span':<48} {'count':>7} {'total ms':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+    ]
+    for name, stats in sorted(
+        span_stats().items(), key=lambda item: -item[1]["total_ms"]
+    ):
+        lines.append(
+            f"{name:<48} {stats['count']:>7} {stats['total_ms']:>10.2f} "
+            f"{stats['p50_ms']:>9.3f} {stats['p95_ms']:>9.3f} {stats['p99_ms']:>9.3f}"
+        )
+    return "\n".join(lines)
+
+
+def export_chrome_trace(path: str) -> int:
+    """Write recorded spans as a Chrome trace / Perfetto JSON file.
+
+    Arguments:
+    path -- Destination file. Open it in chrome://tracing or ui.perfetto.dev.
+
+    :returns:
+        The number of span events written.
+    """
+    pid = os.getpid()
+    trace_events = [
+        {
+            "name": name,
+            "ph": "X",
+            "ts": (start - _origin_ns) / 1000.0,
+            "dur": duration / 1000.0,
+            "pid": pid,
+            "tid": thread_id,
+            "args": {key: str(value) for key, value in args.items()},
+        }
+        for name, start, duration, thread_id, args in _events
+    ]
+    with open(path, "w", encoding="utf-8") as trace_file:
+        json.dump(
+            {
+                "traceEvents": trace_events,
+                "displayTimeUnit": "ms",
+                "otherData": {"droppedEvents": _dropped_events},
+            },
+            trace_file,
+        )
+    return len(trace_events)
@@ -0,0 +1,3 @@
+"""
+Fusion-free joinery engine modules for Sheet Joinery add-in
+"""
@@ -0,0 +1,86 @@
+"""
+Batching of joint cuts into one boolean per target body
+
+A finger layout produces one cut box per finger or slot. Instead of
+subtracting each box from its target body separately, the boxes destined
+for the same target are first united with each other in tree-reduction
+order (small operands, balanced depth), and the target body then takes a
+single difference with the combined tool.
+"""
+
+from collections.abc import Callable
+
+from .finger_layout import FINGER
+
+
+def joint_axis(bounds: tuple) -> int:
+    """Index (0=x, 1=y, 2=z) of the longest extent of an axis-aligned box"""
+    extents = (bounds[3] - bounds[0], bounds[4] - bounds[1], bounds[5] - bounds[2])
+    return max(range(3), key=lambda axis: extents[axis])
+
+
+def plan_cut_boxes(layout: object, joint_keys: list, joint_bounds: list) -> dict:
+    """
+    Group the cut intervals of a finger layout into boxes per target body.
+
+    Arguments:
+    layout -- FingerLayout whose joint i belongs to joint_keys[i].
+    joint_keys -- (key_a, key_b) per joint; fingers stay on key_a and are cut
+                  from key_b, slots stay on key_b and are cut from key_a.
+    joint_bounds -- Intersection bounds per joint; the layout runs along the
+                    longest axis and the boxes span the other two extents.
+
+    Returns a dict mapping target key to a list of box bounds tuples.
+    """
+    plan = {}
+    for joint, ((key_a, key_b), bounds) in enumerate(
+        zip(joint_keys, joint_bounds, strict=True)
+    ):
+        axis = joint_axis(bounds)
+        origin = bounds[axis]
+        for row in layout.segments(joint):
+            box = list(bounds)
+            box[axis] = origin + layout.cut_starts[row]
+            box[axis + 3] = origin + layout.cut_ends[row]
+            target = key_b if layout.kinds[row] == FINGER else key_a
+            plan.setdefault(target, []).append(tuple(box))
+    return plan
+
+
+def tree_reduce(items: list, combine: Callable) -> tuple:
+    """
+    Combine items pairwise, round by round, until one remains.
+    Returns (result, combine_calls); result is None for an empty list.
+    """
+    level = list(items)
+    calls = 0
+    while len(level) > 1:
+        next_level = []
+        for index in range(0, len(level) - 1, 2):
+            next_level.append(combine(level[index], level[index + 1]))
+            calls += 1
+        if len(level) % 2:
+            next_level.append(level[-1])
+        level = next_level
+    return (level[0] if level else None), calls
+
+
+def batch_savings(tool_counts: list) -> dict:
+    """
+    Boolean call accounting for cutting targets with the given tool counts.
+
+    Unbatched, every tool is one boolean against its (large) target body.
+    Batched, each target takes one boolean and the tools are united among
+    themselves, which is cheap because the tool boxes are small and simple.
+    """
+    tools = sum(tool_counts)
+    targets = sum(1 for count in tool_counts if count)
+    unions = sum(count - 1 for count in tool_counts if count)
+    return {
+        "targets": targets,
+        "tools": tools,
+        "unbatched_target_booleans": tools,
+        "target_booleans": targets,
+        "tool_unions": unions,
+        "target_booleans_saved": tools - targets,
+    }
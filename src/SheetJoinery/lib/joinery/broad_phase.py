@@ -0,0 +1,78 @@
+"""
+Broad-phase candidate pair search over axis-aligned bounding boxes
+
+Bounds are plain tuples of (min_x, min_y, min_z, max_x, max_y, max_z) so this
+module stays free of Fusion API imports.
+"""
+
+
+def inflate_bounds(bounds: tuple, margin: float) -> tuple:
+    """Grow a bounds tuple by margin on every side"""
+    min_x, min_y, min_z, max_x, max_y, max_z = bounds
+    return (
+        min_x - margin,
+        min_y - margin,
+        min_z - margin,
+        max_x + margin,
+        max_y + margin,
+        max_z + margin,
+    )
+
+
+def bounds_overlap(a: tuple, b: tuple) -> bool:
+    """Check whether two bounds tuples overlap (touching counts as overlap)"""
+    return (
+        a[0] <= b[3]
+        and b[0] <= a[3]
+        and a[1] <= b[4]
+        and b[1] <= a[4]
+        and a[2] <= b[5]
+        and b[2] <= a[5]
+    )
+
+
+def _sweep_axis(bounds_list: list) -> int:
+    """Pick the axis with the largest spread of box centers"""
+    best_axis = 0
+    best_spread = -1.0
+    for axis in range(3):
+        centers = [(b[axis] + b[axis + 3]) * 0.5 for b in bounds_list]
+        spread = max(centers) - min(centers)
+        if spread > best_spread:
+            best_axis = axis
+            best_spread = spread
+    return best_axis
+
+
+def find_candidate_pairs(
+    bounds_list: list, margin: float = 0.0
+) -> tuple[list[tuple[int, int]], int]:
+    """
+    Sweep-and-prune over bounding boxes inflated by margin.
+    Returns (pairs, rejected_count) where pairs is a sorted list of index pairs
+    (i < j) whose inflated boxes overlap and rejected_count is the number of
+    pairs that never need a narrow-phase test.
+    """
+    count = len(bounds_list)
+    total_pairs = count * (count - 1) // 2
+    if count < 2:
+        return [], total_pairs
+
+    inflated = [inflate_bounds(b, margin) for b in bounds_list]
+    axis = _sweep_axis(inflated)
+    order = sorted(range(count), key=lambda index: inflated[index][axis])
+
+    pairs = []
+    active = []
+    for index in order:
+        box = inflated[index]
+        box_min = box[axis]
+        # Drop boxes whose extent along the sweep axis ends before this one starts
+        active = [other for other in active if inflated[other][axis + 3] >= box_min]
+        for other in active:
+            if bounds_overlap(box, inflated[other]):
+                pairs.append((other, index) if other < index else (index, other))
+        active.append(index)
+
+    pairs.sort()
+    return pairs, total_pairs - len(pairs)
@@ -0,0 +1,89 @@
+"""
+Cooperative chunked execution with cancellation and a time budget
+
+Long loops over body pairs are split into chunks. Between chunks the run
+reports progress, asks whether the user cancelled and checks the time
+budget; once either stops the run, the unprocessed items are kept as pending
+so the caller can commit partial results and resume them later. One run
+can span several stages, sharing its budget and pending list.
+"""
+
+import time
+from collections.abc import Callable
+
+CANCELLED = "cancelled"
+OUT_OF_TIME = "time budget exceeded"
+
+
+class ChunkedRun:
+    """
+    Iterate items chunk by chunk until done, cancelled or out of time.
+
+    Arguments:
+    chunk_size -- Items per chunk.
+    time_budget -- Seconds after which no new chunk is started; 0 disables it.
+    on_progress -- Called with (done, total) before every chunk but the first
+                   and once more at the end.
+    is_cancelled -- Called between chunks; True stops the run.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int,
+        time_budget: float = 0.0,
+        on_progress: Callable | None = None,
+        is_cancelled: Callable | None = None,
+        clock: Callable = time.perf_counter,
+    ):
+        self.chunk_size = max(1, chunk_size)
+        self.time_budget = time_budget
+        self.on_progress = on_progress
+        self.is_cancelled = is_cancelled
+        self.clock = clock
+        self.started = None
+        self.done = 0
+        self.total = 0
+        self.pending = []
+        self.stop_reason = None
+
+    @property
+    def is_complete(self) -> bool:
+        return self.stop_reason is None
+
+    def _check_stop(self, started: float) -> str | None:
+        if self.is_cancelled and self.is_cancelled():
+            return CANCELLED
+        if self.time_budget > 0.0 and self.clock() - started >= self.time_budget:
+            return OUT_OF_TIME
+        return None
+
+    def chunks(self, items: list, resume: bool = False):
+        """
+        Yield consecutive chunks of items; whatever is not yielded ends up in
+        pending. With resume the items continue the current run as a further
+        stage: clock, counts and pending carry over, and once the run has
+        stopped every later item goes straight to pending.
+        """
+        if not resume or self.started is None:
+            self.started = self.clock()
+            self.done = 0
+            self.total = 0
+            self.pending = []
+            self.stop_reason = None
+        self.total += len(items)
+        if self.stop_reason:
+            self.pending.extend(items)
+            return
+        for start in range(0, len(items), self.chunk_size):
+            if self.done:
+                if self.on_progress:
+                    self.on_progress(self.done, self.total)
+                self.stop_reason = self._check_stop(self.started)
+                if self.stop_reason:
+                    self.pending.extend(items[start:])
+                    return
+            chunk = items[start : start + self.chunk_size]
+            yield chunk
+            self.done += len(chunk)
+        if self.on_progress and len(items) > self.chunk_size:
+            self.on_progress(self.done, self.total)
@@ -0,0 +1,128 @@
+"""
+Batch classification of sheet intersections
+
+Intersections are classified column-wise from their bounds, volumes, areas and
+sheet thicknesses in a single pass with no logging or string formatting, so
+hundreds of intersections per compute cost little more than one. Per-item
+descriptions are only built for the results a caller actually keeps.
+"""
+
+# Intersections smaller than this fraction of a cubic thickness are noise
+MIN_VOLUME_RATIO = 0.1
+# Shortest dimension above this fraction of thickness means the bodies cross
+CROSS_JOINT_RATIO = 0.5
+# Middle dimension above this fraction of the longest means a T-joint
+T_JOINT_RATIO = 0.1
+# Tabs need an intersection at least this many thicknesses long
+MIN_TAB_LENGTH_RATIO = 3.0
+
+
+def classify_intersections(
+    bounds_list: list, volumes: list, areas: list, thicknesses: list
+) -> dict:
+    """
+    Classify a batch of intersections.
+
+    Arguments:
+    bounds_list -- (min_x, min_y, min_z, max_x, max_y, max_z) per intersection.
+    volumes -- Intersection volume per intersection.
+    areas -- Intersection surface area per intersection.
+    thicknesses -- Sheet thickness used to judge each intersection.
+
+    Returns a dict of parallel lists: 'type' ("cross-joint", "t-joint",
+    "edge-joint" or None when too small to be a joint), 'suitable_for_tabs',
+    'width', 'height', 'depth', 'longest', 'middle', 'shortest', 'volume',
+    'area', 'bounds' and 'thickness'.
+    """
+    types = []
+    suitable = []
+    widths = []
+    heights = []
+    depths = []
+    longest_dims = []
+    middle_dims = []
+    shortest_dims = []
+
+    for bounds, volume, thickness in zip(
+        bounds_list, volumes, thicknesses, strict=True
+    ):
+        width = bounds[3] - bounds[0]
+        height = bounds[4] - bounds[1]
+        depth = bounds[5] - bounds[2]
+        longest, middle, shortest = sorted((width, height, depth), reverse=True)
+
+        if volume < thickness * thickness * thickness * MIN_VOLUME_RATIO:
+            joint_type = None
+        elif shortest > thickness * CROSS_JOINT_RATIO:
+            joint_type = "cross-joint"  # Bodies cross through each other
+        elif middle > longest * T_JOINT_RATIO:
+            joint_type = "t-joint"  # One body intersects perpendicularly
+        else:
+            joint_type = "edge-joint"  # Edge-to-edge contact
+
+        types.append(joint_type)
+        suitable.append(
+            joint_type is not None and longest > thickness * MIN_TAB_LENGTH_RATIO
+        )
+        widths.append(width)
+        heights.append(height)
+        depths.append(depth)
+        longest_dims.append(longest)
+        middle_dims.append(middle)
+        shortest_dims.append(shortest)
+
+    return {
+        "type": types,
+        "suitable_for_tabs": suitable,
+        "width": widths,
+        "height": heights,
+        "depth": depths,
+        "longest": longest_dims,
+        "middle": middle_dims,
+        "shortest": shortest_dims,
+        "volume": list(volumes),
+        "area": list(areas),
+        "bounds": list(bounds_list),
+        "thickness": list(thicknesses),
+    }
+
+
+def describe_joint(
+    joint_type: str, longest: float, middle: float, shortest: float
+) -> str:
+    """Human readable joint description with dimensions in mm"""
+    if joint_type == "cross-joint":
+        return f"Cross joint: {longest * 10:.1f} x {middle * 10:.1f} x {shortest * 10:.1f} mm"
+    if joint_type == "t-joint":
+        return f"T-joint: {longest * 10:.1f} x {middle * 10:.1f} mm intersection"
+    return f"Edge joint: {longest * 10:.1f} mm length"
+
+
+def intersection_info(batch: dict, index: int) -> dict | None:
+    """
+    Build the per-intersection analysis dict for one row of a batch result,
+    or None when that intersection is too small to be a joint.
+    """
+    joint_type = batch["type"][index]
+    if joint_type is None:
+        return None
+
+    return {
+        "type": joint_type,
+        "description": describe_joint(
+            joint_type,
+            batch["longest"][index],
+            batch["middle"][index],
+            batch["shortest"][index],
+        ),
+        "dimensions": {
+            "width": batch["width"][index],
+            "height": batch["height"][index],
+            "depth": batch["depth"][index],
+            "volume": batch["volume"][index],
+            "area": batch["area"][index],
+        },
+        "suitable_for_tabs": batch["suitable_for_tabs"][index],
+        "bounds": batch["bounds"][index],
+        "thickness": batch["thickness"][index],
+    }
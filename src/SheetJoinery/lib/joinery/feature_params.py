@@ -0,0 +1,94 @@
+"""
+Packed storage format for Join Sheets feature parameters
+
+All parameters of a feature live in a single attribute holding compact JSON
+with a schema version, so reading them costs one attribute lookup however
+many bodies the feature joins. Features written by older versions stored
+one attribute per value; legacy_parameters converts those.
+"""
+
+import json
+
+SCHEMA_VERSION = 1
+
+# Name of the packed attribute in the add-in's attribute group
+PARAMS_ATTRIBUTE = "params"
+
+# Per-key attribute names used before the packed format
+LEGACY_ATTRIBUTES = ("body_count", "tab_width", "tolerance")
+LEGACY_BODY_TOKEN_PREFIX = "body_"
+LEGACY_BODY_TOKEN_SUFFIX = "_token"
+
+DEFAULT_TAB_WIDTH = 10.0
+DEFAULT_TOLERANCE = 0.1
+
+
+def make_parameters(tab_width: float, tolerance: float, body_tokens: list) -> dict:
+    return {
+        "tab_width": float(tab_width),
+        "tolerance": float(tolerance),
+        "body_tokens": list(body_tokens),
+    }
+
+
+def pack_parameters(parameters: dict) -> str:
+    """Serialize parameters as compact versioned JSON"""
+    return json.dumps(
+        {
+            "version": SCHEMA_VERSION,
+            "tab_width": parameters["tab_width"],
+            "tolerance": parameters["tolerance"],
+            "body_tokens": parameters["body_tokens"],
+        },
+        separators=(",", ":"),
+    )
+
+
+def unpack_parameters(text: str) -> dict:
+    """
+    Parse a packed parameters string.
+    Raises ValueError for malformed data or an unsupported schema version.
+    """
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Malformed feature parameters: {e}") from e
+    if not isinstance(data, dict):
+        raise ValueError("Malformed feature parameters: expected an object")
+
+    version = data.get("version")
+    if version != SCHEMA_VERSION:
+        raise ValueError(f"Unsupported feature parameter schema version: {version}")
+
+    return make_parameters(
+        data.get("tab_width", DEFAULT_TAB_WIDTH),
+        data.get("tolerance", DEFAULT_TOLERANCE),
+        data.get("body_tokens", []),
+    )
+
+
+def is_legacy_attribute(name: str) -> bool:
+    return name in LEGACY_ATTRIBUTES or (
+        name.startswith(LEGACY_BODY_TOKEN_PREFIX)
+        and name.endswith(LEGACY_BODY_TOKEN_SUFFIX)
+    )
+
+
+def legacy_parameters(values: dict) -> dict | None:
+    """
+    Build parameters from the old per-key attribute values (name -> string).
+    Returns None when none of the legacy attributes are present.
+    """
+    if not any(is_legacy_attribute(name) for name in values):
+        return None
+
+    body_count = int(values.get("body_count", 0))
+    body_tokens = [
+        values.get(f"{LEGACY_BODY_TOKEN_PREFIX}{i}{LEGACY_BODY_TOKEN_SUFFIX}", "")
+        for i in range(body_count)
+    ]
+    return make_parameters(
+        values.get("tab_width", DEFAULT_TAB_WIDTH),
+        values.get("tolerance", DEFAULT_TOLERANCE),
+        body_tokens,
+    )
@@ -0,0 +1,45 @@
+"""
+Geometry fingerprints for recognising unchanged bodies between computes
+"""
+
+from ... import config
+
+
+def quantize(value: float, quantum: float) -> int:
+    """Snap a length/area/volume value onto an integer grid of size quantum"""
+    return round(value / quantum)
+
+
+def body_fingerprint(
+    body, thickness: float | None = None, quantum: float | None = None
+) -> tuple:
+    """
+    Build a hashable fingerprint for a BRep body from its quantized bounding
+    box, volume, area, face/edge counts and (optionally) sheet thickness.
+    Two bodies with equal fingerprints are treated as geometrically identical.
+    """
+    quantum = quantum or config.FINGERPRINT_QUANTUM
+    bbox = body.boundingBox
+    min_point = bbox.minPoint
+    max_point = bbox.maxPoint
+    return (
+        quantize(min_point.x, quantum),
+        quantize(min_point.y, quantum),
+        quantize(min_point.z, quantum),
+        quantize(max_point.x, quantum),
+        quantize(max_point.y, quantum),
+        quantize(max_point.z, quantum),
+        quantize(body.volume, quantum),
+        quantize(body.area, quantum),
+        body.faces.count,
+        body.edges.count,
+        quantize(thickness, quantum) if thickness else None,
+    )
+
+
+def with_thickness(
+    fingerprint: tuple, thickness: float | None, quantum: float | None = None
+) -> tuple:
+    """Return a geometry fingerprint with its sheet thickness slot filled in"""
+    quantum = quantum or config.FINGERPRINT_QUANTUM
+    return (*fingerprint[:-1], quantize(thickness, quantum) if thickness else None)
@@ -0,0 +1,76 @@
+"""
+Dirty tracking helpers for incremental Join Sheets recomputes
+
+A compute snapshot remembers, per custom feature, the fingerprint of each
+dependency and the intersection result of each dependency pair from the last
+successful compute. The next compute only re-evaluates pairs touching a
+dependency whose fingerprint changed, or a pair a stopped compute left
+pending.
+"""
+
+
+def make_snapshot(
+    settings: tuple, fingerprints: dict, results: dict, pending: tuple = ()
+) -> dict:
+    """Bundle the state needed to plan the next incremental compute"""
+    return {
+        "settings": settings,
+        "fingerprints": fingerprints,
+        "results": results,
+        "pending": tuple(pending),
+    }
+
+
+def find_dirty_keys(previous_fingerprints: dict, fingerprints: dict) -> set:
+    """Return keys that are new or whose fingerprint differs from the previous compute"""
+    return {
+        key
+        for key, fingerprint in fingerprints.items()
+        if previous_fingerprints.get(key) != fingerprint
+    }
+
+
+def plan_recompute(snapshot: dict | None, settings: tuple, fingerprints: dict):
+    """
+    Decide between a full and an incremental recompute.
+    Returns (dirty_keys, pending_pairs, reason) where dirty_keys is None for
+    a full recompute. pending_pairs holds the pairs a stopped compute left
+    unevaluated between two unchanged dependencies; only those pairs are
+    evaluated again, the other pairs of their bodies stay reusable.
+    """
+    if snapshot is None:
+        return None, set(), "no previous compute"
+    if snapshot["settings"] != settings:
+        return None, set(), "feature parameters changed"
+
+    dirty_keys = find_dirty_keys(snapshot["fingerprints"], fingerprints)
+    if len(dirty_keys) == len(fingerprints):
+        return None, set(), "all dependencies changed"
+    # Pairs touching a changed dependency are evaluated again anyway
+    pending_pairs = {
+        tuple(pair)
+        for pair in snapshot.get("pending", ())
+        if pair[0] in fingerprints
+        and pair[1] in fingerprints
+        and pair[0] not in dirty_keys
+        and pair[1] not in dirty_keys
+    }
+    reason = f"{len(dirty_keys)} of {len(fingerprints)} dependencies changed"
+    if pending_pairs:
+        reason += f", {len(pending_pairs)} pairs pending"
+    return dirty_keys, pending_pairs, reason
+
+
+def reuse_clean_results(snapshot: dict, dirty_keys: set, current_keys: set) -> dict:
+    """
+    Carry over pair results where neither side is dirty and both sides are
+    still dependencies of the feature.
+    """
+    return {
+        pair: result
+        for pair, result in snapshot["results"].items()
+        if pair[0] in current_keys
+        and pair[1] in current_keys
+        and pair[0] not in dirty_keys
+        and pair[1] not in dirty_keys
+    }
@@ -0,0 +1,99 @@
+"""
+LRU cache of pairwise intersection results keyed by body fingerprints
+"""
+
+import sys
+from collections import OrderedDict
+
+# Returned by IntersectionCache.get when a key is not cached, since a cached
+# result may legitimately be None (the pair does not form a usable joint).
+MISS = object()
+
+
+def estimate_size(value) -> int:
+    """Rough recursive size estimate in bytes for plain Python containers"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += estimate_size(key) + estimate_size(item)
+    elif isinstance(value, (list, tuple, set)):
+        for item in value:
+            size += estimate_size(item)
+    return size
+
+
+class IntersectionCache:
+    """
+    Least-recently-used cache of intersection results.
+
+    Each entry holds the analysis dict from analyze_intersection_geometry
+    (or None for pairs without a usable intersection) and, optionally, the
+    temporary intersection BRep. Entries are evicted oldest-first once either
+    the entry count or the estimated memory use exceeds its cap.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: tuple):
+        """
+        Return the cached (analysis, brep) tuple for key, or MISS.
+        Callers must treat the cached analysis dict as read-only.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return MISS
+        self._entries.move_to_end(key)
+        self.hits += 1
+        analysis, brep, _ = entry
+        return analysis, brep
+
+    def put(self, key: tuple, analysis, brep=None, brep_bytes: int = 0):
+        """Store a result, evicting least-recently-used entries over the caps"""
+        if key in self._entries:
+            self._bytes -= self._entries.pop(key)[2]
+
+        cost = estimate_size(key) + estimate_size(analysis)
+        if brep is not None:
+            cost += brep_bytes
+        self._entries[key] = (analysis, brep, cost)
+        self._bytes += cost
+
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, (_, _, evicted_cost) = self._entries.popitem(last=False)
+            self._bytes -= evicted_cost
+            self.evictions += 1
+
+    def clear(self):
+        """Drop all cached entries and reset statistics"""
+        self._entries.clear()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> dict:
+        """Return hit/miss/eviction counters and current footprint"""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
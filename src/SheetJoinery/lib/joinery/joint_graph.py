@@ -0,0 +1,260 @@
+"""
+Assembly joint graph: sheet bodies as nodes, classified joints as edges
+
+Nodes are the feature's dependency ids, each carrying the body entity token
+and geometry fingerprint from the last compute. Edges are the intersections
+that form joints, each carrying the intersection analysis (joint type,
+dimensions, bounds, thickness) and the finger layout along the joint. Edges
+are directed like the compute results: fingers stay on the first body and
+are cut from the second. Pairs a stopped compute left unevaluated are kept
+as the graph's pending list, so a restored feature resumes them.
+
+Adjacency is a dict of dicts, so neighbor and edge lookups are O(1) and
+edges are inserted or removed one at a time as dependencies change. The
+whole graph serializes to compact versioned JSON for a single attribute.
+"""
+
+import json
+
+SCHEMA_VERSION = 1
+
+# Name of the graph attribute in the add-in's attribute group
+GRAPH_ATTRIBUTE = "joint_graph"
+
+
+class JointGraph:
+    """Directed joint edges between dependency ids with O(1) adjacency"""
+
+    def __init__(self, settings: tuple = ()):
+        self.settings = tuple(settings)
+        self.nodes = {}
+        # (node_a, node_b) pairs a stopped compute left unevaluated
+        self.pending = ()
+        self._edges = {}
+        self._adjacency = {}
+
+    @property
+    def node_count(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._edges)
+
+    def add_node(self, node: str, token: str = "", fingerprint: tuple = ()):
+        """Add a node or update its token and fingerprint"""
+        self.nodes[node] = {"token": token, "fingerprint": tuple(fingerprint)}
+        self._adjacency.setdefault(node, {})
+
+    def remove_node(self, node: str) -> int:
+        """Remove a node and its edges; returns the number of edges removed"""
+        neighbors = self._adjacency.pop(node, {})
+        for neighbor, key in neighbors.items():
+            self._edges.pop(key, None)
+            self._adjacency[neighbor].pop(node, None)
+        self.nodes.pop(node, None)
+        return len(neighbors)
+
+    def add_edge(
+        self, node_a: str, node_b: str, joint: dict, layout: dict | None = None
+    ):
+        """
+        Insert or replace the joint edge from node_a to node_b. Missing nodes
+        are added; an existing edge between the two in either direction is
+        replaced.
+        """
+        for node in (node_a, node_b):
+            if node not in self.nodes:
+                self.add_node(node)
+        self.remove_edge(node_a, node_b)
+        key = (node_a, node_b)
+        self._edges[key] = {"joint": joint, "layout": layout}
+        self._adjacency[node_a][node_b] = key
+        self._adjacency[node_b][node_a] = key
+
+    def remove_edge(self, node_a: str, node_b: str) -> bool:
+        """Remove the edge between two nodes in whichever direction it exists"""
+        key = self._adjacency.get(node_a, {}).pop(node_b, None)
+        if key is None:
+            return False
+        self._adjacency[node_b].pop(node_a, None)
+        del self._edges[key]
+        return True
+
+    def edge_key(self, node_a: str, node_b: str) -> tuple | None:
+        """Directed (first, second) key of the edge between two nodes, or None"""
+        return self._adjacency.get(node_a, {}).get(node_b)
+
+    def edge(self, node_a: str, node_b: str) -> dict | None:
+        """Edge record ({'joint': ..., 'layout': ...}) between two nodes, or None"""
+        key = self.edge_key(node_a, node_b)
+        return self._edges[key] if key else None
+
+    def neighbors(self, node: str):
+        """Nodes sharing a joint with node, as a live view"""
+        return self._adjacency.get(node, {}).keys()
+
+    def degree(self, node: str) -> int:
+        return len(self._adjacency.get(node, {}))
+
+    def edges(self):
+        """Iterate (node_a, node_b, record) once per edge, in its stored direction"""
+        for (node_a, node_b), record in self._edges.items():
+            yield node_a, node_b, record
+
+    def set_layout(self, node_a: str, node_b: str, layout: dict) -> bool:
+        record = self.edge(node_a, node_b)
+        if record is None:
+            return False
+        record["layout"] = layout
+        return True
+
+    def sync_nodes(self, fingerprints: dict, tokens: dict) -> int:
+        """
+        Make the nodes match the current dependencies: remove vanished ones
+        with their edges, add new ones and refresh tokens and fingerprints.
+        Returns the number of edges removed with vanished nodes.
+        """
+        removed = 0
+        for node in [node for node in self.nodes if node not in fingerprints]:
+            removed += self.remove_node(node)
+        for node, fingerprint in fingerprints.items():
+            self.add_node(node, tokens.get(node, ""), fingerprint)
+        return removed
+
+    def sync_edges(self, results: dict) -> tuple[int, int]:
+        """
+        Make the edges match compute results ((node_a, node_b) -> joint info).
+        Edges whose joint dict is unchanged (the same object, as reused by an
+        incremental compute) are left alone, so only changed pairs are
+        touched. Returns (inserted, removed).
+        """
+        removed = 0
+        for key in [key for key in self._edges if key not in results]:
+            self.remove_edge(*key)
+            removed += 1
+        inserted = 0
+        for key, joint in results.items():
+            record = self._edges.get(key)
+            if record is None or record["joint"] is not joint:
+                self.add_edge(key[0], key[1], joint)
+                inserted += 1
+        return inserted, removed
+
+    def results(self) -> dict:
+        """Joint info per directed edge key, the shape compute results use"""
+        return {key: record["joint"] for key, record in self._edges.items()}
+
+    def fingerprints(self) -> dict:
+        return {node: data["fingerprint"] for node, data in self.nodes.items()}
+
+
+def _plain(value):
+    """Tuples to lists, recursively, for JSON"""
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    return value
+
+
+def _tuples(value):
+    """
+    Lists back to tuples, recursively and inside dicts, so fingerprints and
+    joint fields compare and hash like freshly computed ones
+    """
+    if isinstance(value, list):
+        return tuple(_tuples(item) for item in value)
+    if isinstance(value, dict):
+        return {key: _tuples(item) for key, item in value.items()}
+    return value
+
+
+def pack_graph(graph: JointGraph) -> str:
+    """Serialize a graph as compact versioned JSON"""
+    return json.dumps(
+        {
+            "version": SCHEMA_VERSION,
+            "settings": list(graph.settings),
+            "nodes": {
+                node: [data["token"], _plain(data["fingerprint"])]
+                for node, data in graph.nodes.items()
+            },
+            "edges": [
+                [node_a, node_b, _plain(record["joint"]), record["layout"]]
+                for node_a, node_b, record in graph.edges()
+            ],
+            "pending": [list(pair) for pair in graph.pending],
+        },
+        separators=(",", ":"),
+    )
+
+
+def unpack_graph(text: str) -> JointGraph:
+    """
+    Parse a packed graph.
+    Raises ValueError for malformed data or an unsupported schema version.
+    """
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Malformed joint graph: {e}") from e
+    if not isinstance(data, dict):
+        raise ValueError("Malformed joint graph: expected an object")
+
+    version = data.get("version")
+    if version != SCHEMA_VERSION:
+        raise ValueError(f"Unsupported joint graph schema version: {version}")
+
+    try:
+        graph = JointGraph(data.get("settings", ()))
+        for node, (token, fingerprint) in data.get("nodes", {}).items():
+            graph.add_node(node, token, _tuples(fingerprint))
+        for node_a, node_b, joint, layout in data.get("edges", []):
+            if "bounds" not in joint:
+                raise ValueError(f"edge {node_a}-{node_b} has no joint bounds")
+            graph.add_edge(node_a, node_b, _tuples(joint), layout)
+        graph.pending = tuple(
+            (node_a, node_b) for node_a, node_b in data.get("pending", [])
+        )
+    except (TypeError, ValueError, KeyError) as e:
+        raise ValueError(f"Malformed joint graph: {e}") from e
+    return graph
+
+
+def layout_record(layout: object, joint: int) -> dict:
+    """
+    Finger layout of one joint of a FingerLayout for an edge. Fingers are
+    evenly pitched, so the joint length, finger count, finger width and pitch
+    describe every segment; segment_intervals expands them again.
+    """
+    rows = layout.segments(joint)
+    fingers = (len(rows) + 1) // 2
+    if not fingers:
+        return {
+            "length": layout.lengths[joint],
+            "fingers": 0,
+            "finger_width": 0.0,
+            "pitch": 0.0,
+        }
+    first = rows.start
+    return {
+        "length": layout.lengths[joint],
+        "fingers": fingers,
+        "finger_width": layout.ends[first] - layout.starts[first],
+        "pitch": layout.starts[first + 2] - layout.starts[first]
+        if fingers > 1
+        else 0.0,
+    }
+
+
+def segment_intervals(record: dict) -> list:
+    """(start, end, kind) per segment of an edge's layout record, kind 1 = finger, 0 = slot"""
+    intervals = []
+    for finger in range(record["fingers"]):
+        start = finger * record["pitch"]
+        end = start + record["finger_width"]
+        if finger:
+            intervals.append((intervals[-1][1], start, 0))
+        intervals.append((start, end, 1))
+    return intervals
@@ -0,0 +1,127 @@
+"""
+Face metadata index for Design-to-CAM lookups
+
+Joinery faces carry attributes in the add-in's group: a joint ID naming the
+joint a face belongs to and a dogbone hint telling the CAM side which
+corner relief it needs. Reading them face by face costs one API call per
+face, so the index is filled from a design-wide findAttributes sweep per
+indexed attribute name and answers "faces of joint X" or "faces hinted Y"
+with a dict lookup.
+
+Entries are grouped by the body owning the face. A recompute only marks
+its bodies dirty, which costs no API calls; the next lookup runs one sweep
+and replaces just the dirty bodies' entries.
+"""
+
+from collections.abc import Iterable
+
+# Attribute names in the add-in's attribute group
+JOINT_ID_ATTRIBUTE = "JointID"
+DOGBONE_HINT_ATTRIBUTE = "DogboneHint"
+
+INDEXED_ATTRIBUTES = (JOINT_ID_ATTRIBUTE, DOGBONE_HINT_ATTRIBUTE)
+
+
+def _is_valid(entity: object) -> bool:
+    try:
+        return bool(getattr(entity, "isValid", True))
+    except Exception:
+        return False
+
+
+class MetadataIndex:
+    """
+    (attribute name, value) -> faces map, built from records of
+    (body_token, face_token, face, name, value)
+    """
+
+    def __init__(self, names: tuple = INDEXED_ATTRIBUTES):
+        self.names = tuple(names)
+        self.is_built = False
+        self._faces = {}
+        self._body_entries = {}
+        self._dirty = set()
+        self.builds = 0
+        self.refreshes = 0
+        self.lookups = 0
+
+    @property
+    def is_dirty(self) -> bool:
+        return bool(self._dirty)
+
+    def build(self, records: Iterable):
+        """Replace the whole index with the given records"""
+        self._faces.clear()
+        self._body_entries.clear()
+        self._dirty.clear()
+        self._add(records)
+        self.is_built = True
+        self.builds += 1
+
+    def mark_dirty(self, body_tokens: Iterable):
+        """Entries of these bodies are stale; ignored until the index is built"""
+        if self.is_built:
+            self._dirty.update(body_tokens)
+
+    def refresh(self, records: Iterable):
+        """
+        Replace the entries of the dirty bodies with their records among
+        records (typically a whole design sweep); other records are skipped.
+        """
+        dirty = self._dirty
+        self._dirty = set()
+        self.replace_bodies(dirty, (record for record in records if record[0] in dirty))
+
+    def replace_bodies(self, body_tokens: Iterable, records: Iterable):
+        """
+        Drop every entry of the given bodies and add records in their place;
+        records must only belong to those bodies.
+        """
+        for body_token in body_tokens:
+            for key, face_token in self._body_entries.pop(body_token, ()):
+                faces = self._faces.get(key)
+                if faces is not None:
+                    faces.pop(face_token, None)
+                    if not faces:
+                        del self._faces[key]
+        self._add(records)
+        self.refreshes += 1
+
+    def _add(self, records: Iterable):
+        for body_token, face_token, face, name, value in records:
+            if name not in self.names:
+                continue
+            key = (name, value)
+            self._faces.setdefault(key, {})[face_token] = face
+            self._body_entries.setdefault(body_token, []).append((key, face_token))
+
+    def faces(self, name: str, value: str) -> list:
+        """Faces whose attribute name has the given value; stale faces are skipped"""
+        self.lookups += 1
+        return [
+            face
+            for face in self._faces.get((name, value), {}).values()
+            if _is_valid(face)
+        ]
+
+    def values(self, name: str) -> list:
+        """Distinct indexed values of an attribute, e.g. every joint ID"""
+        return [value for key_name, value in self._faces if key_name == name]
+
+    def invalidate(self):
+        """Forget everything; the next lookup sweeps the design again"""
+        self._faces.clear()
+        self._body_entries.clear()
+        self._dirty.clear()
+        self.is_built = False
+
+    def stats(self) -> dict:
+        return {
+            "keys": len(self._faces),
+            "faces": sum(len(faces) for faces in self._faces.values()),
+            "bodies": len(self._body_entries),
+            "dirty": len(self._dirty),
+            "builds": self.builds,
+            "refreshes": self.refreshes,
+            "lookups": self.lookups,
+        }
@@ -0,0 +1,99 @@
+"""
+Oriented bounding box estimation from point samples
+
+Principal component analysis of a body's vertices gives its principal axes;
+the extents along those axes form an oriented bounding box that is correct
+for arbitrarily rotated sheets, unlike the world-aligned bounding box.
+"""
+
+import math
+
+_JACOBI_SWEEPS = 16
+_JACOBI_TOLERANCE = 1e-18
+
+
+def covariance_matrix(points: list) -> list:
+    """3x3 covariance matrix (as nested lists) of a list of (x, y, z) points"""
+    count = len(points)
+    mean = [sum(point[axis] for point in points) / count for axis in range(3)]
+    matrix = [[0.0] * 3 for _ in range(3)]
+    for point in points:
+        centered = [point[axis] - mean[axis] for axis in range(3)]
+        for row in range(3):
+            for col in range(row, 3):
+                matrix[row][col] += centered[row] * centered[col]
+    for row in range(3):
+        for col in range(row, 3):
+            matrix[row][col] /= count
+            matrix[col][row] = matrix[row][col]
+    return matrix
+
+
+def symmetric_eigen_3x3(matrix: list) -> tuple[list, list]:
+    """
+    Eigen-decomposition of a symmetric 3x3 matrix by cyclic Jacobi rotation.
+    Returns (eigenvalues, eigenvectors) with eigenvectors as unit (x, y, z)
+    tuples, sorted by descending eigenvalue.
+    """
+    a = [row[:] for row in matrix]
+    vectors = [[1.0 if row == col else 0.0 for col in range(3)] for row in range(3)]
+
+    for _ in range(_JACOBI_SWEEPS):
+        off_diagonal = a[0][1] ** 2 + a[0][2] ** 2 + a[1][2] ** 2
+        if off_diagonal < _JACOBI_TOLERANCE:
+            break
+        for p, q in ((0, 1), (0, 2), (1, 2)):
+            if a[p][q] == 0.0:
+                continue
+            theta = (a[q][q] - a[p][p]) / (2.0 * a[p][q])
+            t = math.copysign(1.0, theta) / (
+                abs(theta) + math.sqrt(theta * theta + 1.0)
+            )
+            c = 1.0 / math.sqrt(t * t + 1.0)
+            s = t * c
+            for k in range(3):
+                a_kp, a_kq = a[k][p], a[k][q]
+                a[k][p] = c * a_kp - s * a_kq
+                a[k][q] = s * a_kp + c * a_kq
+            for k in range(3):
+                a_pk, a_qk = a[p][k], a[q][k]
+                a[p][k] = c * a_pk - s * a_qk
+                a[q][k] = s * a_pk + c * a_qk
+            for k in range(3):
+                v_kp, v_kq = vectors[k][p], vectors[k][q]
+                vectors[k][p] = c * v_kp - s * v_kq
+                vectors[k][q] = s * v_kp + c * v_kq
+
+    pairs = sorted(
+        ((a[i][i], (vectors[0][i], vectors[1][i], vectors[2][i])) for i in range(3)),
+        key=lambda pair: pair[0],
+        reverse=True,
+    )
+    return [pair[0] for pair in pairs], [pair[1] for pair in pairs]
+
+
+def oriented_extents(points: list) -> tuple[list, list]:
+    """
+    Extents of the points along their principal axes.
+    Returns (extents, axes) sorted from the axis of largest to smallest variance.
+    """
+    _, axes = symmetric_eigen_3x3(covariance_matrix(points))
+    extents = []
+    for axis in axes:
+        projections = [
+            point[0] * axis[0] + point[1] * axis[1] + point[2] * axis[2]
+            for point in points
+        ]
+        extents.append(max(projections) - min(projections))
+    return extents, axes
+
+
+def estimate_sheet_thickness(points: list) -> float | None:
+    """
+    Estimate sheet thickness as the smallest oriented-bounding-box extent.
+    Returns None when there are too few points to span a solid.
+    """
+    if len(points) < 4:
+        return None
+    extents, _ = oriented_extents(points)
+    return min(extents)
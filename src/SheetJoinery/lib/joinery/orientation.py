@@ -0,0 +1,75 @@
+"""
+Orientation pre-filter for sheet body pairs
+
+Two sheets whose plane normals are parallel can only stack face to face or
+meet edge to edge; they never form the T-joints and cross-joints the
+narrow phase classifies. Bodies are bucketed by quantized normal direction
+and pairs inside one bucket are dropped, except coplanar pairs, which are
+kept on the edge-joint path.
+
+Normals are plain (x, y, z) unit tuples; no Fusion API imports.
+"""
+
+import math
+
+from .fingerprint import quantize
+
+
+def canonical_normal(normal: tuple) -> tuple:
+    """Flip a normal so its largest component is positive; n and -n are one direction"""
+    if max(normal, key=abs) < 0.0:
+        return (-normal[0], -normal[1], -normal[2])
+    return normal
+
+
+def normal_bucket(normal: tuple, angle_tolerance: float) -> tuple:
+    """
+    Bucket key of a unit normal: its canonical components quantized to a grid
+    fine enough that two normals sharing a key differ by less than about
+    angle_tolerance radians.
+    """
+    step = 2.0 * math.sin(angle_tolerance / 2.0) / math.sqrt(3.0)
+    x, y, z = canonical_normal(normal)
+    return (quantize(x, step), quantize(y, step), quantize(z, step))
+
+
+def plane_offset(normal: tuple, point: tuple) -> float:
+    """Signed distance of the plane through point along its canonical normal"""
+    x, y, z = canonical_normal(normal)
+    return x * point[0] + y * point[1] + z * point[2]
+
+
+def filter_parallel_pairs(
+    pairs: list, buckets: list, offsets: list, thicknesses: list
+) -> tuple[list, int, int]:
+    """
+    Drop candidate pairs whose bodies share a normal bucket.
+
+    Arguments:
+    pairs -- (index_a, index_b) candidate pairs.
+    buckets -- normal_bucket per body, or None when the body is not a flat
+               sheet (such bodies are never filtered).
+    offsets -- plane_offset of each body's mid-plane.
+    thicknesses -- Sheet thickness per body (or None).
+
+    Parallel pairs whose mid-planes lie within half the thinner sheet of
+    each other are coplanar and kept for the edge-joint path.
+    Returns (kept_pairs, parallel_rejected, coplanar_kept).
+    """
+    kept = []
+    rejected = 0
+    coplanar = 0
+    for index_a, index_b in pairs:
+        bucket = buckets[index_a]
+        if bucket is None or bucket != buckets[index_b]:
+            kept.append((index_a, index_b))
+            continue
+        half_thickness = (
+            min(thicknesses[index_a] or 0.0, thicknesses[index_b] or 0.0) / 2.0
+        )
+        if abs(offsets[index_a] - offsets[index_b]) < half_thickness:
+            coplanar += 1
+            kept.append((index_a, index_b))
+        else:
+            rejected += 1
+    return kept, rejected, coplanar
@@ -0,0 +1,81 @@
+"""
+Placement of component-local joint results into assembly coordinates
+
+Bodies reached through an occurrence are proxies of their component's
+native bodies. Joints between bodies of the same occurrence are computed
+once per component definition, in component-local coordinates, and each
+occurrence reuses them by transforming the joint bounds with its transform.
+Everything else about a joint (type, volume, area, thickness) is invariant
+under the rigid transforms occurrences use.
+
+Joint length and layout axis are derived from axis-aligned bounds, so reuse
+is only exact when the occurrence rotation maps axes onto axes; occurrences
+rotated by any other angle are evaluated in assembly coordinates instead.
+
+Matrices are the 16 row-major values of Matrix3D.asArray().
+"""
+
+
+def is_axis_permutation(matrix: tuple, epsilon: float = 1e-9) -> bool:
+    """
+    Whether the rotation part of a rigid transform maps each axis onto an axis
+    (a signed permutation matrix), so axis-aligned boxes stay axis-aligned
+    with the same extents
+    """
+    for row in range(3):
+        values = [abs(matrix[row * 4 + column]) for column in range(3)]
+        if (
+            sum(value > epsilon for value in values) != 1
+            or abs(max(values) - 1.0) > epsilon
+        ):
+            return False
+    return True
+
+
+def transform_point(matrix: tuple, point: tuple) -> tuple:
+    x, y, z = point
+    return (
+        matrix[0] * x + matrix[1] * y + matrix[2] * z + matrix[3],
+        matrix[4] * x + matrix[5] * y + matrix[6] * z + matrix[7],
+        matrix[8] * x + matrix[9] * y + matrix[10] * z + matrix[11],
+    )
+
+
+def transform_bounds(bounds: tuple, matrix: tuple) -> tuple:
+    """
+    Axis-aligned bounds of a transformed axis-aligned box; the transformed
+    box itself when the transform is an axis permutation, larger otherwise
+    """
+    corners = [
+        transform_point(
+            matrix,
+            (
+                bounds[3] if corner & 1 else bounds[0],
+                bounds[4] if corner & 2 else bounds[1],
+                bounds[5] if corner & 4 else bounds[2],
+            ),
+        )
+        for corner in range(8)
+    ]
+    return (
+        min(point[0] for point in corners),
+        min(point[1] for point in corners),
+        min(point[2] for point in corners),
+        max(point[0] for point in corners),
+        max(point[1] for point in corners),
+        max(point[2] for point in corners),
+    )
+
+
+def place_joint(info: dict, matrix: tuple) -> dict:
+    """Copy of a component-local intersection info dict moved into assembly coordinates"""
+    bounds = transform_bounds(info["bounds"], matrix)
+    placed = dict(info)
+    placed["bounds"] = bounds
+    placed["dimensions"] = dict(
+        info["dimensions"],
+        width=bounds[3] - bounds[0],
+        height=bounds[4] - bounds[1],
+        depth=bounds[5] - bounds[2],
+    )
+    return placed
@@ -0,0 +1,84 @@
+"""
+Level-of-detail preview geometry for the Join Sheets commands
+
+The preview never runs booleans: candidate joints are approximated by the
+overlap of the two bodies' bounding boxes and tab positions come from the
+finger layout of those boxes. Everything is returned as flat line-segment
+coordinate and index lists ready for one custom graphics call per layer.
+"""
+
+from .boolean_batch import joint_axis
+from .finger_layout import FINGER
+
+# Corner index pairs forming the 12 edges of a box whose corners are
+# enumerated with x varying fastest, then y, then z
+_BOX_EDGES = (
+    (0, 1), (2, 3), (4, 5), (6, 7),
+    (0, 2), (1, 3), (4, 6), (5, 7),
+    (0, 4), (1, 5), (2, 6), (3, 7),
+)  # fmt: skip
+
+
+def overlap_box(a: tuple, b: tuple) -> tuple | None:
+    """Intersection of two axis-aligned boxes, or None when they do not overlap"""
+    box = (
+        max(a[0], b[0]),
+        max(a[1], b[1]),
+        max(a[2], b[2]),
+        min(a[3], b[3]),
+        min(a[4], b[4]),
+        min(a[5], b[5]),
+    )
+    if box[0] >= box[3] or box[1] >= box[4] or box[2] >= box[5]:
+        return None
+    return box
+
+
+def joint_boxes(bounds_list: list, pairs: list) -> tuple[list, list]:
+    """
+    Approximate joint regions for candidate pairs.
+    Returns (pairs, boxes) restricted to pairs whose boxes really overlap.
+    """
+    kept_pairs = []
+    boxes = []
+    for index_a, index_b in pairs:
+        box = overlap_box(bounds_list[index_a], bounds_list[index_b])
+        if box is not None:
+            kept_pairs.append((index_a, index_b))
+            boxes.append(box)
+    return kept_pairs, boxes
+
+
+def finger_boxes(layout: object, boxes: list) -> list:
+    """Boxes of the finger segments of a layout laid out along boxes[joint]"""
+    fingers = []
+    for joint, bounds in enumerate(boxes):
+        axis = joint_axis(bounds)
+        origin = bounds[axis]
+        for row in layout.segments(joint):
+            if layout.kinds[row] != FINGER:
+                continue
+            box = list(bounds)
+            box[axis] = origin + layout.starts[row]
+            box[axis + 3] = origin + layout.ends[row]
+            fingers.append(box)
+    return fingers
+
+
+def box_lines(boxes: list) -> tuple[list, list]:
+    """
+    Wireframe of boxes as (coordinates, indices): a flat x, y, z coordinate
+    list and a flat list of vertex index pairs, one pair per edge.
+    """
+    coordinates = []
+    indices = []
+    for box in boxes:
+        base = len(coordinates) // 3
+        for corner in range(8):
+            coordinates.append(box[3] if corner & 1 else box[0])
+            coordinates.append(box[4] if corner & 2 else box[1])
+            coordinates.append(box[5] if corner & 4 else box[2])
+        for start, end in _BOX_EDGES:
+            indices.append(base + start)
+            indices.append(base + end)
+    return coordinates, indices
@@ -0,0 +1,360 @@
+"""
+Planar slab intersection kernel
+
+Flat sheet bodies are modelled as slabs: a convex outline polygon on a base
+plane, extruded along the plane normal by the sheet thickness. Two slabs are
+intersected by clipping one convex prism against the bounding planes of the
+other, which gives the intersection bounding box, volume and area without any
+BRep booleans. Pure Python so it runs (and can be exercised) outside Fusion.
+
+Points and vectors are plain (x, y, z) tuples in Fusion's internal units (cm).
+"""
+
+import math
+
+DEFAULT_EPSILON = 1e-6
+
+
+def _sub(a: tuple, b: tuple) -> tuple:
+    return (a[0] - b[0], a[1] - b[1], a[2] - b[2])
+
+
+def _add(a: tuple, b: tuple) -> tuple:
+    return (a[0] + b[0], a[1] + b[1], a[2] + b[2])
+
+
+def _scale(a: tuple, factor: float) -> tuple:
+    return (a[0] * factor, a[1] * factor, a[2] * factor)
+
+
+def _dot(a: tuple, b: tuple) -> float:
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+
+def _cross(a: tuple, b: tuple) -> tuple:
+    return (
+        a[1] * b[2] - a[2] * b[1],
+        a[2] * b[0] - a[0] * b[2],
+        a[0] * b[1] - a[1] * b[0],
+    )
+
+
+def _length(a: tuple) -> float:
+    return math.sqrt(_dot(a, a))
+
+
+def _normalize(a: tuple) -> tuple:
+    length = _length(a)
+    if length == 0.0:
+        raise ValueError("Cannot normalize a zero-length vector")
+    return _scale(a, 1.0 / length)
+
+
+def plane_basis(normal: tuple) -> tuple[tuple, tuple]:
+    """Return two unit vectors (u, v) spanning the plane with the given unit normal"""
+    # Cross with the world axis least aligned with the normal for stability
+    axis = min(range(3), key=lambda index: abs(normal[index]))
+    helper = tuple(1.0 if index == axis else 0.0 for index in range(3))
+    u = _normalize(_cross(helper, normal))
+    v = _cross(normal, u)
+    return u, v
+
+
+def convex_hull_2d(points: list) -> list:
+    """Monotone-chain convex hull, counter-clockwise, without collinear points"""
+    unique = sorted(set(points))
+    if len(unique) < 3:
+        return unique
+
+    def turn(o: tuple, a: tuple, b: tuple) -> float:
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    lower = []
+    for point in unique:
+        while len(lower) >= 2 and turn(lower[-2], lower[-1], point) <= 0:
+            lower.pop()
+        lower.append(point)
+    upper = []
+    for point in reversed(unique):
+        while len(upper) >= 2 and turn(upper[-2], upper[-1], point) <= 0:
+            upper.pop()
+        upper.append(point)
+    return lower[:-1] + upper[:-1]
+
+
+def _distance_to_segment_2d(point: tuple, a: tuple, b: tuple) -> float:
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    length_sq = dx * dx + dy * dy
+    t = 0.0
+    if length_sq > 0.0:
+        t = max(
+            0.0, min(1.0, ((point[0] - a[0]) * dx + (point[1] - a[1]) * dy) / length_sq)
+        )
+    return math.hypot(point[0] - (a[0] + t * dx), point[1] - (a[1] + t * dy))
+
+
+def _on_hull_boundary(point: tuple, hull: list, epsilon: float) -> bool:
+    return any(
+        _distance_to_segment_2d(point, hull[i], hull[(i + 1) % len(hull)]) <= epsilon
+        for i in range(len(hull))
+    )
+
+
+def make_slab(
+    base_points: list,
+    normal: tuple,
+    thickness: float,
+    epsilon: float = DEFAULT_EPSILON,
+) -> dict | None:
+    """
+    Build a slab from the vertices of one planar face, that face's normal and
+    the signed extrusion distance along the normal to the opposite face.
+    Returns None when the outline is not convex (or degenerate), so the caller
+    can fall back to BRep booleans.
+    """
+    if abs(thickness) <= epsilon or len(base_points) < 3:
+        return None
+
+    normal = _normalize(normal)
+    origin = base_points[0]
+    if thickness < 0.0:
+        # The opposite face lies behind the base plane: flip the normal so the
+        # slab always extrudes along +normal from the base face itself
+        normal = _scale(normal, -1.0)
+        thickness = -thickness
+
+    u, v = plane_basis(normal)
+    projected = []
+    for point in base_points:
+        offset = _sub(point, origin)
+        projected.append((_dot(offset, u), _dot(offset, v)))
+
+    outline = convex_hull_2d(projected)
+    if len(outline) < 3:
+        return None
+    if not all(_on_hull_boundary(point, outline, epsilon) for point in projected):
+        return None
+
+    return {
+        "origin": origin,
+        "normal": normal,
+        "u": u,
+        "v": v,
+        "outline": outline,
+        "thickness": thickness,
+    }
+
+
+def slab_outline_contains(
+    slab: dict, points: list, epsilon: float = DEFAULT_EPSILON
+) -> bool:
+    """Check that points (3D) project onto the slab outline boundary"""
+    outline = slab["outline"]
+    for point in points:
+        offset = _sub(point, slab["origin"])
+        projected = (_dot(offset, slab["u"]), _dot(offset, slab["v"]))
+        if not _on_hull_boundary(projected, outline, epsilon):
+            return False
+    return True
+
+
+def _outline_point(slab: dict, point_2d: tuple, height: float) -> tuple:
+    return _add(
+        slab["origin"],
+        _add(
+            _add(_scale(slab["u"], point_2d[0]), _scale(slab["v"], point_2d[1])),
+            _scale(slab["normal"], height),
+        ),
+    )
+
+
+def slab_polyhedron(slab: dict) -> list:
+    """Return the slab as a convex polyhedron: a list of ordered face polygons"""
+    outline = slab["outline"]
+    bottom = [_outline_point(slab, point, 0.0) for point in outline]
+    top = [_outline_point(slab, point, slab["thickness"]) for point in outline]
+    faces = [list(reversed(bottom)), top]
+    count = len(outline)
+    for i in range(count):
+        j = (i + 1) % count
+        faces.append([bottom[i], bottom[j], top[j], top[i]])
+    return faces
+
+
+def slab_halfspaces(slab: dict) -> list:
+    """
+    Return the bounding planes of the slab as (point, outward_normal) pairs.
+    A point p is inside when dot(p - point, outward_normal) <= 0 for all planes.
+    """
+    normal = slab["normal"]
+    top_origin = _add(slab["origin"], _scale(normal, slab["thickness"]))
+    planes = [(slab["origin"], _scale(normal, -1.0)), (top_origin, normal)]
+
+    outline = slab["outline"]
+    count = len(outline)
+    for i in range(count):
+        a = outline[i]
+        b = outline[(i + 1) % count]
+        # Outline is counter-clockwise, so the outward edge normal is (dy, -dx)
+        edge_normal = _normalize(
+            _add(_scale(slab["u"], b[1] - a[1]), _scale(slab["v"], a[0] - b[0]))
+        )
+        planes.append((_outline_point(slab, a, 0.0), edge_normal))
+    return planes
+
+
+def _clip_polygon(
+    polygon: list, plane_point: tuple, plane_normal: tuple, epsilon: float
+):
+    """
+    Sutherland-Hodgman clip of one face polygon against a half-space.
+    Returns (clipped_polygon, points_on_plane).
+    """
+    distances = [_dot(_sub(point, plane_point), plane_normal) for point in polygon]
+    clipped = []
+    on_plane = []
+    count = len(polygon)
+    for i in range(count):
+        current, following = polygon[i], polygon[(i + 1) % count]
+        d_current, d_following = distances[i], distances[(i + 1) % count]
+        if d_current <= epsilon:
+            clipped.append(current)
+            if d_current >= -epsilon:
+                on_plane.append(current)
+        if (d_current < -epsilon and d_following > epsilon) or (
+            d_current > epsilon and d_following < -epsilon
+        ):
+            t = d_current / (d_current - d_following)
+            crossing = _add(current, _scale(_sub(following, current), t))
+            clipped.append(crossing)
+            on_plane.append(crossing)
+    return clipped, on_plane
+
+
+def _order_on_plane(points: list, plane_normal: tuple, epsilon: float) -> list:
+    """Deduplicate coplanar points and order them around their centroid"""
+    unique = []
+    for point in points:
+        if all(_length(_sub(point, other)) > epsilon for other in unique):
+            unique.append(point)
+    if len(unique) < 3:
+        return []
+
+    center = _scale(
+        (
+            sum(p[0] for p in unique),
+            sum(p[1] for p in unique),
+            sum(p[2] for p in unique),
+        ),
+        1.0 / len(unique),
+    )
+    u, v = plane_basis(_normalize(plane_normal))
+    return sorted(
+        unique,
+        key=lambda point: math.atan2(
+            _dot(_sub(point, center), v), _dot(_sub(point, center), u)
+        ),
+    )
+
+
+def clip_polyhedron(
+    faces: list,
+    plane_point: tuple,
+    plane_normal: tuple,
+    epsilon: float = DEFAULT_EPSILON,
+) -> list:
+    """Clip a convex polyhedron to the half-space dot(p - plane_point, plane_normal) <= 0"""
+    clipped_faces = []
+    cap_points = []
+    has_face_on_plane = False
+    for face in faces:
+        clipped, on_plane = _clip_polygon(face, plane_point, plane_normal, epsilon)
+        if len(clipped) >= 3:
+            clipped_faces.append(clipped)
+            # A face already lying in the clip plane closes the solid by itself
+            has_face_on_plane = has_face_on_plane or len(on_plane) == len(clipped)
+        cap_points.extend(on_plane)
+
+    if clipped_faces and cap_points and not has_face_on_plane:
+        cap = _order_on_plane(cap_points, plane_normal, epsilon)
+        if cap and polygon_area(cap) > epsilon * epsilon:
+            clipped_faces.append(cap)
+    return clipped_faces
+
+
+def polygon_area(polygon: list) -> float:
+    """Area of an ordered planar polygon in 3D"""
+    total = (0.0, 0.0, 0.0)
+    first = polygon[0]
+    for i in range(1, len(polygon) - 1):
+        total = _add(
+            total, _cross(_sub(polygon[i], first), _sub(polygon[i + 1], first))
+        )
+    return 0.5 * _length(total)
+
+
+def polyhedron_bounds(faces: list) -> tuple:
+    """Axis-aligned bounds (min_x, min_y, min_z, max_x, max_y, max_z) of a polyhedron"""
+    points = [point for face in faces for point in face]
+    return (
+        min(p[0] for p in points),
+        min(p[1] for p in points),
+        min(p[2] for p in points),
+        max(p[0] for p in points),
+        max(p[1] for p in points),
+        max(p[2] for p in points),
+    )
+
+
+def polyhedron_volume(faces: list) -> float:
+    """Volume of a convex polyhedron as a sum of pyramids from an interior point"""
+    points = [point for face in faces for point in face]
+    interior = _scale(
+        (
+            sum(p[0] for p in points),
+            sum(p[1] for p in points),
+            sum(p[2] for p in points),
+        ),
+        1.0 / len(points),
+    )
+    volume = 0.0
+    for face in faces:
+        first = face[0]
+        area_vector = (0.0, 0.0, 0.0)
+        for i in range(1, len(face) - 1):
+            area_vector = _add(
+                area_vector, _cross(_sub(face[i], first), _sub(face[i + 1], first))
+            )
+        # |area_vector| / 2 is the face area; projecting gives area * height
+        volume += abs(_dot(area_vector, _sub(first, interior))) / 6.0
+    return volume
+
+
+def intersect_slabs(
+    slab_a: dict, slab_b: dict, epsilon: float = DEFAULT_EPSILON
+) -> dict | None:
+    """
+    Intersect two slabs.
+    Returns a dict with 'bounds', 'volume' and 'area' of the intersection
+    solid, or None when the slabs do not overlap with positive volume.
+    """
+    faces = slab_polyhedron(slab_a)
+    for plane_point, plane_normal in slab_halfspaces(slab_b):
+        faces = clip_polyhedron(faces, plane_point, plane_normal, epsilon)
+        if len(faces) < 4:
+            return None
+
+    volume = polyhedron_volume(faces)
+    if volume <= epsilon:
+        return None
+
+    return {
+        "bounds": polyhedron_bounds(faces),
+        "volume": volume,
+        "area": sum(polygon_area(face) for face in faces),
+    }
+
+
+def intersect_slab_pairs(slab_pairs: list, epsilon: float = DEFAULT_EPSILON) -> list:
+    """intersect_slabs over a list of (slab_a, slab_b) tuples"""
+    return [intersect_slabs(slab_a, slab_b, epsilon) for slab_a, slab_b in slab_pairs]
@@ -0,0 +1,70 @@
+"""
+Template cache for repeated tab and slot solids
+
+The fingers and slots of a joint are many identical boxes. A template is
+built once per unique box size and each occurrence is placed as a copy of
+it, so geometry construction cost scales with the number of distinct sizes
+rather than the number of segments.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable
+
+from .fingerprint import quantize
+
+
+def template_key(bounds: tuple, quantum: float) -> tuple:
+    """Size key of an axis-aligned box: its quantized x, y and z extents"""
+    return (
+        quantize(bounds[3] - bounds[0], quantum),
+        quantize(bounds[4] - bounds[1], quantum),
+        quantize(bounds[5] - bounds[2], quantum),
+    )
+
+
+def box_center(bounds: tuple) -> tuple:
+    return (
+        (bounds[0] + bounds[3]) / 2.0,
+        (bounds[1] + bounds[4]) / 2.0,
+        (bounds[2] + bounds[5]) / 2.0,
+    )
+
+
+class TemplateCache:
+    """LRU map from template key to a built template, with hit statistics"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._templates = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: tuple, build: Callable):
+        """Return the template for key, calling build() on a miss"""
+        template = self._templates.get(key)
+        if template is not None:
+            self.hits += 1
+            self._templates.move_to_end(key)
+            return template
+
+        self.misses += 1
+        template = build()
+        self._templates[key] = template
+        while len(self._templates) > self.max_entries:
+            self._templates.popitem(last=False)
+            self.evictions += 1
+        return template
+
+    def clear(self):
+        self._templates.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "templates": len(self._templates),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,79 @@
+"""
+Lazily built entity token index
+
+Maps entity tokens to resolved entities so repeated lookups of the same
+custom feature or body cost a dict access instead of a scan or an API
+round-trip. Entries are resolved on first use; the owner invalidates the
+whole index when the document or timeline changes.
+"""
+
+from collections.abc import Callable, Iterable
+
+
+def _is_valid(entity: object) -> bool:
+    try:
+        return bool(getattr(entity, "isValid", True))
+    except Exception:
+        return False
+
+
+class TokenIndex:
+    """Entity token -> entity map filled on demand"""
+
+    def __init__(self):
+        self._entities = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(
+        self,
+        token: str,
+        resolve: Callable,
+        populate: Callable[[], Iterable] | None = None,
+    ):
+        """
+        Return the entity for token, or None.
+        On a miss the token is resolved with resolve(token); if that fails and
+        populate is given, populate() is traversed once and every
+        (token, entity) pair it yields is indexed.
+        """
+        entity = self._entities.get(token)
+        if entity is not None and _is_valid(entity):
+            self.hits += 1
+            return entity
+
+        self.misses += 1
+        entity = resolve(token)
+        if entity is None and populate is not None:
+            for other_token, other_entity in populate():
+                self._entities[other_token] = other_entity
+            entity = self._entities.get(token)
+        if entity is None:
+            self._entities.pop(token, None)
+            return None
+        self._entities[token] = entity
+        return entity
+
+    def add(self, token: str, entity: object):
+        self._entities[token] = entity
+
+    def discard(self, token: str):
+        self._entities.pop(token, None)
+
+    def invalidate(self):
+        """Forget every entry, e.g. after a document or timeline change"""
+        if self._entities:
+            self.invalidations += 1
+        self._entities.clear()
+
+    def __len__(self):
+        return len(self._entities)
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entities),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
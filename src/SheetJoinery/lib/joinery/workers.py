@@ -0,0 +1,51 @@
+"""
+Background worker for the Fusion-free geometry stages
+
+The Fusion API may only be called from the main thread. Work on plain data
+(slab intersections and classification of a dialog selection) runs on a
+worker thread instead, from a snapshot taken on the main thread, while the
+main thread is idle waiting for user input. Results come back through a
+Fusion custom event that the caller fires from the done callback.
+
+Compute itself stays on the main thread: the kernel is pure Python, so
+under the GIL more threads only add hand-off cost, and a process pool would
+start new interpreters from inside the Fusion process, which is not
+supported there.
+"""
+
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class WorkerPool:
+    """Lazily started thread pool for background jobs"""
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor = None
+        self.submitted = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="joinery"
+            )
+        return self._executor
+
+    def submit(self, func: Callable, *args) -> Future:
+        """Run func(*args) on a worker thread"""
+        self.submitted += 1
+        return self._get_executor().submit(func, *args)
+
+    @property
+    def is_running(self) -> bool:
+        return self._executor is not None
+
+    def shutdown(self):
+        """Stop the worker threads; queued work that has not started is dropped"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        return {"workers": self.max_workers, "submitted": self.submitted}
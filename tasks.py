@@ -8,19 +8,19 @@ from invoke import task
 @task
 def lint(c):
     """Run ruff linter on the codebase"""
-    c.run("ruff check src/")
+    c.run("ruff check src/ tools/ tests/")
 
 
 @task
 def format(c):
     """Format code with ruff"""
-    c.run("ruff format src/")
+    c.run("ruff format src/ tools/ tests/")
 
 
 @task
 def lint_fix(c):
     """Run ruff linter with auto-fix"""
-    c.run("ruff check --fix src/")
+    c.run("ruff check --fix src/ tools/ tests/")
 
 
 @task
@@ -29,13 +29,81 @@ def typecheck(c):
     c.run("pyright src/")
 
 
+@task
+def test(c):
+    """Run the unit tests and the headless engine tests"""
+    c.run("python -m pytest tests tools/headless/tests")
+
+
 @task
 def check(c):
     """Run all code quality checks"""
     print("Running ruff linter...")
-    c.run("ruff check src/")
+    c.run("ruff check src/ tools/ tests/")
     print("\nRunning ruff formatter check...")
-    c.run("ruff format --check src/")
+    c.run("ruff format --check src/ tools/ tests/")
     print("\nRunning pyright type checker...")
     c.run("pyright src/")
-    print("\nAll checks passed!")
\ No newline at end of file
+    print("\nAll checks passed!")
+
+
+@task(
+    help={
+        "scenarios": "Comma-separated scenarios (cabinets, shelf_grid, egg_crate, drawers, shelving, kitchen)",
+        "sizes": "Comma-separated body counts, e.g. 2,100,2000",
+        "repeat": "Timed runs per case; the median is reported",
+        "stages": "Report per-stage span totals",
+        "json": "Write results to this JSON file",
+    }
+)
+def bench(c, scenarios="", sizes="", repeat=1, stages=False, json=""):
+    """Run the headless Join Sheets scaling benchmarks"""
+    args = [f"--repeat {repeat}"]
+    if scenarios:
+        args.append(f"--scenarios {scenarios}")
+    if sizes:
+        args.append(f"--sizes {sizes}")
+    if stages:
+        args.append("--stages")
+    if json:
+        args.append(f"--json {json}")
+    c.run(f"python tools/bench/run_benchmarks.py {' '.join(args)}")
+
+
+@task(
+    help={
+        "scenarios": "Comma-separated scenarios to record (default: all)",
+        "sizes": "Comma-separated body counts (default: 10,200,1000)",
+        "repeat": "Timed runs per case",
+    }
+)
+def bench_baseline(c, scenarios="", sizes="", repeat=7):
+    """Record benchmark baselines in tools/bench/baselines"""
+    args = [f"--repeat {repeat}"]
+    if scenarios:
+        args.append(f"--scenarios {scenarios}")
+    if sizes:
+        args.append(f"--sizes {sizes}")
+    c.run(f"python tools/bench/baseline.py record {' '.join(args)}")
+
+
+@task(
+    help={
+        "scenarios": "Comma-separated scenarios to check (default: all)",
+        "repeat": "Timed runs per case",
+        "latency": "Allowed relative increase of median compute latency",
+        "memory": "Allowed relative increase of peak traced memory",
+        "booleans": "Allowed relative increase of boolean/copy kernel calls",
+    }
+)
+def perf_gate(c, scenarios="", repeat=7, latency=0.15, memory=0.10, booleans=0.0):
+    """Fail when benchmarks regress beyond thresholds against stored baselines"""
+    args = [
+        f"--repeat {repeat}",
+        f"--latency-threshold {latency}",
+        f"--memory-threshold {memory}",
+        f"--boolean-threshold {booleans}",
+    ]
+    if scenarios:
+        args.append(f"--scenarios {scenarios}")
+    c.run(f"python tools/bench/baseline.py check {' '.join(args)}")
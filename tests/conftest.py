@@ -0,0 +1,18 @@
+"""
+Unit tests for the Fusion-free joinery modules and the add-in utilities
+
+src is put on sys.path so tests import SheetJoinery modules directly. The
+lib/joinery modules never touch adsk; fusionAddInUtils does, so the headless
+stand-in in tools/headless is put on sys.path as well.
+"""
+
+import os
+import sys
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for _path in (
+    os.path.join(_REPO_ROOT, "tools", "headless"),
+    os.path.join(_REPO_ROOT, "src"),
+):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
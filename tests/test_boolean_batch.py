@@ -0,0 +1,105 @@
+import pytest
+
+from SheetJoinery.lib.joinery.boolean_batch import (
+    batch_savings,
+    joint_axis,
+    plan_cut_boxes,
+    tree_reduce,
+)
+from SheetJoinery.lib.joinery.finger_layout import layout_fingers
+
+
+def test_joint_axis_is_the_longest_extent():
+    assert joint_axis((0, 0, 0, 1, 8, 2)) == 1
+    assert joint_axis((0, 0, -5, 1, 1, 5)) == 2
+
+
+def test_cut_boxes_alternate_between_the_two_bodies():
+    # One 18 long joint along x: 5 fingers and 4 slots of 2.0
+    bounds = (10.0, 1.0, 2.0, 28.0, 1.5, 3.0)
+    layout = layout_fingers([18.0], [0.5], 2.0, 0.0, 1.0, 2)
+    plan = plan_cut_boxes(layout, [("a", "b")], [bounds])
+
+    # Fingers stay on a and are cut from b; slots are cut from a
+    assert len(plan["b"]) == 5
+    assert len(plan["a"]) == 4
+    assert plan["b"][0] == pytest.approx((10.0, 1.0, 2.0, 12.0, 1.5, 3.0))
+    assert plan["a"][0] == pytest.approx((12.0, 1.0, 2.0, 14.0, 1.5, 3.0))
+    # The other extents span the whole intersection
+    for box in plan["a"] + plan["b"]:
+        assert box[1:3] == (1.0, 2.0)
+        assert box[4:] == (1.5, 3.0)
+
+
+def test_finger_cuts_are_widened_by_the_tolerance():
+    bounds = (0.0, 0.0, 0.0, 0.5, 18.0, 0.5)
+    layout = layout_fingers([18.0], [0.5], 2.0, 0.2, 1.0, 2)
+    plan = plan_cut_boxes(layout, [("a", "b")], [bounds])
+    # An inner finger is widened on both sides, the slots not at all
+    inner_finger = plan["b"][1]
+    assert inner_finger[4] - inner_finger[1] == pytest.approx(2.2)
+    for slot in plan["a"]:
+        assert slot[4] - slot[1] == pytest.approx(2.0)
+
+
+def test_boxes_of_several_joints_are_grouped_by_target():
+    layout = layout_fingers([18.0, 18.0], [0.5, 0.5], 2.0, 0.0, 1.0, 2)
+    plan = plan_cut_boxes(
+        layout,
+        [("a", "b"), ("c", "a")],
+        [(0, 0, 0, 18, 1, 1), (0, 5, 0, 18, 6, 1)],
+    )
+    assert {target: len(boxes) for target, boxes in plan.items()} == {
+        "a": 4 + 5,
+        "b": 5,
+        "c": 4,
+    }
+
+
+def test_plan_needs_bounds_for_every_joint():
+    layout = layout_fingers([18.0], [0.5], 2.0, 0.0, 1.0, 2)
+    with pytest.raises(ValueError):
+        plan_cut_boxes(layout, [("a", "b")], [])
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 7, 8])
+def test_tree_reduce_combines_every_item_once(count):
+    pairs = []
+
+    def combine(left, right):
+        pairs.append((left, right))
+        return left + right
+
+    result, calls = tree_reduce([[item] for item in range(count)], combine)
+    assert result == list(range(count))
+    assert calls == count - 1 == len(pairs)
+
+
+def test_tree_reduce_is_balanced():
+    depth = {}
+
+    def combine(left, right):
+        merged = left + right
+        depth[merged] = max(depth.get(left, 0), depth.get(right, 0)) + 1
+        return merged
+
+    result, _ = tree_reduce([chr(ord("a") + i) for i in range(8)], combine)
+    assert result == "abcdefgh"
+    assert depth[result] == 3
+
+
+def test_tree_reduce_of_nothing():
+    assert tree_reduce([], lambda *_: pytest.fail("combine called")) == (None, 0)
+
+
+def test_batch_savings():
+    savings = batch_savings([5, 4, 0, 1])
+    assert savings == {
+        "targets": 3,
+        "tools": 10,
+        "unbatched_target_booleans": 10,
+        "target_booleans": 3,
+        "tool_unions": 7,
+        "target_booleans_saved": 7,
+    }
+    assert batch_savings([])["target_booleans_saved"] == 0
@@ -0,0 +1,64 @@
+import itertools
+import random
+
+from SheetJoinery.lib.joinery.broad_phase import (
+    bounds_overlap,
+    find_candidate_pairs,
+    inflate_bounds,
+)
+
+
+def brute_force_pairs(bounds_list, margin):
+    inflated = [inflate_bounds(bounds, margin) for bounds in bounds_list]
+    return [
+        (i, j)
+        for i, j in itertools.combinations(range(len(bounds_list)), 2)
+        if bounds_overlap(inflated[i], inflated[j])
+    ]
+
+
+def random_boxes(rng, count, span=100.0, size=8.0):
+    boxes = []
+    for _ in range(count):
+        low = [rng.uniform(0.0, span) for _ in range(3)]
+        high = [value + rng.uniform(0.1, size) for value in low]
+        boxes.append((*low, *high))
+    return boxes
+
+
+def test_matches_brute_force_on_random_boxes():
+    rng = random.Random(7)
+    for count in (2, 10, 60, 200):
+        boxes = random_boxes(rng, count)
+        for margin in (0.0, 0.5, 3.0):
+            pairs, rejected = find_candidate_pairs(boxes, margin)
+            expected = brute_force_pairs(boxes, margin)
+            assert pairs == expected
+            assert rejected == count * (count - 1) // 2 - len(expected)
+
+
+def test_touching_boxes_are_candidates():
+    boxes = [(0, 0, 0, 1, 1, 1), (1, 0, 0, 2, 1, 1), (2, 1, 1, 3, 2, 2)]
+    pairs, rejected = find_candidate_pairs(boxes)
+    assert pairs == [(0, 1), (1, 2)]
+    assert rejected == 1
+
+
+def test_margin_inflates_both_boxes():
+    boxes = [(0, 0, 0, 1, 1, 1), (1.5, 0, 0, 2.5, 1, 1)]
+    assert find_candidate_pairs(boxes, 0.2) == ([], 1)
+    # A gap of 0.5 closes once each box grows by 0.25
+    assert find_candidate_pairs(boxes, 0.25) == ([(0, 1)], 0)
+
+
+def test_separation_on_any_axis_rejects_the_pair():
+    # Overlapping along the sweep axis but apart along y
+    boxes = [(0, 0, 0, 10, 1, 1), (5, 3, 0, 15, 4, 1), (6, 0.5, 0, 7, 3.5, 1)]
+    pairs, rejected = find_candidate_pairs(boxes)
+    assert pairs == [(0, 2), (1, 2)]
+    assert rejected == 1
+
+
+def test_fewer_than_two_boxes():
+    assert find_candidate_pairs([]) == ([], 0)
+    assert find_candidate_pairs([(0, 0, 0, 1, 1, 1)]) == ([], 0)
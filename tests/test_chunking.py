@@ -0,0 +1,81 @@
+from SheetJoinery.lib.joinery.chunking import CANCELLED, OUT_OF_TIME, ChunkedRun
+
+
+def test_runs_every_chunk_and_reports_progress():
+    progress = []
+    run = ChunkedRun(3, on_progress=lambda done, total: progress.append((done, total)))
+    chunks = list(run.chunks(list(range(7))))
+    assert chunks == [[0, 1, 2], [3, 4, 5], [6]]
+    assert run.is_complete
+    assert run.pending == []
+    assert (run.done, run.total) == (7, 7)
+    assert progress == [(3, 7), (6, 7), (7, 7)]
+
+
+def test_single_chunk_reports_no_progress():
+    progress = []
+    run = ChunkedRun(10, on_progress=lambda *args: progress.append(args))
+    assert list(run.chunks([1, 2])) == [[1, 2]]
+    assert progress == []
+
+
+def test_cancel_keeps_the_rest_pending():
+    cancelled = []
+    run = ChunkedRun(2, is_cancelled=lambda: bool(cancelled))
+    for chunk in run.chunks(list(range(6))):
+        if chunk == [0, 1]:
+            cancelled.append(True)
+    assert run.stop_reason == CANCELLED
+    assert not run.is_complete
+    assert run.done == 2
+    assert run.pending == [2, 3, 4, 5]
+
+
+def test_time_budget_stops_between_chunks():
+    now = [0.0]
+    run = ChunkedRun(2, time_budget=1.0, clock=lambda: now[0])
+    seen = []
+    for chunk in run.chunks(list(range(6))):
+        seen.extend(chunk)
+        now[0] += 0.6
+    assert seen == [0, 1, 2, 3]
+    assert run.stop_reason == OUT_OF_TIME
+    assert run.pending == [4, 5]
+
+
+def test_rerun_resets_state():
+    run = ChunkedRun(1, is_cancelled=lambda: True)
+    list(run.chunks([1, 2]))
+    assert run.pending == [2]
+    run.is_cancelled = None
+    assert list(run.chunks([2])) == [[2]]
+    assert run.is_complete
+    assert run.pending == []
+
+
+def test_stages_share_the_budget_and_pending():
+    now = [0.0]
+    progress = []
+    run = ChunkedRun(
+        2,
+        time_budget=1.0,
+        on_progress=lambda done, total: progress.append((done, total)),
+        clock=lambda: now[0],
+    )
+    seen = []
+    for chunk in run.chunks(["a1", "a2", "a3"], resume=True):
+        seen.extend(chunk)
+        now[0] += 0.4
+    assert run.is_complete
+    for chunk in run.chunks(["b1", "b2", "b3"], resume=True):
+        seen.extend(chunk)
+        now[0] += 0.4
+    # The second stage starts with the 0.8 s the first one used
+    assert seen == ["a1", "a2", "a3", "b1", "b2"]
+    assert run.stop_reason == OUT_OF_TIME
+    assert (run.done, run.total) == (5, 6)
+    assert progress[0] == (2, 3)
+
+    # A stopped run evaluates nothing of later stages
+    assert list(run.chunks(["c1"], resume=True)) == []
+    assert run.pending == ["b3", "c1"]
@@ -0,0 +1,96 @@
+import random
+
+from SheetJoinery.lib.joinery.classify import (
+    classify_intersections,
+    intersection_info,
+)
+
+
+def per_pair_analysis(bounds, volume, area, sheet_thickness):
+    """The per-pair analyze_intersection_geometry decisions the batch replaced"""
+    width = bounds[3] - bounds[0]
+    height = bounds[4] - bounds[1]
+    depth = bounds[5] - bounds[2]
+    if volume < sheet_thickness * sheet_thickness * sheet_thickness * 0.1:
+        return None
+    longest, middle, shortest = sorted([width, height, depth], reverse=True)
+    if shortest > sheet_thickness * 0.5:
+        joint_type = "cross-joint"
+        description = f"Cross joint: {longest * 10:.1f} x {middle * 10:.1f} x {shortest * 10:.1f} mm"
+    elif middle > longest * 0.1:
+        joint_type = "t-joint"
+        description = f"T-joint: {longest * 10:.1f} x {middle * 10:.1f} mm intersection"
+    else:
+        joint_type = "edge-joint"
+        description = f"Edge joint: {longest * 10:.1f} mm length"
+    return {
+        "type": joint_type,
+        "description": description,
+        "dimensions": {
+            "width": width,
+            "height": height,
+            "depth": depth,
+            "volume": volume,
+            "area": area,
+        },
+        "suitable_for_tabs": longest > sheet_thickness * 3,
+    }
+
+
+def random_intersection(rng):
+    low = [rng.uniform(-50.0, 50.0) for _ in range(3)]
+    size = [rng.choice((rng.uniform(0.0, 0.3), rng.uniform(0.0, 40.0))) for _ in low]
+    bounds = (*low, *(value + extent for value, extent in zip(low, size, strict=True)))
+    box_volume = size[0] * size[1] * size[2]
+    return bounds, box_volume * rng.uniform(0.0, 1.0), rng.uniform(0.0, 500.0)
+
+
+def assert_parity(rows, thicknesses):
+    batch = classify_intersections(
+        [row[0] for row in rows],
+        [row[1] for row in rows],
+        [row[2] for row in rows],
+        thicknesses,
+    )
+    for index, ((bounds, volume, area), thickness) in enumerate(
+        zip(rows, thicknesses, strict=True)
+    ):
+        expected = per_pair_analysis(bounds, volume, area, thickness)
+        info = intersection_info(batch, index)
+        if expected is None:
+            assert info is None
+            continue
+        assert {key: info[key] for key in expected} == expected
+        assert info["bounds"] == bounds
+        assert info["thickness"] == thickness
+
+
+def test_batch_matches_per_pair_decisions():
+    rng = random.Random(3)
+    rows = [random_intersection(rng) for _ in range(2000)]
+    thicknesses = [rng.choice((0.3, 0.6, 1.2, 1.8)) for _ in rows]
+    assert_parity(rows, thicknesses)
+
+
+def test_batch_matches_per_pair_decisions_at_thresholds():
+    t = 1.0
+    rows = [
+        # Exactly the minimum volume is kept, just below is noise
+        ((0, 0, 0, 10, 10, 0.001), 0.1, 1.0),
+        ((0, 0, 0, 10, 10, 0.001), 0.0999, 1.0),
+        # Shortest side at exactly half a thickness is not a cross joint
+        ((0, 0, 0, 10, 5, 0.5), 25.0, 1.0),
+        ((0, 0, 0, 10, 5, 0.51), 25.5, 1.0),
+        # Middle side at exactly a tenth of the longest is an edge joint
+        ((0, 0, 0, 10, 1, 0.2), 2.0, 1.0),
+        ((0, 0, 0, 10, 1.01, 0.2), 2.02, 1.0),
+        # Tabs need more than three thicknesses of length
+        ((0, 0, 0, 3, 1, 0.2), 0.6, 1.0),
+        ((0, 0, 0, 3.01, 1, 0.2), 0.602, 1.0),
+    ]
+    assert_parity(rows, [t] * len(rows))
+
+
+def test_empty_batch():
+    batch = classify_intersections([], [], [], [])
+    assert batch["type"] == []
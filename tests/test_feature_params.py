@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from SheetJoinery.lib.joinery.feature_params import (
+    SCHEMA_VERSION,
+    is_legacy_attribute,
+    legacy_parameters,
+    make_parameters,
+    pack_parameters,
+    unpack_parameters,
+)
+
+
+def test_pack_round_trip():
+    parameters = make_parameters(1.2, 0.01, ["token-a", "token-b"])
+    packed = pack_parameters(parameters)
+    assert " " not in packed
+    assert json.loads(packed)["version"] == SCHEMA_VERSION
+    assert unpack_parameters(packed) == parameters
+
+
+def test_values_are_normalized():
+    parameters = make_parameters("2", 0, ("a",))
+    assert parameters == {"tab_width": 2.0, "tolerance": 0.0, "body_tokens": ["a"]}
+
+
+def test_missing_fields_use_defaults():
+    parameters = unpack_parameters(json.dumps({"version": SCHEMA_VERSION}))
+    assert parameters == make_parameters(10.0, 0.1, [])
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["not json", "[1, 2]", json.dumps({"version": SCHEMA_VERSION + 1}), "{}"],
+)
+def test_unpack_rejects_bad_data(text):
+    with pytest.raises(ValueError):
+        unpack_parameters(text)
+
+
+def test_legacy_attribute_names():
+    assert is_legacy_attribute("body_count")
+    assert is_legacy_attribute("tab_width")
+    assert is_legacy_attribute("body_3_token")
+    assert not is_legacy_attribute("params")
+    assert not is_legacy_attribute("body_graph")
+
+
+def test_legacy_parameters_keep_body_order():
+    values = {
+        "body_count": "3",
+        "tab_width": "1.5",
+        "tolerance": "0.02",
+        "body_2_token": "c",
+        "body_0_token": "a",
+        "body_1_token": "b",
+    }
+    assert legacy_parameters(values) == make_parameters(1.5, 0.02, ["a", "b", "c"])
+
+
+def test_legacy_parameters_fill_gaps():
+    parameters = legacy_parameters({"body_count": "2", "body_1_token": "b"})
+    assert parameters == make_parameters(10.0, 0.1, ["", "b"])
+
+
+def test_no_legacy_attributes():
+    assert legacy_parameters({}) is None
+    assert legacy_parameters({"params": "{}"}) is None
@@ -0,0 +1,54 @@
+import pytest
+
+from SheetJoinery.lib.joinery.finger_layout import (
+    FINGER,
+    SLOT,
+    finger_count,
+    layout_fingers,
+)
+
+
+def test_finger_count_targets_tab_width():
+    # 5 fingers and 4 slots of 2.0 fill 18.0
+    assert finger_count(18.0, 0.5, 2.0, 1.0, 2) == 5
+
+
+def test_finger_count_respects_minimum_and_thickness():
+    assert finger_count(4.0, 0.5, 10.0, 1.0, 2) == 2
+    # Fingers may not get narrower than the sheet thickness
+    assert finger_count(4.0, 1.5, 0.5, 1.0, 2) == 1
+    assert finger_count(1.0, 1.5, 0.5, 1.0, 2) == 0
+
+
+def test_segments_alternate_and_cover_the_joint():
+    layout = layout_fingers([18.0], [0.5], 2.0, 0.0, 1.0, 2)
+    rows = layout.segments(0)
+    assert [layout.kinds[row] for row in rows] == [FINGER, SLOT] * 4 + [FINGER]
+    assert layout.starts[rows.start] == 0.0
+    assert layout.ends[rows.stop - 1] == pytest.approx(18.0)
+    for row in range(rows.start, rows.stop - 1):
+        assert layout.ends[row] == pytest.approx(layout.starts[row + 1])
+
+
+def test_short_joint_gets_no_segments():
+    layout = layout_fingers([0.2, 18.0], [0.5, 0.5], 2.0, 0.0, 1.0, 2)
+    assert list(layout.segments(0)) == []
+    assert len(layout.segments(1)) == 9
+
+
+def test_tolerance_is_applied_once_per_joint():
+    tolerance = 0.2
+    layout = layout_fingers([18.0], [0.5], 2.0, tolerance, 1.0, 2)
+    rows = layout.segments(0)
+    holes = layout.cut_intervals(0, FINGER)
+    slots = layout.cut_intervals(0, SLOT)
+    # The first body keeps each finger at its nominal width: slot cuts are exact
+    for (start, end), row in zip(slots, rows[1::2], strict=True):
+        assert (start, end) == pytest.approx((layout.starts[row], layout.ends[row]))
+    # Each hole in the second body is the finger plus the tolerance, split
+    # evenly, except where it is clipped at the joint ends
+    for (start, end), row in zip(holes[1:-1], rows[2:-2:2], strict=True):
+        assert start == pytest.approx(layout.starts[row] - tolerance / 2)
+        assert end == pytest.approx(layout.ends[row] + tolerance / 2)
+    assert holes[0][0] == 0.0
+    assert holes[-1][1] == pytest.approx(18.0)
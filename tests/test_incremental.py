@@ -0,0 +1,64 @@
+from SheetJoinery.lib.joinery.incremental import (
+    find_dirty_keys,
+    make_snapshot,
+    plan_recompute,
+    reuse_clean_results,
+)
+
+SETTINGS = (1.0, 0.01)
+FINGERPRINTS = {"a": (1,), "b": (2,), "c": (3,), "d": (4,)}
+RESULTS = {("a", "b"): {"type": "t-joint"}, ("b", "c"): {"type": "t-joint"}}
+
+
+def test_first_compute_and_changed_settings_are_full():
+    assert plan_recompute(None, SETTINGS, FINGERPRINTS)[0] is None
+    snapshot = make_snapshot(SETTINGS, FINGERPRINTS, RESULTS)
+    dirty, pending, reason = plan_recompute(snapshot, (2.0, 0.01), FINGERPRINTS)
+    assert dirty is None
+    assert pending == set()
+    assert reason == "feature parameters changed"
+
+
+def test_all_dependencies_changed_is_full():
+    snapshot = make_snapshot(SETTINGS, FINGERPRINTS, RESULTS)
+    changed = {key: (0, *value) for key, value in FINGERPRINTS.items()}
+    assert plan_recompute(snapshot, SETTINGS, changed)[0] is None
+
+
+def test_changed_and_new_dependencies_are_dirty():
+    fingerprints = {**FINGERPRINTS, "c": (30,), "e": (5,)}
+    assert find_dirty_keys(FINGERPRINTS, fingerprints) == {"c", "e"}
+    snapshot = make_snapshot(SETTINGS, FINGERPRINTS, RESULTS)
+    dirty, pending, _ = plan_recompute(snapshot, SETTINGS, fingerprints)
+    assert dirty == {"c", "e"}
+    assert pending == set()
+    reused = reuse_clean_results(snapshot, dirty, set(fingerprints))
+    assert reused == {("a", "b"): RESULTS[("a", "b")]}
+
+
+def test_pending_pairs_do_not_dirty_their_bodies():
+    snapshot = make_snapshot(SETTINGS, FINGERPRINTS, RESULTS, [("a", "c"), ("c", "d")])
+    dirty, pending, reason = plan_recompute(snapshot, SETTINGS, FINGERPRINTS)
+    assert dirty == set()
+    assert pending == {("a", "c"), ("c", "d")}
+    assert reason.endswith("2 pairs pending")
+    # Clean pairs of bodies a and c are still reused
+    assert reuse_clean_results(snapshot, dirty, set(FINGERPRINTS)) == RESULTS
+
+
+def test_pending_pairs_touching_changed_or_removed_bodies_are_dropped():
+    snapshot = make_snapshot(
+        SETTINGS, FINGERPRINTS, RESULTS, [("a", "c"), ("b", "d"), ("c", "d")]
+    )
+    fingerprints = {"a": (1,), "b": (20,), "c": (3,)}
+    dirty, pending, _ = plan_recompute(snapshot, SETTINGS, fingerprints)
+    assert dirty == {"b"}
+    # b-d is gone with d, and pairs of b are evaluated as dirty anyway
+    assert pending == {("a", "c")}
+
+
+def test_removed_dependencies_drop_their_results():
+    snapshot = make_snapshot(SETTINGS, FINGERPRINTS, RESULTS)
+    assert reuse_clean_results(snapshot, set(), {"a", "b", "d"}) == {
+        ("a", "b"): RESULTS[("a", "b")]
+    }
@@ -0,0 +1,99 @@
+from types import SimpleNamespace
+
+from SheetJoinery import config
+from SheetJoinery.lib.joinery.fingerprint import (
+    body_fingerprint,
+    quantize,
+    with_thickness,
+)
+from SheetJoinery.lib.joinery.intersection_cache import MISS, IntersectionCache
+
+QUANTUM = config.FINGERPRINT_QUANTUM
+
+
+def fake_body(offset=0.0, volume=12.5, area=31.0):
+    def point(x, y, z):
+        return SimpleNamespace(x=x + offset, y=y + offset, z=z + offset)
+
+    return SimpleNamespace(
+        boundingBox=SimpleNamespace(minPoint=point(0, 0, 0), maxPoint=point(5, 2.5, 1)),
+        volume=volume + offset,
+        area=area + offset,
+        faces=SimpleNamespace(count=6),
+        edges=SimpleNamespace(count=12),
+    )
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = IntersectionCache(max_entries=2, max_bytes=1 << 20)
+    cache.put(("a",), {"type": "t-joint"})
+    cache.put(("b",), {"type": "cross-joint"})
+    assert cache.get(("a",)) is not MISS  # a is now the most recent
+    cache.put(("c",), {"type": "edge-joint"})
+    assert cache.get(("b",)) is MISS
+    assert cache.get(("a",)) is not MISS
+    assert cache.get(("c",)) is not MISS
+    assert cache.stats()["evictions"] == 1
+    assert len(cache) == 2
+
+
+def test_byte_cap_evicts_until_under_the_cap():
+    cache = IntersectionCache(max_entries=100, max_bytes=10_000)
+    cache.put(("a",), None, brep="brep-a", brep_bytes=6_000)
+    cache.put(("b",), None, brep="brep-b", brep_bytes=6_000)
+    assert cache.get(("a",)) is MISS
+    assert cache.get(("b",)) == (None, "brep-b")
+    assert cache.size_bytes <= 10_000
+
+
+def test_replacing_a_key_does_not_double_count_bytes():
+    cache = IntersectionCache(max_entries=10, max_bytes=1 << 20)
+    cache.put(("a",), {"type": "t-joint"})
+    size = cache.size_bytes
+    cache.put(("a",), {"type": "t-joint"})
+    assert cache.size_bytes == size
+    assert len(cache) == 1
+
+
+def test_cached_none_is_a_hit_not_a_miss():
+    cache = IntersectionCache(max_entries=10, max_bytes=1 << 20)
+    assert cache.get(("a", "b")) is MISS
+    cache.put(("a", "b"), None)
+    assert cache.get(("a", "b")) == (None, None)
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_clear_resets_entries_and_counters():
+    cache = IntersectionCache(max_entries=10, max_bytes=1 << 20)
+    cache.put(("a",), None)
+    cache.get(("a",))
+    cache.clear()
+    assert cache.stats() == {
+        "entries": 0,
+        "bytes": 0,
+        "hits": 0,
+        "misses": 0,
+        "evictions": 0,
+    }
+
+
+def test_quantize_absorbs_noise_below_half_a_quantum():
+    for value in (0.0, 1.8, 123.456):
+        assert quantize(value + 0.4 * QUANTUM, QUANTUM) == quantize(value, QUANTUM)
+        assert quantize(value - 0.4 * QUANTUM, QUANTUM) == quantize(value, QUANTUM)
+        assert quantize(value + QUANTUM, QUANTUM) == quantize(value, QUANTUM) + 1
+
+
+def test_fingerprint_is_stable_under_float_noise():
+    assert body_fingerprint(fake_body()) == body_fingerprint(fake_body(1e-9))
+    assert body_fingerprint(fake_body()) != body_fingerprint(fake_body(2 * QUANTUM))
+
+
+def test_fingerprint_distinguishes_volume_and_thickness():
+    assert body_fingerprint(fake_body()) != body_fingerprint(fake_body(volume=12.0))
+    geometry = body_fingerprint(fake_body())
+    assert geometry[-1] is None
+    assert with_thickness(geometry, 0.18) != with_thickness(geometry, 0.12)
+    assert with_thickness(geometry, 0.18) == body_fingerprint(fake_body(), 0.18)
+    assert with_thickness(geometry, None) == geometry
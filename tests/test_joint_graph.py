@@ -0,0 +1,113 @@
+import pytest
+
+from SheetJoinery.lib.joinery.classify import classify_intersections, intersection_info
+from SheetJoinery.lib.joinery.finger_layout import layout_fingers
+from SheetJoinery.lib.joinery.joint_graph import (
+    JointGraph,
+    layout_record,
+    pack_graph,
+    segment_intervals,
+    unpack_graph,
+)
+
+
+def cross_joint():
+    batch = classify_intersections(
+        [(2.0, 0.0, 2.0, 2.3, 6.0, 2.3)], [0.54], [7.38], [0.3]
+    )
+    return intersection_info(batch, 0)
+
+
+def sample_graph():
+    graph = JointGraph(("settings", 1.0))
+    graph.add_node("a", "token_a", ((1.0, 2.0), 0.3))
+    graph.add_node("b", "token_b", ((3.0, 4.0), 0.3))
+    graph.add_node("c", "token_c", ((5.0, 6.0), 0.3))
+    graph.add_edge("a", "b", cross_joint())
+    graph.add_edge("b", "c", cross_joint(), {"length": 6.0, "fingers": 0})
+    return graph
+
+
+def test_adjacency():
+    graph = sample_graph()
+    assert set(graph.neighbors("b")) == {"a", "c"}
+    assert graph.edge_key("b", "a") == ("a", "b")
+    assert graph.degree("a") == 1
+    assert graph.remove_node("b") == 2
+    assert graph.edge_count == 0
+    assert graph.degree("a") == 0
+
+
+def test_add_edge_replaces_either_direction():
+    graph = sample_graph()
+    graph.add_edge("b", "a", cross_joint())
+    assert graph.edge_count == 2
+    assert graph.edge_key("a", "b") == ("b", "a")
+
+
+def test_round_trip_restores_tuples():
+    graph = sample_graph()
+    # Any tuple-valued field, however nested, comes back as a tuple
+    graph.edge("a", "b")["joint"]["dimensions"]["axis"] = (0.0, 1.0, 0.0)
+    restored = unpack_graph(pack_graph(graph))
+    assert restored.settings == graph.settings
+    assert restored.fingerprints() == graph.fingerprints()
+    assert restored.results() == graph.results()
+    for key, joint in restored.results().items():
+        original = graph.results()[key]
+        for field, value in original.items():
+            assert type(joint[field]) is type(value), field
+    assert restored.edge("b", "c")["layout"] == {"length": 6.0, "fingers": 0}
+
+
+def test_round_trip_keeps_pending_pairs():
+    graph = sample_graph()
+    assert unpack_graph(pack_graph(graph)).pending == ()
+    graph.pending = (("a", "c"), ("c", "b"))
+    assert unpack_graph(pack_graph(graph)).pending == (("a", "c"), ("c", "b"))
+
+
+def test_sync_edges_only_touches_changed_joints():
+    graph = sample_graph()
+    results = graph.results()
+    replacement = cross_joint()
+    results[("a", "b")] = replacement
+    del results[("b", "c")]
+    results[("a", "c")] = cross_joint()
+    assert graph.sync_edges(results) == (2, 1)
+    assert graph.edge("a", "b")["joint"] is replacement
+    assert graph.sync_edges(results) == (0, 0)
+
+
+def test_sync_nodes_drops_vanished_bodies_and_their_edges():
+    graph = sample_graph()
+    removed = graph.sync_nodes({"a": (), "b": (), "d": ()}, {"d": "token_d"})
+    assert removed == 1
+    assert set(graph.nodes) == {"a", "b", "d"}
+    assert graph.nodes["d"]["token"] == "token_d"
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "not json",
+        "[]",
+        '{"version": 99}',
+        '{"version": 1, "edges": [["a", "b", {}, null]]}',
+    ],
+)
+def test_unpack_rejects_malformed_graphs(text):
+    with pytest.raises(ValueError):
+        unpack_graph(text)
+
+
+def test_layout_record_expands_to_the_layout_segments():
+    layout = layout_fingers([18.0], [0.5], 2.0, 0.0, 1.0, 2)
+    record = layout_record(layout, 0)
+    assert record["fingers"] == 5
+    intervals = segment_intervals(record)
+    rows = layout.segments(0)
+    assert len(intervals) == len(rows)
+    for (start, end, kind), row in zip(intervals, rows, strict=True):
+        assert (start, end) == pytest.approx((layout.starts[row], layout.ends[row]))
+        assert kind == layout.kinds[row]
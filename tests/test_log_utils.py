@@ -0,0 +1,126 @@
+from collections import deque
+
+import pytest
+from adsk import core
+
+from SheetJoinery.lib.fusionAddInUtils import log_utils
+
+
+@pytest.fixture
+def logs(monkeypatch):
+    """log_utils with an empty, small ring buffer and a recorded Fusion log"""
+    monkeypatch.setattr(log_utils, "_records", deque(maxlen=4))
+    monkeypatch.setattr(log_utils, "_unflushed", 0)
+    monkeypatch.setattr(log_utils, "_FLUSH_BATCH", 100)
+    monkeypatch.setattr(log_utils, "_LOG_FILE", None)
+    monkeypatch.setattr(log_utils, "DEBUG", True)
+    monkeypatch.setattr(log_utils, "_DEFAULT_LEVEL", "DEBUG")
+    monkeypatch.setattr(log_utils, "_MODULE_LEVELS", {})
+    monkeypatch.setattr(log_utils, "_loggers", {})
+    app = core.Application.get()
+    monkeypatch.setattr(log_utils, "app", app)
+    app.log_records.clear()
+    return log_utils
+
+
+def console_lines(app):
+    return [
+        line
+        for message, _, log_type in app.log_records
+        if log_type == core.LogTypes.ConsoleLogType
+        for line in message.split("\n")
+    ]
+
+
+def test_disabled_levels_are_rebound_to_a_no_op(logs):
+    logger = logs.get_logger("SheetJoinery.commands.joinSheets.entry")
+    assert "debug" not in logger.__dict__
+    logger.set_level("WARNING")
+    assert logger.debug is logs._noop
+    assert logger.info is logs._noop
+    assert "warning" not in logger.__dict__
+    logger.debug("never formatted %s", object())
+    assert not logs._records
+
+    logger.set_level("DEBUG")
+    logger.debug("value %s", 3)
+    assert logs.recent_records()[-1].endswith(
+        "DEBUG SheetJoinery.commands.joinSheets.entry: value 3"
+    )
+
+
+def test_module_levels_match_dotted_suffixes(logs):
+    logs.set_log_level("ERROR", "joinSheets.entry")
+    entry = logs.get_logger("SheetJoinery.commands.joinSheets.entry")
+    other = logs.get_logger("SheetJoinery.lib.joinery")
+    assert entry.info is logs._noop
+    assert not entry.is_enabled_for("WARNING")
+    assert other.is_enabled_for("DEBUG")
+    logs.set_log_level("INFO")
+    assert other.debug is logs._noop
+    assert entry.info is logs._noop
+
+
+def test_formatting_is_deferred_until_flush(logs):
+    class Counted:
+        calls = 0
+
+        def __str__(self):
+            Counted.calls += 1
+            return "counted"
+
+    logger = logs.get_logger("test")
+    logger.info("object %s", Counted(), stage="layout")
+    assert Counted.calls == 0
+    logs.flush_logs()
+    assert Counted.calls == 1
+    assert console_lines(logs.app)[-1].endswith(
+        "INFO test: object counted stage='layout'"
+    )
+
+
+def test_overflow_drops_the_oldest_records_and_says_so(logs):
+    logger = logs.get_logger("test")
+    for index in range(6):
+        logger.info("record %s", index)
+    logs.flush_logs()
+    lines = console_lines(logs.app)
+    assert lines[0] == "... 2 log records dropped (buffer full)"
+    assert [line.rsplit(" ", 1)[-1] for line in lines[1:]] == ["2", "3", "4", "5"]
+
+
+def test_flush_writes_each_record_once(logs):
+    logger = logs.get_logger("test")
+    logger.info("first")
+    logs.flush_logs()
+    logs.flush_logs()
+    logger.info("second")
+    logs.flush_logs()
+    assert [line.rsplit(" ", 1)[-1] for line in console_lines(logs.app)] == [
+        "first",
+        "second",
+    ]
+
+
+def test_errors_flush_immediately_and_reach_the_log_file(logs):
+    logger = logs.get_logger("test")
+    logger.info("context")
+    logger.error("failed: %s", "boom")
+    file_records = [
+        message
+        for message, level, log_type in logs.app.log_records
+        if log_type == core.LogTypes.FileLogType
+    ]
+    assert len(file_records) == 1
+    assert file_records[0].endswith("ERROR test: failed: boom")
+    assert console_lines(logs.app)[0].endswith("INFO test: context")
+
+
+def test_batches_flush_on_their_own(logs, monkeypatch):
+    monkeypatch.setattr(logs, "_FLUSH_BATCH", 3)
+    logger = logs.get_logger("test")
+    logger.info("one")
+    logger.info("two")
+    assert not logs.app.log_records
+    logger.info("three")
+    assert len(console_lines(logs.app)) == 3
@@ -0,0 +1,85 @@
+from SheetJoinery.lib.joinery.metadata_index import (
+    DOGBONE_HINT_ATTRIBUTE,
+    JOINT_ID_ATTRIBUTE,
+    MetadataIndex,
+)
+
+
+class Face:
+    def __init__(self, name, is_valid=True):
+        self.name = name
+        self.isValid = is_valid
+
+    def __repr__(self):
+        return self.name
+
+
+FACES = {name: Face(name) for name in ("a1", "a2", "b1", "c1")}
+
+
+def record(body, face, name, value):
+    return (body, face, FACES[face], name, value)
+
+
+def sample_records():
+    return [
+        record("a", "a1", JOINT_ID_ATTRIBUTE, "j1"),
+        record("b", "b1", JOINT_ID_ATTRIBUTE, "j1"),
+        record("a", "a2", DOGBONE_HINT_ATTRIBUTE, "CornerDogbone"),
+        record("c", "c1", DOGBONE_HINT_ATTRIBUTE, "CornerDogbone"),
+        record("c", "c1", "Unrelated", "x"),
+    ]
+
+
+def test_build_maps_values_to_faces():
+    index = MetadataIndex()
+    index.build(sample_records())
+    assert index.faces(JOINT_ID_ATTRIBUTE, "j1") == [FACES["a1"], FACES["b1"]]
+    assert index.faces(DOGBONE_HINT_ATTRIBUTE, "CornerDogbone") == [
+        FACES["a2"],
+        FACES["c1"],
+    ]
+    assert index.faces(JOINT_ID_ATTRIBUTE, "missing") == []
+    assert index.values(JOINT_ID_ATTRIBUTE) == ["j1"]
+    assert index.stats()["faces"] == 4
+
+
+def test_stale_faces_are_skipped():
+    index = MetadataIndex()
+    index.build([("a", "x", Face("x", is_valid=False), JOINT_ID_ATTRIBUTE, "j1")])
+    assert index.faces(JOINT_ID_ATTRIBUTE, "j1") == []
+
+
+def test_refresh_replaces_only_dirty_bodies():
+    index = MetadataIndex()
+    index.build(sample_records())
+    index.mark_dirty(["a"])
+    assert index.is_dirty
+    # Body a lost its joint tag and b's change is ignored because b is clean
+    sweep = [
+        record("a", "a2", DOGBONE_HINT_ATTRIBUTE, "FaceDogbone"),
+        record("b", "b1", JOINT_ID_ATTRIBUTE, "j2"),
+        record("c", "c1", DOGBONE_HINT_ATTRIBUTE, "CornerDogbone"),
+    ]
+    index.refresh(sweep)
+    assert not index.is_dirty
+    assert index.faces(JOINT_ID_ATTRIBUTE, "j1") == [FACES["b1"]]
+    assert index.faces(JOINT_ID_ATTRIBUTE, "j2") == []
+    assert index.faces(DOGBONE_HINT_ATTRIBUTE, "FaceDogbone") == [FACES["a2"]]
+    assert index.faces(DOGBONE_HINT_ATTRIBUTE, "CornerDogbone") == [FACES["c1"]]
+
+
+def test_marking_before_the_first_build_is_ignored():
+    index = MetadataIndex()
+    index.mark_dirty(["a"])
+    assert not index.is_dirty
+
+
+def test_invalidate_forgets_everything():
+    index = MetadataIndex()
+    index.build(sample_records())
+    index.mark_dirty(["a"])
+    index.invalidate()
+    assert not index.is_built
+    assert not index.is_dirty
+    assert index.faces(JOINT_ID_ATTRIBUTE, "j1") == []
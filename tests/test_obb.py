@@ -0,0 +1,84 @@
+import itertools
+import math
+
+import pytest
+
+from SheetJoinery.lib.joinery.obb import (
+    covariance_matrix,
+    estimate_sheet_thickness,
+    oriented_extents,
+    symmetric_eigen_3x3,
+)
+
+
+def box_corners(length, width, thickness):
+    return list(itertools.product((0.0, length), (0.0, width), (0.0, thickness)))
+
+
+def rotate(points, yaw, pitch, roll):
+    def rotation(axis, angle):
+        c, s = math.cos(angle), math.sin(angle)
+        i, j = [index for index in range(3) if index != axis]
+        matrix = [[1.0 if row == col else 0.0 for col in range(3)] for row in range(3)]
+        matrix[i][i], matrix[i][j], matrix[j][i], matrix[j][j] = c, -s, s, c
+        return matrix
+
+    def apply(matrix, point):
+        return tuple(
+            sum(matrix[row][k] * point[k] for k in range(3)) for row in range(3)
+        )
+
+    for axis, angle in ((2, yaw), (1, pitch), (0, roll)):
+        points = [apply(rotation(axis, angle), point) for point in points]
+    return points
+
+
+def test_axis_aligned_sheet():
+    assert estimate_sheet_thickness(box_corners(60, 40, 1.8)) == pytest.approx(1.8)
+
+
+@pytest.mark.parametrize(
+    "angles",
+    [(0.0, 0.3, 0.0), (math.pi / 4, math.pi / 4, 0.0), (0.7, -1.1, 2.3), (1e-4, 0, 0)],
+)
+def test_rotated_sheet_keeps_its_thickness(angles):
+    points = rotate(box_corners(60, 40, 1.8), *angles)
+    assert estimate_sheet_thickness(points) == pytest.approx(1.8, rel=1e-6)
+    # The world-aligned box overstates it as soon as the sheet is tilted
+    if max(abs(angle) for angle in angles) > 0.1:
+        spans = [
+            max(p[axis] for p in points) - min(p[axis] for p in points)
+            for axis in range(3)
+        ]
+        assert min(spans) > 2.0
+
+
+def test_extents_are_sorted_by_variance():
+    extents, axes = oriented_extents(rotate(box_corners(60, 40, 1.8), 0.5, 0.2, 0.1))
+    assert extents == pytest.approx([60, 40, 1.8], rel=1e-6)
+    for axis in axes:
+        assert math.hypot(*axis) == pytest.approx(1.0)
+
+
+def test_eigen_decomposition_of_a_diagonal_matrix():
+    values, vectors = symmetric_eigen_3x3([[1.0, 0, 0], [0, 9.0, 0], [0, 0, 4.0]])
+    assert values == [9.0, 4.0, 1.0]
+    assert [abs(component) for component in vectors[0]] == [0.0, 1.0, 0.0]
+
+
+def test_covariance_of_a_line():
+    matrix = covariance_matrix([(0, 0, 0), (2, 0, 0)])
+    assert matrix == [[1.0, 0.0, 0.0], [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]
+
+
+def test_too_few_points():
+    assert estimate_sheet_thickness([]) is None
+    assert estimate_sheet_thickness([(0, 0, 0), (1, 0, 0), (0, 1, 0)]) is None
+
+
+def test_flat_and_collapsed_inputs_have_no_thickness():
+    flat = rotate([(0, 0, 0), (5, 0, 0), (5, 3, 0), (0, 3, 0)], 0.4, 0.9, 0.0)
+    assert estimate_sheet_thickness(flat) == pytest.approx(0.0, abs=1e-9)
+    line = [(float(i), 2.0 * i, 0.0) for i in range(5)]
+    assert estimate_sheet_thickness(line) == pytest.approx(0.0, abs=1e-9)
+    assert estimate_sheet_thickness([(1.0, 2.0, 3.0)] * 6) == 0.0
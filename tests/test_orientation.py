@@ -0,0 +1,50 @@
+import math
+
+from SheetJoinery.lib.joinery.orientation import (
+    canonical_normal,
+    filter_parallel_pairs,
+    normal_bucket,
+    plane_offset,
+)
+
+TOLERANCE = math.radians(1.0)
+
+
+def test_opposite_normals_share_a_direction():
+    assert canonical_normal((0.0, 0.0, -1.0)) == (0.0, 0.0, 1.0)
+    assert canonical_normal((0.0, 1.0, 0.0)) == (0.0, 1.0, 0.0)
+    assert normal_bucket((0.0, 0.0, -1.0), TOLERANCE) == normal_bucket(
+        (0, 0, 1), TOLERANCE
+    )
+
+
+def test_nearly_parallel_normals_share_a_bucket():
+    tilt = math.radians(0.1)
+    tilted = (math.sin(tilt), 0.0, math.cos(tilt))
+    assert normal_bucket(tilted, TOLERANCE) == normal_bucket((0, 0, 1), TOLERANCE)
+
+
+def test_perpendicular_normals_do_not_share_a_bucket():
+    assert normal_bucket((1, 0, 0), TOLERANCE) != normal_bucket((0, 0, 1), TOLERANCE)
+
+
+def test_plane_offset_is_measured_along_the_canonical_normal():
+    assert plane_offset((0, 0, -1), (3.0, -1.0, 2.2)) == 2.2
+    assert plane_offset((0, 0, 1), (3.0, -1.0, 2.2)) == 2.2
+    diagonal = (math.sqrt(0.5), math.sqrt(0.5), 0.0)
+    assert math.isclose(plane_offset(diagonal, (1.0, 1.0, 5.0)), math.sqrt(2.0))
+
+
+def test_filter_keeps_crossing_and_coplanar_pairs():
+    z = normal_bucket((0, 0, 1), TOLERANCE)
+    x = normal_bucket((1, 0, 0), TOLERANCE)
+    buckets = [z, z, x, z, None]
+    offsets = [0.15, 10.15, 2.0, 0.15, 0.0]
+    thicknesses = [0.3, 0.3, 0.3, 0.3, None]
+    pairs = [(0, 1), (0, 2), (0, 3), (0, 4), (4, 0)]
+    kept, rejected, coplanar = filter_parallel_pairs(
+        pairs, buckets, offsets, thicknesses
+    )
+    # 0-1 are stacked shelves, 0-3 lie in one plane, body 4 has no normal
+    assert kept == [(0, 2), (0, 3), (0, 4), (4, 0)]
+    assert (rejected, coplanar) == (1, 1)
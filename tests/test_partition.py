@@ -0,0 +1,65 @@
+import math
+
+import pytest
+
+from SheetJoinery.lib.joinery.partition import (
+    is_axis_permutation,
+    place_joint,
+    transform_bounds,
+)
+
+IDENTITY = (1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1)
+
+
+def rotation_z(degrees, translation=(0.0, 0.0, 0.0)):
+    c = math.cos(math.radians(degrees))
+    s = math.sin(math.radians(degrees))
+    x, y, z = translation
+    return (c, -s, 0.0, x, s, c, 0.0, y, 0.0, 0.0, 1.0, z, 0.0, 0.0, 0.0, 1.0)
+
+
+@pytest.mark.parametrize("degrees", [0, 90, 180, 270, -90])
+def test_quarter_turns_are_axis_permutations(degrees):
+    assert is_axis_permutation(rotation_z(degrees))
+
+
+def test_mirror_is_an_axis_permutation():
+    assert is_axis_permutation((-1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1))
+
+
+@pytest.mark.parametrize("degrees", [30, 45, 89])
+def test_other_angles_are_not(degrees):
+    assert not is_axis_permutation(rotation_z(degrees))
+
+
+def test_scaling_is_not_an_axis_permutation():
+    assert not is_axis_permutation((2, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1))
+
+
+def test_transform_bounds_translates_and_rotates():
+    bounds = (0.0, 0.0, 0.0, 4.0, 1.0, 2.0)
+    assert transform_bounds(bounds, IDENTITY) == bounds
+    moved = transform_bounds(bounds, rotation_z(90, (10.0, 0.0, 5.0)))
+    assert moved == pytest.approx((9.0, 0.0, 5.0, 10.0, 4.0, 7.0))
+
+
+def test_place_joint_recomputes_extents_only():
+    info = {
+        "type": "cross-joint",
+        "bounds": (0.0, 0.0, 0.0, 4.0, 1.0, 2.0),
+        "dimensions": {
+            "width": 4.0,
+            "height": 1.0,
+            "depth": 2.0,
+            "volume": 8.0,
+            "area": 28.0,
+        },
+        "thickness": 1.0,
+    }
+    placed = place_joint(info, rotation_z(90, (10.0, 0.0, 0.0)))
+    assert placed["dimensions"]["width"] == pytest.approx(1.0)
+    assert placed["dimensions"]["height"] == pytest.approx(4.0)
+    assert placed["dimensions"]["volume"] == 8.0
+    assert placed["type"] == "cross-joint"
+    # The cached local joint is left untouched
+    assert info["bounds"] == (0.0, 0.0, 0.0, 4.0, 1.0, 2.0)
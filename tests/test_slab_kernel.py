@@ -0,0 +1,76 @@
+import pytest
+
+from SheetJoinery.lib.joinery.slab_kernel import (
+    convex_hull_2d,
+    intersect_slabs,
+    make_slab,
+    polyhedron_bounds,
+    slab_polyhedron,
+)
+
+
+def box_slab(min_point, max_point, flip=False):
+    """Slab of an axis-aligned box extruded along z, built from its top or bottom face"""
+    x0, y0, z0 = min_point
+    x1, y1, z1 = max_point
+    if flip:
+        # Top face with its outward normal; the bottom face lies behind it
+        base = [(x0, y0, z1), (x1, y0, z1), (x1, y1, z1), (x0, y1, z1)]
+        return make_slab(base, (0.0, 0.0, 1.0), z0 - z1)
+    base = [(x0, y0, z0), (x1, y0, z0), (x1, y1, z0), (x0, y1, z0)]
+    return make_slab(base, (0.0, 0.0, 1.0), z1 - z0)
+
+
+def upright_slab(x0, x1, size):
+    """Slab of a sheet standing in the yz plane between x0 and x1, built from its x1 face"""
+    base = [(x1, 0.0, 0.0), (x1, size, 0.0), (x1, size, size), (x1, 0.0, size)]
+    return make_slab(base, (1.0, 0.0, 0.0), x0 - x1)
+
+
+@pytest.mark.parametrize("flip", [False, True])
+def test_slab_covers_the_body(flip):
+    slab = box_slab((0, 0, 1.0), (4, 4, 1.3), flip)
+    assert slab["thickness"] == pytest.approx(0.3)
+    assert polyhedron_bounds(slab_polyhedron(slab)) == pytest.approx(
+        (0, 0, 1.0, 4, 4, 1.3)
+    )
+
+
+def test_zero_thickness_or_degenerate_outline_is_not_a_slab():
+    square = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)]
+    assert make_slab(square, (0, 0, 1), 0.0) is None
+    assert make_slab(square[:2], (0, 0, 1), 1.0) is None
+
+
+def test_concave_outline_is_not_a_slab():
+    l_shape = [(0, 0, 0), (2, 0, 0), (2, 1, 0), (1, 1, 0), (1, 2, 0), (0, 2, 0)]
+    assert make_slab(l_shape, (0, 0, 1), 0.5) is None
+
+
+def test_convex_hull_drops_interior_and_collinear_points():
+    points = [(0, 0), (1, 0), (2, 0), (2, 2), (0, 2), (1, 1)]
+    assert convex_hull_2d(points) == [(0, 0), (2, 0), (2, 2), (0, 2)]
+
+
+@pytest.mark.parametrize("flip", [False, True])
+def test_cross_joint(flip):
+    shelf = box_slab((0, 0, 2.0), (6, 6, 2.3), flip)
+    upright = upright_slab(2.0, 2.3, 6.0)
+    result = intersect_slabs(upright, shelf)
+    assert result["bounds"] == pytest.approx((2.0, 0, 2.0, 2.3, 6, 2.3))
+    assert result["volume"] == pytest.approx(0.3 * 6 * 0.3)
+    assert result["area"] == pytest.approx(2 * (0.3 * 6 * 2 + 0.3 * 0.3))
+
+
+def test_separate_slabs_do_not_intersect():
+    assert (
+        intersect_slabs(box_slab((0, 0, 0), (1, 1, 1)), box_slab((2, 0, 0), (3, 1, 1)))
+        is None
+    )
+
+
+def test_touching_slabs_do_not_intersect():
+    assert (
+        intersect_slabs(box_slab((0, 0, 0), (1, 1, 1)), box_slab((0, 0, 1), (1, 1, 2)))
+        is None
+    )
@@ -0,0 +1,74 @@
+import pytest
+
+from SheetJoinery.lib.joinery.templates import TemplateCache, box_center, template_key
+
+QUANTUM = 1e-5
+
+
+def builder(built):
+    def build(name):
+        def make():
+            built.append(name)
+            return name
+
+        return make
+
+    return build
+
+
+def test_template_key_ignores_position_and_noise():
+    key = template_key((0.0, 0.0, 0.0, 2.0, 0.3, 1.0), QUANTUM)
+    assert template_key((5.0, -3.0, 7.0, 7.0, -2.7, 8.0), QUANTUM) == key
+    assert template_key((0.0, 0.0, 0.0, 2.0 + 1e-9, 0.3, 1.0), QUANTUM) == key
+
+
+def test_template_key_separates_sizes_and_orientations():
+    key = template_key((0.0, 0.0, 0.0, 2.0, 0.3, 1.0), QUANTUM)
+    assert template_key((0.0, 0.0, 0.0, 2.1, 0.3, 1.0), QUANTUM) != key
+    assert template_key((0.0, 0.0, 0.0, 0.3, 2.0, 1.0), QUANTUM) != key
+
+
+def test_box_center():
+    assert box_center((0, 0, 0, 2, 4, 6)) == (1.0, 2.0, 3.0)
+    assert box_center((-1, -1, -1, 1, 1, 1)) == (0.0, 0.0, 0.0)
+
+
+def test_equal_sizes_share_one_template():
+    built = []
+    build = builder(built)
+    cache = TemplateCache(8)
+    for offset in range(5):
+        bounds = (offset, 0.0, 0.0, offset + 2.0, 0.3, 1.0)
+        assert cache.get(template_key(bounds, QUANTUM), build("finger")) == "finger"
+    slot = template_key((0.0, 0.0, 0.0, 1.5, 0.3, 1.0), QUANTUM)
+    assert cache.get(slot, build("slot")) == "slot"
+
+    assert built == ["finger", "slot"]
+    stats = cache.stats()
+    assert (stats["templates"], stats["hits"], stats["misses"]) == (2, 4, 2)
+    assert stats["hit_rate"] == pytest.approx(4 / 6)
+
+
+def test_least_recently_used_templates_are_evicted():
+    built = []
+    build = builder(built)
+    cache = TemplateCache(2)
+    cache.get("a", build("a"))
+    cache.get("b", build("b"))
+    cache.get("a", build("a"))
+    cache.get("c", build("c"))
+    assert cache.stats()["evictions"] == 1
+    # b was the least recently used
+    cache.get("a", build("a"))
+    cache.get("b", build("b"))
+    assert built == ["a", "b", "c", "b"]
+    assert cache.stats()["templates"] == 2
+
+
+def test_clear_and_empty_stats():
+    cache = TemplateCache(4)
+    assert cache.stats()["hit_rate"] == 0.0
+    cache.get("a", lambda: "a")
+    cache.clear()
+    assert cache.stats()["templates"] == 0
+    assert cache.get("a", lambda: "rebuilt") == "rebuilt"
@@ -0,0 +1,95 @@
+import pytest
+
+from SheetJoinery.lib.joinery.token_index import TokenIndex
+
+
+class Entity:
+    def __init__(self, name):
+        self.name = name
+        self.isValid = True
+
+
+def no_resolve(_token):
+    return None
+
+
+def resolver(entities):
+    calls = []
+
+    def resolve(token):
+        calls.append(token)
+        return entities.get(token)
+
+    return resolve, calls
+
+
+def test_lookups_after_the_first_are_hits():
+    body = Entity("body")
+    resolve, calls = resolver({"t1": body})
+    index = TokenIndex()
+    assert index.get("t1", resolve) is body
+    assert index.get("t1", resolve) is body
+    assert index.get("t1", resolve) is body
+    assert calls == ["t1"]
+    assert index.stats() == {"entries": 1, "hits": 2, "misses": 1, "invalidations": 0}
+
+
+def test_invalid_entities_are_resolved_again():
+    old, new = Entity("old"), Entity("new")
+    index = TokenIndex()
+    index.add("t1", old)
+    old.isValid = False
+    resolve, calls = resolver({"t1": new})
+    assert index.get("t1", resolve) is new
+    assert calls == ["t1"]
+
+
+def test_unresolved_tokens_fall_back_to_one_traversal():
+    entities = {f"t{i}": Entity(f"body{i}") for i in range(5)}
+    traversals = []
+
+    def populate():
+        traversals.append(1)
+        return entities.items()
+
+    index = TokenIndex()
+    assert index.get("t3", no_resolve, populate) is entities["t3"]
+    assert len(index) == 5
+    # The traversal indexed the other bodies too
+    assert index.get("t0", no_resolve, populate) is entities["t0"]
+    assert index.get("t4", no_resolve, populate) is entities["t4"]
+    assert len(traversals) == 1
+
+
+def test_unknown_tokens_are_not_indexed():
+    index = TokenIndex()
+    assert index.get("gone", no_resolve) is None
+    assert index.get("gone", no_resolve, list) is None
+    assert len(index) == 0
+    assert index.stats()["misses"] == 2
+
+
+@pytest.mark.parametrize("empty_first", [False, True])
+def test_invalidate_forgets_every_entry(empty_first):
+    index = TokenIndex()
+    if empty_first:
+        index.invalidate()
+        assert index.invalidations == 0
+    index.add("t1", Entity("a"))
+    index.add("t2", Entity("b"))
+    index.invalidate()
+    assert len(index) == 0
+    assert index.invalidations == 1
+
+    replacement = Entity("c")
+    resolve, calls = resolver({"t1": replacement})
+    assert index.get("t1", resolve) is replacement
+    assert calls == ["t1"]
+
+
+def test_discard():
+    index = TokenIndex()
+    index.add("t1", Entity("a"))
+    index.discard("t1")
+    index.discard("missing")
+    assert len(index) == 0
@@ -0,0 +1,130 @@
+import json
+import random
+
+import pytest
+
+from SheetJoinery.lib.fusionAddInUtils import trace_utils
+
+
+@pytest.fixture
+def tracing(monkeypatch):
+    """trace_utils with tracing enabled and nothing recorded yet"""
+    monkeypatch.setattr(trace_utils, "_enabled", True)
+    trace_utils.reset_tracing()
+    yield trace_utils
+    trace_utils.reset_tracing()
+
+
+def test_disabled_tracing_records_nothing(tracing):
+    tracing.disable_tracing()
+    assert tracing.span("idle") is tracing._NULL_SPAN
+    with tracing.span("idle"):
+        pass
+
+    @tracing.traced()
+    def work():
+        return 7
+
+    assert work() == 7
+    assert tracing.span_stats() == {}
+
+
+def test_nested_spans_are_recorded_inside_their_parent(tracing):
+    with tracing.span("outer", bodies=3):
+        with tracing.span("inner"):
+            pass
+        with tracing.span("inner"):
+            pass
+
+    events = {}
+    for name, start, duration, _, args in tracing._events:
+        events.setdefault(name, []).append((start, start + duration, args))
+    # Spans are recorded when they end, so children come first
+    assert [event[0] for event in tracing._events] == ["inner", "inner", "outer"]
+    ((outer_start, outer_end, outer_args),) = events["outer"]
+    assert outer_args == {"bodies": 3}
+    for start, end, _ in events["inner"]:
+        assert outer_start <= start <= end <= outer_end
+    assert tracing.span_stats()["inner"]["count"] == 2
+
+
+def test_traced_uses_the_qualified_name_and_records_on_error(tracing):
+    @tracing.traced()
+    def compute():
+        raise ValueError("failed")
+
+    @tracing.traced("layout")
+    def layout():
+        return "done"
+
+    with pytest.raises(ValueError):
+        compute()
+    assert layout() == "done"
+    stats = tracing.span_stats()
+    assert set(stats) == {compute.__qualname__, "layout"}
+
+
+def test_aggregates_stay_exact_while_samples_are_capped(tracing, monkeypatch):
+    monkeypatch.setattr(tracing, "_MAX_SAMPLES", 10)
+    for duration in range(1, 1001):
+        tracing._record("pair", 0, duration * 1000, {})
+    count, total, longest, samples = tracing._durations["pair"]
+    assert count == 1000
+    assert total == sum(range(1, 1001)) * 1000
+    assert longest == 1000 * 1000
+    assert len(samples) == 10
+    assert set(samples) <= {duration * 1000 for duration in range(1, 1001)}
+
+    stats = tracing.span_stats()["pair"]
+    assert stats["count"] == 1000
+    assert stats["mean_ms"] == pytest.approx(0.5005)
+    assert stats["max_ms"] == 1.0
+    assert stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"] <= stats["max_ms"]
+
+
+def test_reservoir_keeps_a_uniform_sample(tracing, monkeypatch):
+    monkeypatch.setattr(tracing, "_MAX_SAMPLES", 200)
+    monkeypatch.setattr(tracing, "random", random.Random(5))
+    for duration in range(20_000):
+        tracing._record("pair", 0, duration, {})
+    samples = tracing._durations["pair"][3]
+    # A sample of the whole run, not just its first or last durations
+    assert sum(sample < 10_000 for sample in samples) == pytest.approx(100, abs=40)
+
+
+def test_events_beyond_the_cap_are_counted_as_dropped(tracing, monkeypatch, tmp_path):
+    monkeypatch.setattr(tracing, "_MAX_EVENTS", 3)
+    for _ in range(5):
+        with tracing.span("chunk"):
+            pass
+    assert tracing.span_stats()["chunk"]["count"] == 5
+    assert tracing.export_chrome_trace(str(tmp_path / "trace.json")) == 3
+    data = json.loads((tmp_path / "trace.json").read_text(encoding="utf-8"))
+    assert data["otherData"] == {"droppedEvents": 2}
+
+
+def test_chrome_trace_format(tracing, tmp_path):
+    with tracing.span("compute", bodies=12):
+        pass
+    path = tmp_path / "trace.json"
+    assert tracing.export_chrome_trace(str(path)) == 1
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["displayTimeUnit"] == "ms"
+    (event,) = data["traceEvents"]
+    assert event["name"] == "compute"
+    assert event["ph"] == "X"
+    assert event["args"] == {"bodies": "12"}
+    assert event["ts"] >= 0.0
+    assert event["dur"] >= 0.0
+    assert isinstance(event["pid"], int)
+    assert isinstance(event["tid"], int)
+
+
+def test_reset_discards_everything(tracing):
+    with tracing.span("compute"):
+        pass
+    tracing.reset_tracing()
+    assert tracing.span_stats() == {}
+    assert tracing._events == []
+    assert tracing._dropped_events == 0
+    assert "compute" not in tracing.format_span_stats()
@@ -0,0 +1,45 @@
+import threading
+
+from SheetJoinery.lib.joinery.workers import WorkerPool
+
+
+def test_pool_starts_on_first_submit():
+    pool = WorkerPool(1)
+    assert not pool.is_running
+    try:
+        future = pool.submit(threading.current_thread)
+        assert pool.is_running
+        worker = future.result(timeout=5)
+        assert worker is not threading.current_thread()
+        assert worker.name.startswith("joinery")
+    finally:
+        pool.shutdown()
+
+
+def test_results_and_errors_come_back_through_the_future():
+    pool = WorkerPool(1)
+    try:
+        assert pool.submit(sum, [1, 2, 3]).result(timeout=5) == 6
+        failed = pool.submit(int, "not a number")
+        assert isinstance(failed.exception(timeout=5), ValueError)
+        assert pool.stats() == {"workers": 1, "submitted": 2}
+    finally:
+        pool.shutdown()
+
+
+def test_shutdown_drops_queued_jobs_and_allows_a_restart():
+    pool = WorkerPool(1)
+    release = threading.Event()
+    running = pool.submit(release.wait, 5)
+    queued = pool.submit(sum, [1])
+    pool.shutdown()
+    assert not pool.is_running
+    release.set()
+    assert running.result(timeout=5)
+    assert queued.cancelled()
+
+    try:
+        assert pool.submit(sum, [2]).result(timeout=5) == 2
+    finally:
+        pool.shutdown()
+    pool.shutdown()
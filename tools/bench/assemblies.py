@@ -0,0 +1,216 @@
+"""
+Parametric synthetic furniture for benchmarking the Join Sheets pipeline
+
+Each generator fills a headless design with repeated furniture units until
+the requested number of sheet bodies exists. Units are tiled on a grid with
+clearance between them, so joints only occur inside a unit. Lengths are in
+centimetres.
+"""
+
+from adsk import headless
+
+THICKNESS = 1.8
+UNIT_CLEARANCE = 10.0
+UNITS_PER_ROW = 10
+
+
+def _tile_origin(unit_index, unit_size):
+    """Offset of a unit on the layout grid"""
+    column = unit_index % UNITS_PER_ROW
+    row = unit_index // UNITS_PER_ROW
+    return (
+        column * (unit_size[0] + UNIT_CLEARANCE),
+        row * (unit_size[1] + UNIT_CLEARANCE),
+        0.0,
+    )
+
+
+def _fill(design, body_count, unit_size, unit_boxes):
+    """
+    Add boxes from unit_boxes(origin) unit after unit until body_count bodies
+    exist. Returns the list of bodies.
+    """
+    bodies = []
+    unit_index = 0
+    while len(bodies) < body_count:
+        origin = _tile_origin(unit_index, unit_size)
+        for name, min_point, max_point in unit_boxes(origin):
+            if len(bodies) == body_count:
+                break
+            bodies.append(
+                headless.add_box(design, f"u{unit_index}_{name}", min_point, max_point)
+            )
+        unit_index += 1
+    return bodies
+
+
+def _box(origin, min_point, max_point):
+    return (
+        tuple(o + v for o, v in zip(origin, min_point, strict=True)),
+        tuple(o + v for o, v in zip(origin, max_point, strict=True)),
+    )
+
+
+def cabinet_carcasses(
+    design, body_count, width=60.0, depth=56.0, height=72.0, shelves=2
+):
+    """Base cabinets: two sides, bottom, top, back and adjustable shelves"""
+    t = THICKNESS
+
+    def unit(origin):
+        yield ("side_left", *_box(origin, (0, 0, 0), (t, depth, height)))
+        yield ("bottom", *_box(origin, (0, 0, 0), (width, depth, t)))
+        yield ("side_right", *_box(origin, (width - t, 0, 0), (width, depth, height)))
+        yield ("top", *_box(origin, (0, 0, height - t), (width, depth, height)))
+        yield ("back", *_box(origin, (0, depth - t, 0), (width, depth, height)))
+        for shelf in range(shelves):
+            z = height * (shelf + 1) / (shelves + 1)
+            yield (f"shelf_{shelf}", *_box(origin, (0, 0, z), (width, depth, z + t)))
+
+    return _fill(design, body_count, (width, depth), unit)
+
+
+def shelf_grids(design, body_count, columns=3, rows=3, cell=35.0, depth=30.0):
+    """Bookcase grids: full-width shelves crossing full-height uprights"""
+    t = THICKNESS
+    width = columns * cell + t
+    height = rows * cell + t
+
+    def unit(origin):
+        # Interleaved so any prefix of a unit already contains crossings
+        for index in range(max(rows, columns) + 1):
+            if index <= rows:
+                z = index * cell
+                yield (
+                    f"shelf_{index}",
+                    *_box(origin, (0, 0, z), (width, depth, z + t)),
+                )
+            if index <= columns:
+                x = index * cell
+                yield (
+                    f"upright_{index}",
+                    *_box(origin, (x, 0, 0), (x + t, depth, height)),
+                )
+
+    return _fill(design, body_count, (width, depth), unit)
+
+
+def egg_crate_partitions(design, body_count, slats=4, pitch=10.0, height=8.0):
+    """Drawer inserts: two families of vertical slats crossing in half-laps"""
+    t = THICKNESS
+    size = (slats + 1) * pitch
+
+    def unit(origin):
+        for slat in range(slats):
+            offset = (slat + 1) * pitch
+            yield (
+                f"slat_x_{slat}",
+                *_box(origin, (offset, 0, 0), (offset + t, size, height)),
+            )
+            yield (
+                f"slat_y_{slat}",
+                *_box(origin, (0, offset, 0), (size, offset + t, height)),
+            )
+
+    return _fill(design, body_count, (size, size), unit)
+
+
+def drawer_boxes(design, body_count, width=45.0, depth=50.0, height=15.0):
+    """Drawer boxes: front, back and sides standing on a bottom panel"""
+    t = THICKNESS
+
+    def unit(origin):
+        yield ("bottom", *_box(origin, (0, 0, 0), (width, depth, t)))
+        yield ("front", *_box(origin, (0, 0, 0), (width, t, height)))
+        yield ("back", *_box(origin, (0, depth - t, 0), (width, depth, height)))
+        yield ("side_left", *_box(origin, (0, 0, 0), (t, depth, height)))
+        yield ("side_right", *_box(origin, (width - t, 0, 0), (width, depth, height)))
+
+    return _fill(design, body_count, (width, depth), unit)
+
+
+def shelving_bays(
+    design, body_count, bays=3, width=80.0, depth=40.0, height=180.0, shelves=3
+):
+    """
+    Shelving runs: bays standing side by side with their side panels back to
+    back, and a worktop made of one coplanar piece per bay. Most candidate
+    pairs between bays are parallel panels.
+    """
+    t = THICKNESS
+    run_width = bays * width
+
+    def unit(origin):
+        for bay in range(bays):
+            x = bay * width
+            yield (
+                f"bay{bay}_side_left",
+                *_box(origin, (x, 0, 0), (x + t, depth, height)),
+            )
+            yield (
+                f"bay{bay}_side_right",
+                *_box(origin, (x + width - t, 0, 0), (x + width, depth, height)),
+            )
+            yield (
+                f"bay{bay}_worktop",
+                *_box(origin, (x, 0, height), (x + width, depth, height + t)),
+            )
+            for shelf in range(shelves):
+                z = height * shelf / shelves
+                yield (
+                    f"bay{bay}_shelf_{shelf}",
+                    *_box(origin, (x, 0, z), (x + width, depth, z + t)),
+                )
+
+    return _fill(design, body_count, (run_width, depth), unit)
+
+
+def kitchen_units(design, body_count, width=60.0, depth=56.0, height=72.0, shelves=2):
+    """
+    Base cabinets as occurrences of one cabinet component: the carcass is
+    modelled once and every unit is a translated instance of it. Bodies are
+    the occurrences' proxies.
+    """
+    t = THICKNESS
+    component, occurrence = headless.add_component(design, "cabinet")
+    carcass = [
+        ("side_left", (0, 0, 0), (t, depth, height)),
+        ("bottom", (0, 0, 0), (width, depth, t)),
+        ("side_right", (width - t, 0, 0), (width, depth, height)),
+        ("top", (0, 0, height - t), (width, depth, height)),
+        ("back", (0, depth - t, 0), (width, depth, height)),
+    ]
+    for shelf in range(shelves):
+        z = height * (shelf + 1) / (shelves + 1)
+        carcass.append((f"shelf_{shelf}", (0, 0, z), (width, depth, z + t)))
+    for name, min_point, max_point in carcass:
+        headless.add_box(component, name, min_point, max_point)
+
+    # The first unit is the component's own occurrence at the grid origin
+    bodies = list(occurrence.bRepBodies)[:body_count]
+    unit_index = 1
+    while len(bodies) < body_count:
+        occurrence = design.rootComponent.occurrences.addExistingComponent(
+            component, headless.translation(*_tile_origin(unit_index, (width, depth)))
+        )
+        bodies.extend(list(occurrence.bRepBodies)[: body_count - len(bodies)])
+        unit_index += 1
+    return bodies
+
+
+SCENARIOS = {
+    "cabinets": cabinet_carcasses,
+    "shelf_grid": shelf_grids,
+    "egg_crate": egg_crate_partitions,
+    "drawers": drawer_boxes,
+    "shelving": shelving_bays,
+    "kitchen": kitchen_units,
+}
+
+
+def build(scenario, body_count):
+    """Create a fresh active design populated with the scenario's bodies"""
+    headless.reset()
+    design = headless.new_design()
+    bodies = SCENARIOS[scenario](design, body_count)
+    return design, bodies
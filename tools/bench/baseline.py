@@ -0,0 +1,284 @@
+"""
+Benchmark baselines and the performance regression gate
+
+Baselines are stored as one versioned JSON file per scenario under
+tools/bench/baselines, holding raw timing samples, peak traced memory and
+kernel call counts per size together with metadata about the machine that
+recorded them.
+
+Usage:
+    python tools/bench/baseline.py record [--scenarios ...] [--sizes ...] [--repeat 7]
+    python tools/bench/baseline.py check [--latency-threshold 0.15]
+        [--memory-threshold 0.10] [--boolean-threshold 0.0]
+
+check reruns every stored scenario and size and exits non-zero when a
+metric regressed beyond its threshold. Latency counts as regressed only
+when the median grew by more than the threshold and the confidence
+intervals of the two medians do not overlap, so noisy runs do not fail the
+gate on their own.
+"""
+
+import argparse
+import datetime
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+
+import run_benchmarks
+
+FORMAT_VERSION = 1
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+DEFAULT_SIZES = (10, 200, 1000)
+DEFAULT_REPEAT = 7
+DEFAULT_LATENCY_THRESHOLD = 0.15
+DEFAULT_MEMORY_THRESHOLD = 0.10
+DEFAULT_BOOLEAN_THRESHOLD = 0.0
+
+
+def machine_metadata():
+    """Describe the machine and interpreter producing the measurements"""
+    return {
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+    }
+
+
+def median_confidence_interval(samples, z=1.96):
+    """
+    Distribution-free confidence interval of the median from order
+    statistics (normal approximation to the binomial). With few samples the
+    interval widens to the full sample range.
+    """
+    ordered = sorted(samples)
+    count = len(ordered)
+    half_width = z * math.sqrt(count) / 2.0
+    lower = max(0, math.floor(count / 2.0 - half_width))
+    upper = min(count - 1, math.ceil(count / 2.0 + half_width) - 1)
+    return ordered[lower], ordered[upper]
+
+
+def baseline_path(scenario):
+    return os.path.join(BASELINE_DIR, f"{scenario}.json")
+
+
+def load_baseline(scenario):
+    """Load a scenario baseline; returns None when none is stored."""
+    path = baseline_path(scenario)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+    if baseline.get("format_version") != FORMAT_VERSION:
+        raise ValueError(
+            f"{path} has format version {baseline.get('format_version')}, "
+            f"expected {FORMAT_VERSION}; re-record it with 'baseline.py record'"
+        )
+    return baseline
+
+
+def save_baseline(scenario, results):
+    """Write the measurements of one scenario as its new baseline"""
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+    baseline = {
+        "format_version": FORMAT_VERSION,
+        "scenario": scenario,
+        "recorded_at": datetime.datetime.now(datetime.UTC).isoformat(
+            timespec="seconds"
+        ),
+        "machine": machine_metadata(),
+        "sizes": {str(result["bodies"]): _measurements(result) for result in results},
+    }
+    with open(baseline_path(scenario), "w", encoding="utf-8") as baseline_file:
+        json.dump(baseline, baseline_file, indent=2)
+        baseline_file.write("\n")
+    return baseline
+
+
+def _measurements(result):
+    return {
+        "wall_samples_s": result["wall_samples_s"],
+        "peak_mb": result["peak_mb"],
+        "boolean_calls": result["boolean_calls"],
+        "copy_calls": result["copy_calls"],
+        "candidate_pairs": result["candidate_pairs"],
+        "intersections": result["intersections"],
+    }
+
+
+def compare(baseline, current, latency_threshold, memory_threshold, boolean_threshold):
+    """
+    Compare current measurements of one size against its baseline.
+    Returns a list of (metric, description, regressed) tuples.
+    """
+    findings = []
+
+    base_median = statistics.median(baseline["wall_samples_s"])
+    current_median = statistics.median(current["wall_samples_s"])
+    base_low, base_high = median_confidence_interval(baseline["wall_samples_s"])
+    current_low, current_high = median_confidence_interval(current["wall_samples_s"])
+    change = _relative_change(base_median, current_median)
+    regressed = change > latency_threshold and current_low > base_high
+    findings.append(
+        (
+            "latency",
+            f"median {base_median * 1000:.2f} -> {current_median * 1000:.2f} ms ({change:+.1%}), "
+            f"CI [{base_low * 1000:.2f}, {base_high * 1000:.2f}] -> "
+            f"[{current_low * 1000:.2f}, {current_high * 1000:.2f}] ms",
+            regressed,
+        )
+    )
+
+    change = _relative_change(baseline["peak_mb"], current["peak_mb"])
+    findings.append(
+        (
+            "memory",
+            f"peak {baseline['peak_mb']:.2f} -> {current['peak_mb']:.2f} MB ({change:+.1%})",
+            change > memory_threshold,
+        )
+    )
+
+    for metric in ("boolean_calls", "copy_calls"):
+        change = _relative_change(baseline[metric], current[metric])
+        findings.append(
+            (
+                metric,
+                f"{baseline[metric]} -> {current[metric]}",
+                current[metric] > baseline[metric] and change > boolean_threshold,
+            )
+        )
+
+    if current["intersections"] != baseline["intersections"]:
+        findings.append(
+            (
+                "intersections",
+                f"{baseline['intersections']} -> {current['intersections']} (results changed)",
+                False,
+            )
+        )
+    return findings
+
+
+def _relative_change(before, after):
+    if before == 0:
+        return 0.0 if after == 0 else math.inf
+    return (after - before) / before
+
+
+def _run_scenario(scenario, sizes, repeat):
+    results = []
+    for size in sizes:
+        results.append(run_benchmarks.run_case(scenario, size, repeat))
+    return results
+
+
+def record(scenarios, sizes, repeat):
+    for scenario in scenarios:
+        results = _run_scenario(scenario, sizes, repeat)
+        save_baseline(scenario, results)
+        print(run_benchmarks.format_results(results))
+        print(f"Recorded {baseline_path(scenario)}")
+    return 0
+
+
+def check(scenarios, repeat, latency_threshold, memory_threshold, boolean_threshold):
+    machine = machine_metadata()
+    regressions = 0
+    checked = 0
+    for scenario in scenarios:
+        baseline = load_baseline(scenario)
+        if baseline is None:
+            print(f"{scenario}: no baseline stored, skipping")
+            continue
+        if baseline["machine"] != machine:
+            print(
+                f"{scenario}: baseline was recorded on a different machine, latency comparison is indicative only"
+            )
+
+        sizes = sorted(int(size) for size in baseline["sizes"])
+        for result in _run_scenario(scenario, sizes, repeat):
+            checked += 1
+            findings = compare(
+                baseline["sizes"][str(result["bodies"])],
+                _measurements(result),
+                latency_threshold,
+                memory_threshold,
+                boolean_threshold,
+            )
+            for metric, description, regressed in findings:
+                status = "REGRESSED" if regressed else "ok"
+                print(
+                    f"{scenario:<12} {result['bodies']:>6} {metric:<14} {status:<9} {description}"
+                )
+                regressions += regressed
+
+    print()
+    if not checked:
+        print("No baselines found; record them with 'baseline.py record'")
+        return 1
+    if regressions:
+        print(f"{regressions} regression(s) beyond thresholds")
+        return 1
+    print("No regressions beyond thresholds")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark baselines and regression gate"
+    )
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subcommands.add_parser(
+        "record", help="measure and store new baselines"
+    )
+    record_parser.add_argument(
+        "--sizes", default=",".join(str(size) for size in DEFAULT_SIZES)
+    )
+
+    check_parser = subcommands.add_parser(
+        "check", help="compare against stored baselines"
+    )
+    check_parser.add_argument(
+        "--latency-threshold", type=float, default=DEFAULT_LATENCY_THRESHOLD
+    )
+    check_parser.add_argument(
+        "--memory-threshold", type=float, default=DEFAULT_MEMORY_THRESHOLD
+    )
+    check_parser.add_argument(
+        "--boolean-threshold", type=float, default=DEFAULT_BOOLEAN_THRESHOLD
+    )
+
+    for subparser in (record_parser, check_parser):
+        subparser.add_argument(
+            "--scenarios", default=",".join(run_benchmarks.assemblies.SCENARIOS)
+        )
+        subparser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    options = parser.parse_args(argv)
+
+    _, futil = run_benchmarks._engine()
+    futil.set_log_level("WARNING")
+
+    scenarios = run_benchmarks._csv(options.scenarios)
+    if options.command == "record":
+        return record(
+            scenarios, run_benchmarks._csv(options.sizes, int), options.repeat
+        )
+    return check(
+        scenarios,
+        options.repeat,
+        options.latency_threshold,
+        options.memory_threshold,
+        options.boolean_threshold,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""
+Scaling benchmarks for the Join Sheets pipeline
+
+Runs the custom feature compute end to end on synthetic furniture (see
+assemblies.py) under the headless adsk stand-in and reports wall time, peak
+Python memory, pairs evaluated and finger segments laid out per scenario and size.
+
+Usage:
+    python tools/bench/run_benchmarks.py [--scenarios cabinets,egg_crate]
+        [--sizes 2,10,100] [--repeat 3] [--stages] [--json results.json]
+"""
+
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+_TOOLS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(_TOOLS_DIR, "headless"))
+
+import assemblies  # noqa: E402
+from adsk import headless  # noqa: E402
+
+DEFAULT_SIZES = (2, 10, 50, 200, 500, 1000, 2000)
+
+# QR-002: process 100 intersections in under 10 s using under 100 MB
+QR002_MIN_INTERSECTIONS = 100
+QR002_MAX_SECONDS = 10.0
+QR002_MAX_MEGABYTES = 100.0
+
+
+def _engine():
+    entry = headless.load_join_sheets()
+    from SheetJoinery.lib import fusionAddInUtils as futil
+
+    return entry, futil
+
+
+def reset_engine_state(entry):
+    """Drop every cache so each measured compute starts cold"""
+    entry.intersection_cache.clear()
+    entry.compute_snapshots.clear()
+    entry.thickness_cache.clear()
+    entry.plane_cache.clear()
+    entry.component_joint_cache.clear()
+    entry.feature_parameters_cache.clear()
+    entry.tab_templates.clear()
+    entry.last_compute_stats.clear()
+
+
+def _timed_compute(entry, feature):
+    reset_engine_state(entry)
+    gc.collect()
+    start = time.perf_counter()
+    computed = feature.compute()
+    return time.perf_counter() - start, computed
+
+
+def _peak_memory(entry, feature):
+    reset_engine_state(entry)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        feature.compute()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_case(scenario, body_count, repeat=1, stages=False):
+    """
+    Benchmark one scenario at one size.
+    Returns a dict of measurements; wall_s is the median of repeat runs.
+    """
+    entry, futil = _engine()
+    design, bodies = assemblies.build(scenario, body_count)
+    feature = headless.add_join_feature(
+        design, bodies, tab_width=3.0, tolerance=0.01, compute=False
+    )
+    kernel = headless.fusion.TemporaryBRepManager.get()
+
+    if stages:
+        futil.reset_tracing()
+        futil.enable_tracing()
+    samples = []
+    computed = False
+    for _ in range(repeat):
+        kernel.reset_counters()
+        seconds, computed = _timed_compute(entry, feature)
+        samples.append(seconds)
+    if stages:
+        futil.disable_tracing()
+    counters = headless.kernel_counters()
+    stats = dict(entry.last_compute_stats)
+
+    result = {
+        "scenario": scenario,
+        "bodies": len(bodies),
+        "computed": computed,
+        "wall_s": statistics.median(samples),
+        "wall_samples_s": samples,
+        "peak_mb": _peak_memory(entry, feature) / (1024 * 1024),
+        "candidate_pairs": stats.get("candidate_pairs", 0),
+        "rejected_pairs": stats.get("rejected_pairs", 0),
+        "parallel_pairs": stats.get("parallel_pairs", 0),
+        "intersections": stats.get("intersections", 0),
+        "segments": stats.get("segments", 0),
+        "kernel_pairs": stats.get("kernel", 0),
+        "boolean_pairs": stats.get("boolean", 0),
+        "boolean_calls": counters["boolean_calls"],
+        "target_booleans_saved": stats.get("target_booleans_saved", 0),
+        "copy_calls": counters["copy_calls"],
+    }
+    if stages:
+        result["stages"] = {
+            name: values["total_ms"] / repeat
+            for name, values in futil.span_stats().items()
+        }
+    return result
+
+
+def format_results(results):
+    lines = [
+        f"{'scenario':<12} {'bodies':>6} {'pairs':>7} {'joints':>7} {'segments':>8} "
+        f"{'booleans':>8} {'wall s':>8} {'peak MB':>8}"
+    ]
+    for result in results:
+        lines.append(
+            f"{result['scenario']:<12} {result['bodies']:>6} {result['candidate_pairs']:>7} "
+            f"{result['intersections']:>7} {result['segments']:>8} {result['boolean_calls']:>8} "
+            f"{result['wall_s']:>8.3f} {result['peak_mb']:>8.2f}"
+        )
+    return "\n".join(lines)
+
+
+def check_qr002(results):
+    """
+    Check results with at least 100 intersections against the QR-002 time
+    and memory targets. Returns a list of failure descriptions.
+    """
+    failures = []
+    for result in results:
+        if result["intersections"] < QR002_MIN_INTERSECTIONS:
+            continue
+        if (
+            result["wall_s"] >= QR002_MAX_SECONDS
+            or result["peak_mb"] >= QR002_MAX_MEGABYTES
+        ):
+            failures.append(
+                f"{result['scenario']} ({result['bodies']} bodies, {result['intersections']} joints): "
+                f"{result['wall_s']:.2f} s, {result['peak_mb']:.1f} MB"
+            )
+    return failures
+
+
+def _csv(value, convert=str):
+    return [convert(item) for item in value.split(",") if item]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scenarios", default=",".join(assemblies.SCENARIOS))
+    parser.add_argument(
+        "--sizes", default=",".join(str(size) for size in DEFAULT_SIZES)
+    )
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument(
+        "--stages", action="store_true", help="report per-stage span totals"
+    )
+    parser.add_argument("--json", help="write results to this file")
+    options = parser.parse_args(argv)
+
+    _, futil = _engine()
+    futil.set_log_level("WARNING")
+
+    results = []
+    for scenario in _csv(options.scenarios):
+        for size in _csv(options.sizes, int):
+            result = run_case(scenario, size, options.repeat, options.stages)
+            results.append(result)
+            print(format_results([result]).splitlines()[1], flush=True)
+            if options.stages:
+                for name, total_ms in sorted(
+                    result["stages"].items(), key=lambda item: -item[1]
+                ):
+                    print(f"    {name:<44} {total_ms:>10.2f} ms")
+
+    print()
+    print(format_results(results))
+    failures = check_qr002(results)
+    print()
+    if failures:
+        print("QR-002 targets missed:")
+        for failure in failures:
+            print(f"  {failure}")
+    else:
+        print("QR-002 targets met (100+ intersections < 10 s, < 100 MB)")
+
+    if options.json:
+        with open(options.json, "w", encoding="utf-8") as json_file:
+            json.dump(results, json_file, indent=2)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,21 @@
+"""
+Headless stand-in for the Fusion 360 ``adsk`` API
+
+Implements the subset of adsk.core / adsk.fusion that the Sheet Joinery
+add-in uses so the engine can be imported, run and benchmarked under plain
+CPython. Put ``tools/headless`` on sys.path ahead of anything else; never ship
+this package with the add-in.
+
+Geometry is deliberately simple: bodies are planar-faced prisms and
+TemporaryBRepManager booleans are exact only for axis-aligned box-like slabs
+(other bodies are approximated by their bounding boxes). Use
+``adsk.headless`` to build designs, bodies and custom features.
+"""
+
+
+def doEvents():
+    """Headless doEvents: deliver queued custom events."""
+    from . import headless
+
+    headless.process_events()
+    return True
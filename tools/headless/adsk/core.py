@@ -0,0 +1,971 @@
+"""
+Headless stand-in for adsk.core
+"""
+
+import math
+from typing import ClassVar
+
+
+class Base:
+    """Common base mirroring adsk.core.Base casting and type queries"""
+
+    _class_type = "adsk::core::Base"
+
+    @classmethod
+    def classType(cls):
+        return cls._class_type
+
+    @property
+    def objectType(self):
+        return self._class_type
+
+    @property
+    def isValid(self):
+        return True
+
+    @classmethod
+    def cast(cls, obj):
+        return obj if isinstance(obj, cls) else None
+
+
+# ---------------------------------------------------------------------------
+# Enums
+
+
+class LogLevels:
+    InfoLogLevel = 0
+    WarningLogLevel = 1
+    ErrorLogLevel = 2
+
+
+class LogTypes:
+    ConsoleLogType = 0
+    FileLogType = 1
+
+
+class MessageBoxButtonTypes:
+    OKButtonType = 0
+    OKCancelButtonTypes = 1
+    YesNoButtonType = 2
+
+
+class MessageBoxIconTypes:
+    NoIconIconType = 0
+    InformationIconType = 1
+    WarningIconType = 2
+    CriticalIconType = 3
+
+
+class DialogResults:
+    DialogOK = 0
+    DialogCancel = 1
+    DialogYes = 2
+    DialogNo = 3
+    DialogError = -1
+
+
+class SurfaceTypes:
+    PlaneSurfaceType = 0
+    CylinderSurfaceType = 1
+    ConeSurfaceType = 2
+    SphereSurfaceType = 3
+    TorusSurfaceType = 4
+    EllipticalCylinderSurfaceType = 5
+    EllipticalConeSurfaceType = 6
+    NurbsSurfaceType = 7
+
+
+# ---------------------------------------------------------------------------
+# Geometry
+
+
+class Vector3D(Base):
+    _class_type = "adsk::core::Vector3D"
+
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+
+    @staticmethod
+    def create(x=0.0, y=0.0, z=0.0):
+        return Vector3D(x, y, z)
+
+    @property
+    def length(self):
+        return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+    def asArray(self):
+        return (self.x, self.y, self.z)
+
+    def copy(self):
+        return Vector3D(self.x, self.y, self.z)
+
+    def dotProduct(self, other):
+        return self.x * other.x + self.y * other.y + self.z * other.z
+
+    def crossProduct(self, other):
+        return Vector3D(
+            self.y * other.z - self.z * other.y,
+            self.z * other.x - self.x * other.z,
+            self.x * other.y - self.y * other.x,
+        )
+
+    def normalize(self):
+        length = self.length
+        if length == 0.0:
+            return False
+        self.x /= length
+        self.y /= length
+        self.z /= length
+        return True
+
+    def scaleBy(self, scale):
+        self.x *= scale
+        self.y *= scale
+        self.z *= scale
+        return True
+
+    def add(self, other):
+        self.x += other.x
+        self.y += other.y
+        self.z += other.z
+        return True
+
+    def isParallelTo(self, other, tolerance=1e-9):
+        cross = self.crossProduct(other)
+        return cross.length <= tolerance * max(self.length * other.length, 1e-30)
+
+    def isEqualTo(self, other):
+        return self.asArray() == other.asArray()
+
+    def transformBy(self, matrix):
+        x, y, z = matrix._apply_vector(self.asArray())
+        self.x, self.y, self.z = x, y, z
+        return True
+
+
+class Point3D(Base):
+    _class_type = "adsk::core::Point3D"
+
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+
+    @staticmethod
+    def create(x=0.0, y=0.0, z=0.0):
+        return Point3D(x, y, z)
+
+    def asArray(self):
+        return (self.x, self.y, self.z)
+
+    def copy(self):
+        return Point3D(self.x, self.y, self.z)
+
+    def distanceTo(self, other):
+        return math.dist(self.asArray(), other.asArray())
+
+    def vectorTo(self, other):
+        return Vector3D(other.x - self.x, other.y - self.y, other.z - self.z)
+
+    def translateBy(self, vector):
+        self.x += vector.x
+        self.y += vector.y
+        self.z += vector.z
+        return True
+
+    def isEqualTo(self, other):
+        return self.asArray() == other.asArray()
+
+    def transformBy(self, matrix):
+        x, y, z = matrix._apply_point(self.asArray())
+        self.x, self.y, self.z = x, y, z
+        return True
+
+
+class Matrix3D(Base):
+    """4x4 affine transform stored row-major"""
+
+    _class_type = "adsk::core::Matrix3D"
+
+    def __init__(self, rows=None):
+        self._rows = rows or [
+            [1.0 if i == j else 0.0 for j in range(4)] for i in range(4)
+        ]
+
+    @staticmethod
+    def create():
+        return Matrix3D()
+
+    def copy(self):
+        return Matrix3D([row[:] for row in self._rows])
+
+    def asArray(self):
+        return tuple(value for row in self._rows for value in row)
+
+    @property
+    def translation(self):
+        return Vector3D(self._rows[0][3], self._rows[1][3], self._rows[2][3])
+
+    @translation.setter
+    def translation(self, vector):
+        self._rows[0][3] = vector.x
+        self._rows[1][3] = vector.y
+        self._rows[2][3] = vector.z
+
+    def setWithCoordinateSystem(self, origin, xAxis, yAxis, zAxis):
+        axes = (xAxis, yAxis, zAxis)
+        for row, name in enumerate(("x", "y", "z")):
+            for col, axis in enumerate(axes):
+                self._rows[row][col] = getattr(axis, name)
+            self._rows[row][3] = getattr(origin, name)
+        self._rows[3] = [0.0, 0.0, 0.0, 1.0]
+        return True
+
+    def transformBy(self, matrix):
+        """Apply matrix after this transform (this = matrix * this)"""
+        a = matrix._rows
+        b = self._rows
+        self._rows = [
+            [sum(a[i][k] * b[k][j] for k in range(4)) for j in range(4)]
+            for i in range(4)
+        ]
+        return True
+
+    def invert(self):
+        rotation = [row[:3] for row in self._rows[:3]]
+        translation = [row[3] for row in self._rows[:3]]
+        det = (
+            rotation[0][0]
+            * (rotation[1][1] * rotation[2][2] - rotation[1][2] * rotation[2][1])
+            - rotation[0][1]
+            * (rotation[1][0] * rotation[2][2] - rotation[1][2] * rotation[2][0])
+            + rotation[0][2]
+            * (rotation[1][0] * rotation[2][1] - rotation[1][1] * rotation[2][0])
+        )
+        if det == 0.0:
+            return False
+        inverse = [[0.0] * 3 for _ in range(3)]
+        for i in range(3):
+            for j in range(3):
+                minor = [
+                    [rotation[r][c] for c in range(3) if c != i]
+                    for r in range(3)
+                    if r != j
+                ]
+                cofactor = minor[0][0] * minor[1][1] - minor[0][1] * minor[1][0]
+                inverse[i][j] = ((-1) ** (i + j)) * cofactor / det
+        inverse_translation = [
+            -sum(inverse[i][k] * translation[k] for k in range(3)) for i in range(3)
+        ]
+        self._rows = [inverse[i] + [inverse_translation[i]] for i in range(3)] + [
+            [0.0, 0.0, 0.0, 1.0]
+        ]
+        return True
+
+    def _apply_point(self, point):
+        r = self._rows
+        return tuple(
+            r[i][0] * point[0] + r[i][1] * point[1] + r[i][2] * point[2] + r[i][3]
+            for i in range(3)
+        )
+
+    def _apply_vector(self, vector):
+        r = self._rows
+        return tuple(
+            r[i][0] * vector[0] + r[i][1] * vector[1] + r[i][2] * vector[2]
+            for i in range(3)
+        )
+
+
+class BoundingBox3D(Base):
+    _class_type = "adsk::core::BoundingBox3D"
+
+    def __init__(self, minPoint, maxPoint):
+        self.minPoint = minPoint
+        self.maxPoint = maxPoint
+
+    @staticmethod
+    def create(minPoint, maxPoint):
+        return BoundingBox3D(minPoint.copy(), maxPoint.copy())
+
+    def copy(self):
+        return BoundingBox3D(self.minPoint.copy(), self.maxPoint.copy())
+
+    def intersects(self, other):
+        return (
+            self.minPoint.x <= other.maxPoint.x
+            and other.minPoint.x <= self.maxPoint.x
+            and self.minPoint.y <= other.maxPoint.y
+            and other.minPoint.y <= self.maxPoint.y
+            and self.minPoint.z <= other.maxPoint.z
+            and other.minPoint.z <= self.maxPoint.z
+        )
+
+    def contains(self, point):
+        return (
+            self.minPoint.x <= point.x <= self.maxPoint.x
+            and self.minPoint.y <= point.y <= self.maxPoint.y
+            and self.minPoint.z <= point.z <= self.maxPoint.z
+        )
+
+    def expand(self, point):
+        self.minPoint = Point3D(
+            min(self.minPoint.x, point.x),
+            min(self.minPoint.y, point.y),
+            min(self.minPoint.z, point.z),
+        )
+        self.maxPoint = Point3D(
+            max(self.maxPoint.x, point.x),
+            max(self.maxPoint.y, point.y),
+            max(self.maxPoint.z, point.z),
+        )
+        return True
+
+
+class OrientedBoundingBox3D(Base):
+    _class_type = "adsk::core::OrientedBoundingBox3D"
+
+    def __init__(
+        self, centerPoint, lengthDirection, widthDirection, length, width, height
+    ):
+        self.centerPoint = centerPoint
+        self.lengthDirection = lengthDirection
+        self.widthDirection = widthDirection
+        self.heightDirection = lengthDirection.crossProduct(widthDirection)
+        self.length = length
+        self.width = width
+        self.height = height
+
+    @staticmethod
+    def create(centerPoint, lengthDirection, widthDirection, length, width, height):
+        return OrientedBoundingBox3D(
+            centerPoint.copy(),
+            lengthDirection.copy(),
+            widthDirection.copy(),
+            length,
+            width,
+            height,
+        )
+
+
+class Plane(Base):
+    _class_type = "adsk::core::Plane"
+
+    def __init__(self, origin, normal):
+        self.origin = origin
+        self.normal = normal
+        self.surfaceType = SurfaceTypes.PlaneSurfaceType
+
+    @staticmethod
+    def create(origin, normal):
+        normal = normal.copy()
+        normal.normalize()
+        return Plane(origin.copy(), normal)
+
+
+class Color(Base):
+    _class_type = "adsk::core::Color"
+
+    def __init__(self, red, green, blue, opacity):
+        self.red = red
+        self.green = green
+        self.blue = blue
+        self.opacity = opacity
+
+    @staticmethod
+    def create(red, green, blue, opacity):
+        return Color(red, green, blue, opacity)
+
+
+class ObjectCollection(Base):
+    _class_type = "adsk::core::ObjectCollection"
+
+    def __init__(self):
+        self._items = []
+
+    @staticmethod
+    def create():
+        return ObjectCollection()
+
+    @property
+    def count(self):
+        return len(self._items)
+
+    def item(self, index):
+        return self._items[index]
+
+    def add(self, item):
+        self._items.append(item)
+        return True
+
+    def clear(self):
+        self._items.clear()
+        return True
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+
+# ---------------------------------------------------------------------------
+# Events
+
+
+class EventHandler:
+    def notify(self, args):
+        pass
+
+
+class Event(Base):
+    """Base event. add() is annotated with the handler class name per subclass,
+    which fusionAddInUtils.add_handler uses to pick the handler base type."""
+
+    _class_type = "adsk::core::Event"
+    _handler_name = "EventHandler"
+
+    def __init__(self, name=""):
+        self.name = name
+        self._handlers = []
+
+    def add(self, handler):
+        self._handlers.append(handler)
+        return True
+
+    def remove(self, handler):
+        if handler in self._handlers:
+            self._handlers.remove(handler)
+            return True
+        return False
+
+    def fire(self, args):
+        """Headless helper: notify every registered handler."""
+        for handler in list(self._handlers):
+            handler.notify(args)
+
+
+def _define_event(class_name, handler_name, module_globals):
+    """Create an Event subclass whose add() is annotated with handler_name"""
+
+    def add(self, handler):
+        return Event.add(self, handler)
+
+    add.__annotations__ = {"handler": handler_name, "return": "bool"}
+    event_class = type(
+        class_name, (Event,), {"add": add, "_handler_name": handler_name}
+    )
+    event_class.__module__ = module_globals["__name__"]
+    if handler_name not in module_globals:
+        module_globals[handler_name] = type(
+            handler_name, (EventHandler,), {"__module__": module_globals["__name__"]}
+        )
+    module_globals[class_name] = event_class
+    return event_class
+
+
+CommandCreatedEvent = _define_event(
+    "CommandCreatedEvent", "CommandCreatedEventHandler", globals()
+)
+CommandEvent = _define_event("CommandEvent", "CommandEventHandler", globals())
+InputChangedEvent = _define_event(
+    "InputChangedEvent", "InputChangedEventHandler", globals()
+)
+ValidateInputsEvent = _define_event(
+    "ValidateInputsEvent", "ValidateInputsEventHandler", globals()
+)
+SelectionEvent = _define_event("SelectionEvent", "SelectionEventHandler", globals())
+CustomEvent = _define_event("CustomEvent", "CustomEventHandler", globals())
+DocumentEvent = _define_event("DocumentEvent", "DocumentEventHandler", globals())
+ApplicationCommandEvent = _define_event(
+    "ApplicationCommandEvent", "ApplicationCommandEventHandler", globals()
+)
+
+
+class EventArgs(Base):
+    _class_type = "adsk::core::EventArgs"
+
+    def __init__(self, firingEvent=None):
+        self.firingEvent = firingEvent
+
+
+class CommandCreatedEventArgs(EventArgs):
+    def __init__(self, command):
+        super().__init__()
+        self.command = command
+
+
+class CommandEventArgs(EventArgs):
+    def __init__(self, command):
+        super().__init__()
+        self.command = command
+        self.executeFailed = False
+        self.isValidResult = False
+
+
+class InputChangedEventArgs(EventArgs):
+    def __init__(self, input, inputs):
+        super().__init__()
+        self.input = input
+        self.inputs = inputs
+
+
+class ValidateInputsEventArgs(EventArgs):
+    def __init__(self, inputs):
+        super().__init__()
+        self.inputs = inputs
+        self.areInputsValid = True
+
+
+class SelectionEventArgs(EventArgs):
+    def __init__(self, selection):
+        super().__init__()
+        self.selection = selection
+        self.isSelectable = True
+
+
+class CustomEventArgs(EventArgs):
+    def __init__(self, additionalInfo=""):
+        super().__init__()
+        self.additionalInfo = additionalInfo
+
+
+class DocumentEventArgs(EventArgs):
+    def __init__(self, document=None):
+        super().__init__()
+        self.document = document
+
+
+class ApplicationCommandEventArgs(EventArgs):
+    def __init__(self, commandId=""):
+        super().__init__()
+        self.commandId = commandId
+
+
+# ---------------------------------------------------------------------------
+# Command inputs
+
+
+class ValueInput(Base):
+    _class_type = "adsk::core::ValueInput"
+
+    # Conversion factors to Fusion's internal length unit (cm)
+    _UNITS: ClassVar[dict[str, float]] = {
+        "mm": 0.1,
+        "cm": 1.0,
+        "m": 100.0,
+        "in": 2.54,
+        "ft": 30.48,
+    }
+
+    def __init__(self, value=0.0, expression=""):
+        self.realValue = value
+        self.stringValue = expression
+
+    @staticmethod
+    def createByReal(realValue):
+        return ValueInput(float(realValue), str(realValue))
+
+    @staticmethod
+    def createByString(stringValue):
+        return ValueInput(ValueInput.evaluate(stringValue), stringValue)
+
+    @staticmethod
+    def evaluate(expression):
+        parts = str(expression).split()
+        if not parts:
+            return 0.0
+        value = float(parts[0])
+        if len(parts) > 1:
+            value *= ValueInput._UNITS.get(parts[1], 1.0)
+        return value
+
+
+class CommandInput(Base):
+    _class_type = "adsk::core::CommandInput"
+
+    def __init__(self, id, name=""):
+        self.id = id
+        self.name = name
+        self.isVisible = True
+        self.isEnabled = True
+        self.tooltip = ""
+
+
+class SelectionCommandInput(CommandInput):
+    _class_type = "adsk::core::SelectionCommandInput"
+
+    def __init__(self, id, name, commandPrompt=""):
+        super().__init__(id, name)
+        self.commandPrompt = commandPrompt
+        self.filters = []
+        self.limits = (0, 0)
+        self._selections = []
+
+    def addSelectionFilter(self, filter):
+        self.filters.append(filter)
+        return True
+
+    def setSelectionLimits(self, minimum, maximum=0):
+        self.limits = (minimum, maximum)
+        return True
+
+    @property
+    def selectionCount(self):
+        return len(self._selections)
+
+    def selection(self, index):
+        return self._selections[index]
+
+    def addSelection(self, entity):
+        self._selections.append(Selection(entity))
+        return True
+
+    def removeSelection(self, index):
+        del self._selections[index]
+        return True
+
+    def clearSelection(self):
+        self._selections.clear()
+        return True
+
+
+class Selection(Base):
+    _class_type = "adsk::core::Selection"
+
+    def __init__(self, entity):
+        self.entity = entity
+        self.point = Point3D()
+
+
+class ValueCommandInput(CommandInput):
+    _class_type = "adsk::core::ValueCommandInput"
+
+    def __init__(self, id, name, unitType, initialValue):
+        super().__init__(id, name)
+        self.unitType = unitType
+        self._value = initialValue.realValue
+        self._expression = initialValue.stringValue
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+        self._expression = str(value)
+
+    @property
+    def expression(self):
+        return self._expression
+
+    @expression.setter
+    def expression(self, expression):
+        self._expression = expression
+        self._value = ValueInput.evaluate(expression)
+
+
+class TextBoxCommandInput(CommandInput):
+    _class_type = "adsk::core::TextBoxCommandInput"
+
+    def __init__(self, id, name, formattedText, numRows, isReadOnly):
+        super().__init__(id, name)
+        self.text = formattedText
+        self.formattedText = formattedText
+        self.numRows = numRows
+        self.isReadOnly = isReadOnly
+
+
+class BoolValueCommandInput(CommandInput):
+    _class_type = "adsk::core::BoolValueCommandInput"
+
+    def __init__(self, id, name, isCheckBox, resourceFolder="", initialValue=False):
+        super().__init__(id, name)
+        self.isCheckBox = isCheckBox
+        self.value = initialValue
+
+
+class CommandInputs(Base):
+    _class_type = "adsk::core::CommandInputs"
+
+    def __init__(self, command=None):
+        self.command = command
+        self._inputs = []
+
+    def _add(self, command_input):
+        self._inputs.append(command_input)
+        return command_input
+
+    def addSelectionInput(self, id, name, commandPrompt):
+        return self._add(SelectionCommandInput(id, name, commandPrompt))
+
+    def addValueInput(self, id, name, unitType, initialValue):
+        return self._add(ValueCommandInput(id, name, unitType, initialValue))
+
+    def addTextBoxCommandInput(self, id, name, formattedText, numRows, isReadOnly):
+        return self._add(
+            TextBoxCommandInput(id, name, formattedText, numRows, isReadOnly)
+        )
+
+    def addBoolValueInput(
+        self, id, name, isCheckBox, resourceFolder="", initialValue=False
+    ):
+        return self._add(
+            BoolValueCommandInput(id, name, isCheckBox, resourceFolder, initialValue)
+        )
+
+    def itemById(self, id):
+        for command_input in self._inputs:
+            if command_input.id == id:
+                return command_input
+        return None
+
+    @property
+    def count(self):
+        return len(self._inputs)
+
+    def item(self, index):
+        return self._inputs[index]
+
+    def __iter__(self):
+        return iter(self._inputs)
+
+
+class Command(Base):
+    _class_type = "adsk::core::Command"
+
+    def __init__(self, parentCommandDefinition):
+        self.parentCommandDefinition = parentCommandDefinition
+        self.commandInputs = CommandInputs(self)
+        self.execute = CommandEvent("execute")
+        self.executePreview = CommandEvent("executePreview")
+        self.destroy = CommandEvent("destroy")
+        self.inputChanged = InputChangedEvent("inputChanged")
+        self.validateInputs = ValidateInputsEvent("validateInputs")
+        self.selectionEvent = SelectionEvent("selectionEvent")
+        self.isOKButtonVisible = True
+        self.doExecute_called = False
+
+    def doExecute(self, terminate):
+        self.doExecute_called = True
+        return True
+
+
+class CommandDefinition(Base):
+    _class_type = "adsk::core::CommandDefinition"
+
+    def __init__(self, collection, id, name, tooltip, resourceFolder):
+        self._collection = collection
+        self.id = id
+        self.name = name
+        self.tooltip = tooltip
+        self.resourceFolder = resourceFolder
+        self.commandCreated = CommandCreatedEvent("commandCreated")
+
+    def execute(self, input=None):
+        """Headless helper: create a Command and fire commandCreated."""
+        command = Command(self)
+        self.commandCreated.fire(CommandCreatedEventArgs(command))
+        return command
+
+    def deleteMe(self):
+        self._collection._definitions.pop(self.id, None)
+        return True
+
+
+class CommandDefinitions(Base):
+    _class_type = "adsk::core::CommandDefinitions"
+
+    def __init__(self):
+        self._definitions = {}
+
+    def addButtonDefinition(self, id, name, tooltip, resourceFolder=""):
+        if id in self._definitions:
+            raise RuntimeError(f"Command definition already exists: {id}")
+        definition = CommandDefinition(self, id, name, tooltip, resourceFolder)
+        self._definitions[id] = definition
+        return definition
+
+    def itemById(self, id):
+        return self._definitions.get(id)
+
+    @property
+    def count(self):
+        return len(self._definitions)
+
+
+class CommandControl(Base):
+    _class_type = "adsk::core::CommandControl"
+
+    def __init__(self, collection, commandDefinition):
+        self._collection = collection
+        self.commandDefinition = commandDefinition
+        self.id = commandDefinition.id
+        self.isPromoted = False
+
+    def deleteMe(self):
+        self._collection._controls.pop(self.id, None)
+        return True
+
+
+class ToolbarControls(Base):
+    def __init__(self):
+        self._controls = {}
+
+    def addCommand(self, commandDefinition, positionID="", isBefore=False):
+        control = CommandControl(self, commandDefinition)
+        self._controls[commandDefinition.id] = control
+        return control
+
+    def itemById(self, id):
+        return self._controls.get(id)
+
+
+class ToolbarPanel(Base):
+    def __init__(self, id):
+        self.id = id
+        self.controls = ToolbarControls()
+
+
+class _ItemsById(Base):
+    def __init__(self, factory):
+        self._factory = factory
+        self._items = {}
+
+    def itemById(self, id):
+        if id not in self._items:
+            self._items[id] = self._factory(id)
+        return self._items[id]
+
+
+class Workspace(Base):
+    def __init__(self, id):
+        self.id = id
+        self.toolbarPanels = _ItemsById(ToolbarPanel)
+
+
+class ProgressDialog(Base):
+    _class_type = "adsk::core::ProgressDialog"
+
+    def __init__(self):
+        self.isShowing = False
+        self.wasCancelled = False
+        self.isCancelButtonShown = True
+        self.cancelButtonText = "Cancel"
+        self.title = ""
+        self.message = ""
+        self.minimumValue = 0
+        self.maximumValue = 100
+        self.progressValue = 0
+        self.reset_count = 0
+
+    def show(self, title, message, minimumValue, maximumValue, delay=0):
+        self.title = title
+        self.message = message
+        self.minimumValue = minimumValue
+        self.maximumValue = maximumValue
+        self.progressValue = minimumValue
+        self.isShowing = True
+        return True
+
+    def hide(self):
+        self.isShowing = False
+        return True
+
+    def reset(self):
+        self.reset_count += 1
+        self.progressValue = self.minimumValue
+        return True
+
+
+class Selections(Base):
+    def __init__(self):
+        self._items = []
+
+    @property
+    def count(self):
+        return len(self._items)
+
+    def item(self, index):
+        return self._items[index]
+
+    def add(self, entity):
+        self._items.append(Selection(entity))
+        return True
+
+    def clear(self):
+        self._items.clear()
+        return True
+
+
+class UserInterface(Base):
+    _class_type = "adsk::core::UserInterface"
+
+    def __init__(self):
+        self.commandDefinitions = CommandDefinitions()
+        self.workspaces = _ItemsById(Workspace)
+        self.activeSelections = Selections()
+        self.commandTerminated = ApplicationCommandEvent("commandTerminated")
+        self.messages = []
+
+    def messageBox(self, text, title="", buttons=0, icon=0):
+        self.messages.append((title, text))
+        return DialogResults.DialogOK
+
+    def createProgressDialog(self):
+        return ProgressDialog()
+
+
+class Application(Base):
+    _class_type = "adsk::core::Application"
+    _instance = None
+
+    def __init__(self):
+        self.userInterface = UserInterface()
+        self.version = "headless"
+        self.activeProduct = None
+        self.documentActivated = DocumentEvent("documentActivated")
+        self.documentClosed = DocumentEvent("documentClosed")
+        self.documentOpened = DocumentEvent("documentOpened")
+        self.documentSaving = DocumentEvent("documentSaving")
+        self.log_records = []
+        self.log_to_stdout = False
+        self._custom_events = {}
+
+    @staticmethod
+    def get():
+        if Application._instance is None:
+            Application._instance = Application()
+        return Application._instance
+
+    def log(self, message, level=LogLevels.InfoLogLevel, type=LogTypes.ConsoleLogType):
+        self.log_records.append((message, level, type))
+        if self.log_to_stdout:
+            print(message)
+        return True
+
+    def registerCustomEvent(self, eventId):
+        event = self._custom_events.get(eventId)
+        if event is None:
+            event = self._custom_events[eventId] = CustomEvent(eventId)
+        return event
+
+    def unregisterCustomEvent(self, eventId):
+        return self._custom_events.pop(eventId, None) is not None
+
+    def fireCustomEvent(self, eventId, additionalInfo=""):
+        """Queue a custom event; headless.process_events() delivers queued events."""
+        from . import headless
+
+        if eventId not in self._custom_events:
+            return False
+        headless.queue_custom_event(eventId, additionalInfo)
+        return True
+
+    def _fire_custom_event(self, eventId, additionalInfo):
+        event = self._custom_events.get(eventId)
+        if event is not None:
+            event.fire(CustomEventArgs(additionalInfo))
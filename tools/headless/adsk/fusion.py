@@ -0,0 +1,863 @@
+"""
+Headless stand-in for adsk.fusion
+"""
+
+import itertools
+from typing import ClassVar
+
+from . import core
+from .core import Base, BoundingBox3D, Plane, Point3D, Vector3D
+
+_token_counter = itertools.count(1)
+
+
+def _new_token(prefix):
+    return f"{prefix}:{next(_token_counter)}"
+
+
+class BooleanTypes:
+    DifferenceBooleanType = 0
+    IntersectionBooleanType = 1
+    UnionBooleanType = 2
+
+
+# ---------------------------------------------------------------------------
+# Attributes
+
+
+class Attribute(Base):
+    _class_type = "adsk::core::Attribute"
+
+    def __init__(self, attributes, groupName, name, value):
+        self._attributes = attributes
+        self.groupName = groupName
+        self.name = name
+        self.value = value
+
+    @property
+    def parent(self):
+        return self._attributes._parent
+
+    def deleteMe(self):
+        self._attributes._items.pop((self.groupName, self.name), None)
+        return True
+
+
+class Attributes(Base):
+    _class_type = "adsk::core::Attributes"
+
+    def __init__(self, parent):
+        self._parent = parent
+        self._items = {}
+
+    def add(self, groupName, name, value):
+        attribute = self._items.get((groupName, name))
+        if attribute is None:
+            attribute = self._items[(groupName, name)] = Attribute(
+                self, groupName, name, value
+            )
+        else:
+            attribute.value = value
+        return attribute
+
+    def itemByName(self, groupName, name):
+        return self._items.get((groupName, name))
+
+    def itemsByGroup(self, groupName):
+        return [
+            attribute
+            for (group, _), attribute in self._items.items()
+            if group == groupName
+        ]
+
+    @property
+    def count(self):
+        return len(self._items)
+
+    def item(self, index):
+        return list(self._items.values())[index]
+
+    def __iter__(self):
+        return iter(list(self._items.values()))
+
+
+class _Collection(Base):
+    def __init__(self, items=None):
+        self._items = list(items or [])
+
+    @property
+    def count(self):
+        return len(self._items)
+
+    def item(self, index):
+        return self._items[index]
+
+    def itemByName(self, name):
+        for item in self._items:
+            if getattr(item, "name", None) == name:
+                return item
+        return None
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def __len__(self):
+        return len(self._items)
+
+
+# ---------------------------------------------------------------------------
+# B-Rep
+
+
+class BRepVertex(Base):
+    _class_type = "adsk::fusion::BRepVertex"
+
+    def __init__(self, body, point):
+        self.body = body
+        self.geometry = point
+
+
+class BRepEdge(Base):
+    _class_type = "adsk::fusion::BRepEdge"
+
+    def __init__(self, body, start, end):
+        self.body = body
+        self.startVertex = start
+        self.endVertex = end
+
+    @property
+    def length(self):
+        return self.startVertex.geometry.distanceTo(self.endVertex.geometry)
+
+
+class BRepFace(Base):
+    _class_type = "adsk::fusion::BRepFace"
+
+    def __init__(self, body, plane, vertices, area):
+        self.body = body
+        self.geometry = plane
+        self.vertices = _Collection(vertices)
+        self.area = area
+        self.attributes = Attributes(self)
+        self.entityToken = _new_token("face")
+
+    @property
+    def boundingBox(self):
+        points = [vertex.geometry for vertex in self.vertices]
+        return _bounds_of(points)
+
+    @property
+    def pointOnFace(self):
+        points = [vertex.geometry.asArray() for vertex in self.vertices]
+        return Point3D(
+            *(sum(point[axis] for point in points) / len(points) for axis in range(3))
+        )
+
+
+def _bounds_of(points):
+    return BoundingBox3D(
+        Point3D(
+            min(p.x for p in points), min(p.y for p in points), min(p.z for p in points)
+        ),
+        Point3D(
+            max(p.x for p in points), max(p.y for p in points), max(p.z for p in points)
+        ),
+    )
+
+
+class _Prism:
+    """
+    Geometry of a headless body: a rectangular plate spanned by two
+    orthogonal in-plane directions and extruded along their cross product.
+    """
+
+    __slots__ = (
+        "length",
+        "length_direction",
+        "origin",
+        "thickness",
+        "width",
+        "width_direction",
+    )
+
+    def __init__(
+        self, origin, length_direction, width_direction, length, width, thickness
+    ):
+        self.origin = origin
+        self.length_direction = length_direction
+        self.width_direction = width_direction
+        self.length = length
+        self.width = width
+        self.thickness = thickness
+
+    @property
+    def normal(self):
+        return self.length_direction.crossProduct(self.width_direction)
+
+    @property
+    def is_axis_aligned(self):
+        for direction in (self.length_direction, self.width_direction):
+            if sorted(abs(value) for value in direction.asArray()) != [0.0, 0.0, 1.0]:
+                return False
+        return True
+
+    def corners(self):
+        o = self.origin.asArray()
+        axes = (
+            [value * self.length for value in self.length_direction.asArray()],
+            [value * self.width for value in self.width_direction.asArray()],
+            [value * self.thickness for value in self.normal.asArray()],
+        )
+        corners = []
+        for k in (0, 1):
+            for j in (0, 1):
+                for i in (0, 1):
+                    corners.append(
+                        Point3D(
+                            *(
+                                o[axis]
+                                + i * axes[0][axis]
+                                + j * axes[1][axis]
+                                + k * axes[2][axis]
+                                for axis in range(3)
+                            )
+                        )
+                    )
+        return corners
+
+    def transformed(self, matrix):
+        origin = self.origin.copy()
+        origin.transformBy(matrix)
+        length_direction = self.length_direction.copy()
+        length_direction.transformBy(matrix)
+        width_direction = self.width_direction.copy()
+        width_direction.transformBy(matrix)
+        return _Prism(
+            origin,
+            length_direction,
+            width_direction,
+            self.length,
+            self.width,
+            self.thickness,
+        )
+
+    @staticmethod
+    def from_bounds(min_point, max_point):
+        return _Prism(
+            min_point.copy(),
+            Vector3D(1, 0, 0),
+            Vector3D(0, 1, 0),
+            max_point.x - min_point.x,
+            max_point.y - min_point.y,
+            max_point.z - min_point.z,
+        )
+
+
+class BRepBody(Base):
+    _class_type = "adsk::fusion::BRepBody"
+
+    def __init__(
+        self, name, prism, parentComponent=None, isSheetMetal=True, isTemporary=False
+    ):
+        self.name = name
+        self._prism = prism
+        self.parentComponent = parentComponent
+        self.isSheetMetal = isSheetMetal
+        self.isTemporary = isTemporary
+        self.isVisible = True
+        self.isLightBulbOn = True
+        self.isSolid = True
+        self.assemblyContext = None
+        self.nativeObject = None
+        self.attributes = Attributes(self)
+        self.entityToken = _new_token("body")
+        self._volume_override = None
+        self._build_topology()
+
+    def _build_topology(self):
+        corners = self._prism.corners()
+        self._vertices = [BRepVertex(self, point) for point in corners]
+        v = self._vertices
+        prism = self._prism
+        edge_pairs = (
+            (0, 1), (2, 3), (4, 5), (6, 7),
+            (0, 2), (1, 3), (4, 6), (5, 7),
+            (0, 4), (1, 5), (2, 6), (3, 7),
+        )  # fmt: skip
+        self._edges = [BRepEdge(self, v[a], v[b]) for a, b in edge_pairs]
+
+        normal = prism.normal
+        length_direction = prism.length_direction
+        width_direction = prism.width_direction
+        negate = lambda vector: Vector3D(-vector.x, -vector.y, -vector.z)  # noqa: E731
+        lw = prism.length * prism.width
+        lt = prism.length * prism.thickness
+        wt = prism.width * prism.thickness
+        face_specs = (
+            ((0, 1, 3, 2), negate(normal), lw),
+            ((4, 5, 7, 6), normal, lw),
+            ((0, 1, 5, 4), negate(width_direction), lt),
+            ((2, 3, 7, 6), width_direction, lt),
+            ((0, 2, 6, 4), negate(length_direction), wt),
+            ((1, 3, 7, 5), length_direction, wt),
+        )
+        self._faces = [
+            BRepFace(
+                self,
+                Plane(v[indices[0]].geometry.copy(), direction),
+                [v[i] for i in indices],
+                area,
+            )
+            for indices, direction, area in face_specs
+        ]
+
+    @property
+    def faces(self):
+        return _Collection(self._faces)
+
+    @property
+    def edges(self):
+        return _Collection(self._edges)
+
+    @property
+    def vertices(self):
+        return _Collection(self._vertices)
+
+    @property
+    def boundingBox(self):
+        return _bounds_of([vertex.geometry for vertex in self._vertices])
+
+    @property
+    def volume(self):
+        if self._volume_override is not None:
+            return self._volume_override
+        prism = self._prism
+        return prism.length * prism.width * prism.thickness
+
+    @property
+    def area(self):
+        return sum(face.area for face in self._faces)
+
+    def createForAssemblyContext(self, occurrence):
+        proxy = BRepBody(
+            self.name,
+            self._prism.transformed(occurrence.transform),
+            self.parentComponent,
+            self.isSheetMetal,
+        )
+        proxy.assemblyContext = occurrence
+        proxy.nativeObject = self
+        proxy.entityToken = f"{self.entityToken}@{occurrence.entityToken}"
+        return proxy
+
+    def deleteMe(self):
+        if self.parentComponent is not None:
+            self.parentComponent.bRepBodies._items.remove(self)
+        return True
+
+
+class TemporaryBRepManager(Base):
+    """
+    Temporary B-Rep operations on headless bodies.
+
+    Booleans are exact for axis-aligned box-like bodies; for anything else
+    the operands are approximated by their bounding boxes. Call counts are
+    kept so benchmarks can report how many kernel operations ran.
+    """
+
+    _class_type = "adsk::fusion::TemporaryBRepManager"
+    _instance = None
+
+    def __init__(self):
+        self.copy_calls = 0
+        self.boolean_calls = 0
+        self.transform_calls = 0
+
+    @staticmethod
+    def get():
+        if TemporaryBRepManager._instance is None:
+            TemporaryBRepManager._instance = TemporaryBRepManager()
+        return TemporaryBRepManager._instance
+
+    def reset_counters(self):
+        self.copy_calls = 0
+        self.boolean_calls = 0
+        self.transform_calls = 0
+
+    def copy(self, brepEntity):
+        self.copy_calls += 1
+        copied = BRepBody(
+            brepEntity.name,
+            brepEntity._prism.transformed(core.Matrix3D()),
+            None,
+            brepEntity.isSheetMetal,
+            True,
+        )
+        copied._volume_override = brepEntity._volume_override
+        return copied
+
+    def transform(self, body, transform):
+        self.transform_calls += 1
+        body._prism = body._prism.transformed(transform)
+        body._build_topology()
+        return True
+
+    def createBox(self, box):
+        """Create a temporary body from an OrientedBoundingBox3D"""
+        half = (box.length / 2.0, box.width / 2.0, box.height / 2.0)
+        directions = (box.lengthDirection, box.widthDirection, box.heightDirection)
+        origin = box.centerPoint.copy()
+        for size, direction in zip(half, directions, strict=True):
+            offset = direction.copy()
+            offset.scaleBy(-size)
+            origin.translateBy(offset)
+        prism = _Prism(
+            origin,
+            box.lengthDirection.copy(),
+            box.widthDirection.copy(),
+            box.length,
+            box.width,
+            box.height,
+        )
+        return BRepBody("box", prism, None, False, True)
+
+    def booleanOperation(self, targetBody, toolBody, booleanType):
+        """Modify targetBody in place; returns False when the result is empty."""
+        self.boolean_calls += 1
+        target_box = targetBody.boundingBox
+        tool_box = toolBody.boundingBox
+        overlap_min = Point3D(
+            max(target_box.minPoint.x, tool_box.minPoint.x),
+            max(target_box.minPoint.y, tool_box.minPoint.y),
+            max(target_box.minPoint.z, tool_box.minPoint.z),
+        )
+        overlap_max = Point3D(
+            min(target_box.maxPoint.x, tool_box.maxPoint.x),
+            min(target_box.maxPoint.y, tool_box.maxPoint.y),
+            min(target_box.maxPoint.z, tool_box.maxPoint.z),
+        )
+        overlap_extents = (
+            overlap_max.x - overlap_min.x,
+            overlap_max.y - overlap_min.y,
+            overlap_max.z - overlap_min.z,
+        )
+        overlaps = all(extent > 0.0 for extent in overlap_extents)
+        overlap_volume = (
+            overlap_extents[0] * overlap_extents[1] * overlap_extents[2]
+            if overlaps
+            else 0.0
+        )
+
+        if booleanType == BooleanTypes.IntersectionBooleanType:
+            if not overlaps:
+                return False
+            targetBody._prism = _Prism.from_bounds(overlap_min, overlap_max)
+            targetBody._volume_override = None
+        elif booleanType == BooleanTypes.UnionBooleanType:
+            volume = targetBody.volume + toolBody.volume - overlap_volume
+            union_min = Point3D(
+                min(target_box.minPoint.x, tool_box.minPoint.x),
+                min(target_box.minPoint.y, tool_box.minPoint.y),
+                min(target_box.minPoint.z, tool_box.minPoint.z),
+            )
+            union_max = Point3D(
+                max(target_box.maxPoint.x, tool_box.maxPoint.x),
+                max(target_box.maxPoint.y, tool_box.maxPoint.y),
+                max(target_box.maxPoint.z, tool_box.maxPoint.z),
+            )
+            targetBody._prism = _Prism.from_bounds(union_min, union_max)
+            targetBody._volume_override = volume
+        elif booleanType == BooleanTypes.DifferenceBooleanType:
+            targetBody._volume_override = max(0.0, targetBody.volume - overlap_volume)
+        else:
+            raise ValueError(f"Unknown boolean type: {booleanType}")
+        targetBody._build_topology()
+        return True
+
+
+# ---------------------------------------------------------------------------
+# Custom graphics
+
+
+class CustomGraphicsCoordinates(Base):
+    _class_type = "adsk::fusion::CustomGraphicsCoordinates"
+
+    def __init__(self, coordinates):
+        self.coordinates = list(coordinates)
+
+    @staticmethod
+    def create(coordinates):
+        return CustomGraphicsCoordinates(coordinates)
+
+    @property
+    def coordinateCount(self):
+        return len(self.coordinates) // 3
+
+
+class CustomGraphicsSolidColorEffect(Base):
+    _class_type = "adsk::fusion::CustomGraphicsSolidColorEffect"
+
+    def __init__(self, color):
+        self.color = color
+
+    @staticmethod
+    def create(color):
+        return CustomGraphicsSolidColorEffect(color)
+
+
+class CustomGraphicsLines(Base):
+    _class_type = "adsk::fusion::CustomGraphicsLines"
+
+    def __init__(self, group, coordinates, indexList, isLineStrip):
+        self.parentGroup = group
+        self.coordinates = coordinates
+        self.indexList = list(indexList)
+        self.isLineStrip = isLineStrip
+        self.color = None
+        self.weight = 1.0
+        self.depthPriority = 0
+
+
+class CustomGraphicsGroup(Base):
+    _class_type = "adsk::fusion::CustomGraphicsGroup"
+
+    def __init__(self, groups):
+        self._groups = groups
+        self._entities = []
+        self.id = ""
+
+    def addLines(self, coordinates, indexList, isLineStrip, lineStripLengths=None):
+        lines = CustomGraphicsLines(self, coordinates, indexList, isLineStrip)
+        self._entities.append(lines)
+        return lines
+
+    @property
+    def count(self):
+        return len(self._entities)
+
+    def item(self, index):
+        return self._entities[index]
+
+    def deleteMe(self):
+        if self in self._groups._items:
+            self._groups._items.remove(self)
+        return True
+
+
+class CustomGraphicsGroups(_Collection):
+    def add(self):
+        group = CustomGraphicsGroup(self)
+        self._items.append(group)
+        return group
+
+
+# ---------------------------------------------------------------------------
+# Design structure
+
+
+class ModelParameter(Base):
+    _class_type = "adsk::fusion::ModelParameter"
+
+    def __init__(self, name, value, expression=""):
+        self.name = name
+        self.value = value
+        self.expression = expression or f"{value * 10.0} mm"
+
+
+class SheetMetalRule(Base):
+    _class_type = "adsk::fusion::SheetMetalRule"
+
+    def __init__(self, name, thickness):
+        self.name = name
+        self.thickness = ModelParameter(f"{name}_thickness", thickness)
+        self.entityToken = _new_token("rule")
+
+
+class BRepBodies(_Collection):
+    pass
+
+
+class CustomFeatureDependency(Base):
+    _class_type = "adsk::fusion::CustomFeatureDependency"
+
+    def __init__(self, id, entity):
+        self.id = id
+        self.entity = entity
+
+
+class CustomFeatureDependencies(_Collection):
+    def add(self, id, entity):
+        dependency = CustomFeatureDependency(id, entity)
+        self._items.append(dependency)
+        return dependency
+
+    def itemById(self, id):
+        for dependency in self._items:
+            if dependency.id == id:
+                return dependency
+        return None
+
+    def deleteAll(self):
+        self._items.clear()
+        return True
+
+
+class CustomFeatureParameter(Base):
+    _class_type = "adsk::fusion::CustomFeatureParameter"
+
+    def __init__(self, id, name, value, unit, isVisible):
+        self.id = id
+        self.name = name
+        self.value = value
+        self.unit = unit
+        self.isVisible = isVisible
+
+
+class CustomFeatureParameters(_Collection):
+    def itemById(self, id):
+        for parameter in self._items:
+            if parameter.id == id:
+                return parameter
+        return None
+
+
+class CustomFeatureInput(Base):
+    def __init__(self, definition):
+        self.definition = definition
+        self.dependencies = []
+        self.parameters = []
+
+    def addDependency(self, id, entity):
+        self.dependencies.append((id, entity))
+        return True
+
+    def addCustomParameter(self, id, name, value, units, isVisible):
+        self.parameters.append(
+            CustomFeatureParameter(id, name, value.realValue, units, isVisible)
+        )
+        return True
+
+
+class CustomFeatureEventArgs(core.EventArgs):
+    def __init__(self, customFeature):
+        super().__init__()
+        self.customFeature = customFeature
+        self.isComputed = False
+
+
+CustomFeatureEvent = core._define_event(
+    "CustomFeatureEvent", "CustomFeatureEventHandler", globals()
+)
+
+
+class CustomFeatureDefinition(Base):
+    _class_type = "adsk::fusion::CustomFeatureDefinition"
+    _definitions: ClassVar[dict[str, "CustomFeatureDefinition"]] = {}
+
+    def __init__(self, id, name, resourceFolder):
+        self.id = id
+        self.defaultName = name
+        self.resourceFolder = resourceFolder
+        self.editCommandId = ""
+        self.customFeatureCompute = CustomFeatureEvent("customFeatureCompute")
+
+    @staticmethod
+    def create(id, name, resourceFolder):
+        definition = CustomFeatureDefinition(id, name, resourceFolder)
+        CustomFeatureDefinition._definitions[id] = definition
+        return definition
+
+
+class CustomFeature(Base):
+    _class_type = "adsk::fusion::CustomFeature"
+
+    def __init__(self, definition, name, parentComponent):
+        self.definition = definition
+        self.name = name
+        self.parentComponent = parentComponent
+        self.attributes = Attributes(self)
+        self.dependencies = CustomFeatureDependencies()
+        self.parameters = CustomFeatureParameters()
+        self.entityToken = _new_token("feature")
+        self.isSuppressed = False
+        self.last_compute_result = None
+
+    def compute(self):
+        """Headless helper: fire the definition's compute event for this feature."""
+        args = CustomFeatureEventArgs(self)
+        self.definition.customFeatureCompute.fire(args)
+        self.last_compute_result = args.isComputed
+        return args.isComputed
+
+    def deleteMe(self):
+        self.parentComponent.features.customFeatures._items.remove(self)
+        return True
+
+
+class CustomFeatures(_Collection):
+    # Headless switch: False leaves the first compute to the caller
+    compute_on_add = True
+
+    def __init__(self, component):
+        super().__init__()
+        self._component = component
+
+    def createInput(self, definition):
+        return CustomFeatureInput(definition)
+
+    def add(self, input):
+        feature = CustomFeature(
+            input.definition,
+            f"{input.definition.defaultName}{self.count + 1}",
+            self._component,
+        )
+        for id, entity in input.dependencies:
+            feature.dependencies.add(id, entity)
+        feature.parameters._items.extend(input.parameters)
+        self._items.append(feature)
+        self._component._design._register(feature)
+        # Fusion computes the new feature as part of add()
+        if self.compute_on_add:
+            feature.compute()
+        return feature
+
+
+class Features(Base):
+    def __init__(self, component):
+        self.customFeatures = CustomFeatures(component)
+
+
+class Occurrence(Base):
+    _class_type = "adsk::fusion::Occurrence"
+
+    def __init__(self, component, transform, parent=None, name=""):
+        self.component = component
+        self.transform = transform
+        self.assemblyContext = parent
+        self.name = name or f"{component.name}:1"
+        self.isLightBulbOn = True
+        self.isVisible = True
+        self.isSuppressed = False
+        self.attributes = Attributes(self)
+        self.entityToken = _new_token("occurrence")
+
+    @property
+    def transform2(self):
+        """Transform to root coordinates (proxies carry the composed transform)."""
+        return self.transform
+
+    @property
+    def bRepBodies(self):
+        return BRepBodies(
+            [body.createForAssemblyContext(self) for body in self.component.bRepBodies]
+        )
+
+    @property
+    def childOccurrences(self):
+        """Child occurrences as proxies in this occurrence's context (transforms composed)."""
+        proxies = []
+        for child in self.component.occurrences:
+            transform = child.transform.copy()
+            transform.transformBy(self.transform)
+            proxy = Occurrence(child.component, transform, self, child.name)
+            proxy.isLightBulbOn = child.isLightBulbOn
+            proxy.isVisible = child.isVisible
+            proxy.isSuppressed = child.isSuppressed
+            proxy.entityToken = f"{child.entityToken}@{self.entityToken}"
+            proxies.append(proxy)
+        return _Collection(proxies)
+
+
+class Occurrences(_Collection):
+    def __init__(self, component):
+        super().__init__()
+        self._component = component
+
+    def addNewComponent(self, transform):
+        design = self._component._design
+        component = design._new_component(f"Component{len(design._components)}")
+        return self.addExistingComponent(component, transform)
+
+    def addExistingComponent(self, component, transform):
+        occurrence = Occurrence(component, transform)
+        self._items.append(occurrence)
+        self._component._design._register(occurrence)
+        return occurrence
+
+    @property
+    def asList(self):
+        return list(self._items)
+
+
+class Component(Base):
+    _class_type = "adsk::fusion::Component"
+
+    def __init__(self, design, name):
+        self._design = design
+        self.name = name
+        self.bRepBodies = BRepBodies()
+        self.occurrences = Occurrences(self)
+        self.features = Features(self)
+        self.attributes = Attributes(self)
+        self.activeSheetMetalRule = None
+        self.customGraphicsGroups = CustomGraphicsGroups()
+        self.entityToken = _new_token("component")
+
+    @property
+    def allOccurrences(self):
+        result = []
+        stack = list(self.occurrences)
+        while stack:
+            occurrence = stack.pop(0)
+            result.append(occurrence)
+            stack.extend(occurrence.component.occurrences)
+        return _Collection(result)
+
+
+class UnitsManager(Base):
+    def __init__(self):
+        self.defaultLengthUnits = "mm"
+        self.internalUnits = "cm"
+
+
+class Design(Base):
+    _class_type = "adsk::fusion::Design"
+
+    def __init__(self):
+        self._components = []
+        self._entities = {}
+        self.unitsManager = UnitsManager()
+        self.rootComponent = self._new_component("Root")
+        self.attributes = Attributes(self)
+
+    def _new_component(self, name):
+        component = Component(self, name)
+        self._components.append(component)
+        self._register(component)
+        return component
+
+    def _register(self, entity):
+        self._entities[entity.entityToken] = entity
+
+    @property
+    def allComponents(self):
+        return _Collection(self._components)
+
+    def findEntityByToken(self, entityToken):
+        entity = self._entities.get(entityToken)
+        return [entity] if entity is not None else []
+
+    def findAttributes(self, groupName, attributeName):
+        """Attributes of registered entities and their faces matching the names; '' matches all"""
+        matches = []
+        for entity in list(self._entities.values()):
+            owners = [entity]
+            if isinstance(entity, BRepBody):
+                owners.extend(entity._faces)
+            for owner in owners:
+                for attribute in getattr(owner, "attributes", ()):
+                    if (not groupName or attribute.groupName == groupName) and (
+                        not attributeName or attribute.name == attributeName
+                    ):
+                        matches.append(attribute)
+        return matches
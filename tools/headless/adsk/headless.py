@@ -0,0 +1,170 @@
+"""
+Builders and controls for headless runs (not part of the real adsk API)
+
+Typical use::
+
+    from adsk import headless
+
+    design = headless.new_design()
+    a = headless.add_sheet(design, "side", (0, 0, 0), (1, 0, 0), (0, 0, 1), 40, 70, 1.8)
+    entry = headless.load_join_sheets()
+    feature = headless.add_join_feature(design, [a, b], tab_width=3.0, tolerance=0.01)
+
+Lengths are in centimetres, Fusion's internal unit.
+"""
+
+import importlib
+import os
+import sys
+from collections import deque
+
+from . import core, fusion
+
+_REPO_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+ADDIN_SOURCE_DIR = os.path.join(_REPO_ROOT, "src")
+
+_event_queue = deque()
+
+
+def queue_custom_event(event_id, additional_info):
+    _event_queue.append((event_id, additional_info))
+
+
+def process_events(limit=None):
+    """Deliver queued custom events; returns the number delivered."""
+    app = core.Application.get()
+    delivered = 0
+    while _event_queue and (limit is None or delivered < limit):
+        event_id, additional_info = _event_queue.popleft()
+        app._fire_custom_event(event_id, additional_info)
+        delivered += 1
+    return delivered
+
+
+def new_design():
+    """Create an empty design and make it the application's active product."""
+    design = fusion.Design()
+    core.Application.get().activeProduct = design
+    return design
+
+
+def reset():
+    """Drop the active design, queued events and kernel call counters."""
+    app = core.Application.get()
+    app.activeProduct = None
+    app.log_records.clear()
+    _event_queue.clear()
+    fusion.TemporaryBRepManager.get().reset_counters()
+
+
+def _vector(values):
+    vector = core.Vector3D(*values)
+    vector.normalize()
+    return vector
+
+
+def add_sheet(
+    design_or_component,
+    name,
+    origin,
+    length_direction,
+    width_direction,
+    length,
+    width,
+    thickness,
+    is_sheet_metal=True,
+):
+    """
+    Add a rectangular sheet body spanning length x width along the two
+    in-plane directions from origin, extruded by thickness along their cross
+    product. Returns the new BRepBody.
+    """
+    component = getattr(design_or_component, "rootComponent", design_or_component)
+    prism = fusion._Prism(
+        core.Point3D(*origin),
+        _vector(length_direction),
+        _vector(width_direction),
+        float(length),
+        float(width),
+        float(thickness),
+    )
+    body = fusion.BRepBody(name, prism, component, is_sheet_metal)
+    component.bRepBodies._items.append(body)
+    component._design._register(body)
+    return body
+
+
+def add_box(design_or_component, name, min_point, max_point, is_sheet_metal=True):
+    """Add an axis-aligned box body between two corner points."""
+    extents = [high - low for low, high in zip(min_point, max_point, strict=True)]
+    return add_sheet(
+        design_or_component,
+        name,
+        min_point,
+        (1, 0, 0),
+        (0, 1, 0),
+        extents[0],
+        extents[1],
+        extents[2],
+        is_sheet_metal,
+    )
+
+
+def set_sheet_metal_rule(component, name, thickness):
+    """Give a component an active sheet metal rule of the given thickness."""
+    component.activeSheetMetalRule = fusion.SheetMetalRule(name, thickness)
+    return component.activeSheetMetalRule
+
+
+def add_component(design, name, transform=None):
+    """Add a new component with one occurrence under the root component."""
+    component = design._new_component(name)
+    occurrence = design.rootComponent.occurrences.addExistingComponent(
+        component, transform or core.Matrix3D()
+    )
+    return component, occurrence
+
+
+def translation(x, y, z):
+    matrix = core.Matrix3D()
+    matrix.translation = core.Vector3D(x, y, z)
+    return matrix
+
+
+def load_join_sheets():
+    """
+    Import the Join Sheets command module and register its custom feature
+    definition, skipping the UI/version-check path of start().
+    """
+    if ADDIN_SOURCE_DIR not in sys.path:
+        sys.path.insert(0, ADDIN_SOURCE_DIR)
+    entry = importlib.import_module("SheetJoinery.commands.joinSheets.entry")
+    if entry.custom_feature_definition is None:
+        entry.create_custom_feature_definition()
+    return entry
+
+
+def add_join_feature(design, bodies, tab_width=1.0, tolerance=0.01, compute=True):
+    """
+    Create a Join Sheets feature on the given bodies the way the create
+    command does, computing it inside customFeatures.add(); with compute
+    False that first compute is left to the caller. Returns the CustomFeature.
+    """
+    entry = load_join_sheets()
+    fusion.CustomFeatures.compute_on_add = compute
+    try:
+        return entry.create_join_sheets_feature(design, bodies, tab_width, tolerance)
+    finally:
+        fusion.CustomFeatures.compute_on_add = True
+
+
+def kernel_counters():
+    """Copy/boolean/transform call counts of the headless TemporaryBRepManager."""
+    manager = fusion.TemporaryBRepManager.get()
+    return {
+        "copy_calls": manager.copy_calls,
+        "boolean_calls": manager.boolean_calls,
+        "transform_calls": manager.transform_calls,
+    }
@@ -0,0 +1,33 @@
+"""
+Shared setup for tests run against the headless adsk stand-in
+
+Puts the stand-in, the add-in sources and the benchmark assemblies on
+sys.path so tests can import adsk and SheetJoinery and build the same
+synthetic furniture the benchmarks use.
+"""
+
+import os
+import sys
+
+import pytest
+
+_TOOLS_DIR = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+for path in (os.path.join(_TOOLS_DIR, "headless"), os.path.join(_TOOLS_DIR, "bench")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from adsk import headless  # noqa: E402
+
+if headless.ADDIN_SOURCE_DIR not in sys.path:
+    sys.path.insert(0, headless.ADDIN_SOURCE_DIR)
+
+
+@pytest.fixture
+def entry():
+    """The Join Sheets command module, with a fresh headless application state"""
+    headless.reset()
+    module = headless.load_join_sheets()
+    module.intersection_cache.clear()
+    return module
@@ -0,0 +1,74 @@
+"""
+Component partitioning against the global pass
+
+Joints placed from a component's local results must match the joints the
+global pass finds for the same occurrences, and occurrences whose rotation
+is not an axis permutation must be left to the global pass.
+"""
+
+import math
+
+import pytest
+from adsk import core, headless
+
+TOLERANCE = 0.01
+
+
+def _placed(degrees, x):
+    c = round(math.cos(math.radians(degrees)), 12)
+    s = round(math.sin(math.radians(degrees)), 12)
+    return core.Matrix3D(
+        [[c, -s, 0.0, x], [s, c, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0], [0.0, 0.0, 0.0, 1.0]]
+    )
+
+
+def _cabinets(angles):
+    design = headless.new_design()
+    component, first = headless.add_component(
+        design, "cabinet", _placed(angles[0], 0.0)
+    )
+    headless.add_box(component, "side_left", (0, 0, 0), (0.3, 5, 8))
+    headless.add_box(component, "side_right", (5.7, 0, 0), (6, 5, 8))
+    headless.add_box(component, "bottom", (-0.2, 0, 1), (6.2, 5, 1.3))
+    headless.add_box(component, "top", (-0.2, 0, 7), (6.2, 5, 7.3))
+    occurrences = [first]
+    for index, degrees in enumerate(angles[1:], start=1):
+        occurrences.append(
+            design.rootComponent.occurrences.addExistingComponent(
+                component, _placed(degrees, 20.0 * index)
+            )
+        )
+    return [body for occurrence in occurrences for body in occurrence.bRepBodies]
+
+
+def _joints(entry, monkeypatch, bodies, partition):
+    monkeypatch.setattr(entry.config, "PARTITION_BY_COMPONENT", partition)
+    entry.intersection_cache.clear()
+    entry.component_joint_cache.clear()
+    thicknesses, fingerprints = entry.get_body_fingerprints(bodies)
+    results = entry.find_sheet_intersections(
+        bodies, TOLERANCE, thicknesses, fingerprints
+    )
+    return {(a, b): info for a, b, info in results}, dict(entry.last_compute_stats)
+
+
+def test_translated_and_quarter_turned_occurrences_match_the_global_pass(
+    entry, monkeypatch
+):
+    bodies = _cabinets([0, 0, 90, 180])
+    global_joints, _ = _joints(entry, monkeypatch, bodies, False)
+    placed_joints, stats = _joints(entry, monkeypatch, bodies, True)
+    assert stats["component_groups"] == 4
+    assert stats["component_cache_hits"] == 3
+    assert placed_joints.keys() == global_joints.keys()
+    for key, info in placed_joints.items():
+        assert info["bounds"] == pytest.approx(global_joints[key]["bounds"])
+        assert info["dimensions"] == pytest.approx(global_joints[key]["dimensions"])
+
+
+def test_obliquely_rotated_occurrences_stay_in_the_global_pass(entry, monkeypatch):
+    bodies = _cabinets([0, 30])
+    _, stats = _joints(entry, monkeypatch, bodies, True)
+    assert stats["component_groups"] == 1
+    # The rotated cabinet's pairs were evaluated globally instead
+    assert stats["candidate_pairs"] > 0
@@ -0,0 +1,76 @@
+"""
+Create dialog bodies
+
+With "All Sheet Bodies in Design" checked the design is walked lazily on
+each event and never kept; validating the inputs reads no more than two
+bodies and only a picked selection is checked for thickness.
+"""
+
+from adsk import core, headless
+
+
+def _must_not_run(*_args):
+    raise AssertionError("not expected on this path")
+
+
+def dialog_inputs(auto_discover, picked=()):
+    inputs = core.CommandInputs()
+    inputs.addBoolValueInput("all_sheet_bodies", "All", True, "", auto_discover)
+    selection = inputs.addSelectionInput("target_bodies", "Bodies", "")
+    for body in picked:
+        selection.addSelection(body)
+    inputs.addValueInput("tab_width", "Tab", "cm", core.ValueInput.createByReal(1.0))
+    inputs.addValueInput("tolerance", "Tol", "cm", core.ValueInput.createByReal(0.0))
+    return inputs
+
+
+def add_shelves(count):
+    design = headless.new_design()
+    return [
+        headless.add_box(design, f"shelf_{i}", (0, 0, 3 * i), (5, 5, 3 * i + 0.3))
+        for i in range(count)
+    ]
+
+
+def test_validation_reads_two_discovered_bodies(entry, monkeypatch):
+    add_shelves(6)
+    walked = []
+
+    def counted_walk(design):
+        for body in walk(design):
+            walked.append(body)
+            yield body
+
+    walk = entry.iter_design_sheet_bodies
+    monkeypatch.setattr(entry, "iter_design_sheet_bodies", counted_walk)
+    monkeypatch.setattr(entry, "validate_selected_body", _must_not_run)
+    entry._selection_validation.clear()
+
+    args = core.ValidateInputsEventArgs(dialog_inputs(True))
+    entry.command_validate_input(args)
+    assert args.areInputsValid
+    assert len(walked) == 2
+    assert not entry._selection_validation
+
+    assert len(list(entry.get_dialog_bodies(args.inputs))) == 6
+
+
+def test_picked_selection_is_validated_once_per_body(entry, monkeypatch):
+    bodies = add_shelves(3)
+    checked = []
+    monkeypatch.setattr(
+        entry, "validate_selected_body", lambda body: checked.append(body.name)
+    )
+    entry._selection_validation.clear()
+
+    entry.command_validate_input(
+        core.ValidateInputsEventArgs(dialog_inputs(False, bodies[:2]))
+    )
+    entry.command_validate_input(
+        core.ValidateInputsEventArgs(dialog_inputs(False, bodies))
+    )
+    assert sorted(checked) == ["shelf_0", "shelf_1", "shelf_2"]
+
+    args = core.ValidateInputsEventArgs(dialog_inputs(False, bodies[:1]))
+    entry.command_validate_input(args)
+    assert not args.areInputsValid
@@ -0,0 +1,37 @@
+"""
+Creating a Join Sheets feature
+
+Fusion computes a new feature inside customFeatures.add(), before anything
+can be stored on it; that first compute must already use the dialog's
+parameters, and the joint graph stored after it must reflect them.
+"""
+
+import pytest
+from adsk import headless
+
+
+def test_first_compute_uses_the_dialog_parameters(entry):
+    design = headless.new_design()
+    side = headless.add_box(design, "side", (0, 0, 0), (0.3, 5, 5))
+    shelf = headless.add_box(design, "shelf", (-1, 0, 2), (3, 5, 2.3))
+    feature = headless.add_join_feature(design, [side, shelf], 0.8, 0.02)
+
+    assert feature.last_compute_result
+    assert entry.get_feature_parameters(feature) == (2, 0.8, 0.02)
+    snapshot = entry.compute_snapshots[feature.entityToken]
+    assert snapshot["settings"] == (0.8, 0.02)
+    stored = entry.load_joint_graph(feature)
+    assert stored.settings == (0.8, 0.02)
+    assert stored.edge_count == 1
+
+
+def test_edit_updates_the_custom_parameters(entry):
+    design = headless.new_design()
+    side = headless.add_box(design, "side", (0, 0, 0), (0.3, 5, 5))
+    shelf = headless.add_box(design, "shelf", (-1, 0, 2), (3, 5, 2.3))
+    feature = headless.add_join_feature(design, [side, shelf], 0.8, 0.02)
+
+    entry.update_join_sheets_feature(design, feature.entityToken, 1.2, 0.03)
+    assert feature.parameters.itemById("tab_width").value == pytest.approx(1.2)
+    assert entry.get_feature_parameters(feature) == (2, 1.2, 0.03)
+    assert entry.load_feature_parameters(feature)["tolerance"] == 0.03
@@ -0,0 +1,80 @@
+"""
+Resuming a compute that stopped on its time budget
+
+The next compute must evaluate exactly the pairs left pending, reuse every
+other result, and end with the joints of an uninterrupted compute.
+"""
+
+import assemblies
+from adsk import headless
+
+TOLERANCE = 0.01
+
+
+def _joint_keys(entry, feature):
+    return set(entry.compute_snapshots[feature.entityToken]["results"])
+
+
+def test_pending_pairs_are_finished_without_redoing_their_neighbours(
+    entry, monkeypatch
+):
+    design, bodies = assemblies.build("shelf_grid", 24)
+    feature = headless.add_join_feature(
+        design, bodies, tolerance=TOLERANCE, compute=False
+    )
+    monkeypatch.setattr(entry.config, "COMPUTE_CHUNK_PAIRS", 4)
+    monkeypatch.setattr(entry.config, "COMPUTE_TIME_BUDGET", 1e-9)
+    feature.compute()
+    pending = entry.compute_snapshots[feature.entityToken]["pending"]
+    assert pending
+
+    monkeypatch.setattr(entry.config, "COMPUTE_TIME_BUDGET", 0.0)
+    assert feature.compute()
+    assert entry.last_compute_stats["candidate_pairs"] == len(pending)
+    assert not entry.compute_snapshots[feature.entityToken]["pending"]
+
+    complete = headless.add_join_feature(design, bodies, tolerance=TOLERANCE)
+    assert _joint_keys(entry, feature) == _joint_keys(entry, complete)
+
+
+def test_pending_pairs_survive_reopening_the_document(entry, monkeypatch):
+    design, bodies = assemblies.build("shelf_grid", 24)
+    feature = headless.add_join_feature(
+        design, bodies, tolerance=TOLERANCE, compute=False
+    )
+    monkeypatch.setattr(entry.config, "COMPUTE_CHUNK_PAIRS", 4)
+    monkeypatch.setattr(entry.config, "COMPUTE_TIME_BUDGET", 1e-9)
+    feature.compute()
+    pending = entry.compute_snapshots[feature.entityToken]["pending"]
+    assert pending
+    entry.store_joint_graph(feature)
+    # Reopening drops everything held in memory; only the attribute remains
+    entry.compute_snapshots.clear()
+    entry.joint_graphs.clear()
+
+    monkeypatch.setattr(entry.config, "COMPUTE_TIME_BUDGET", 0.0)
+    assert feature.compute()
+    assert entry.last_compute_stats["candidate_pairs"] == len(pending)
+    assert not entry.compute_snapshots[feature.entityToken]["pending"]
+
+
+def test_occurrence_pairs_share_the_budget_and_resume(entry, monkeypatch):
+    design, bodies = assemblies.build("kitchen", 21)
+    feature = headless.add_join_feature(
+        design, bodies, tolerance=TOLERANCE, compute=False
+    )
+    entry.component_joint_cache.clear()
+    monkeypatch.setattr(entry.config, "COMPUTE_CHUNK_PAIRS", 2)
+    monkeypatch.setattr(entry.config, "COMPUTE_TIME_BUDGET", 1e-9)
+    feature.compute()
+    assert entry.compute_snapshots[feature.entityToken]["pending"]
+    # The component was not fully evaluated, so it must not be cached
+    assert not entry.component_joint_cache
+
+    monkeypatch.setattr(entry.config, "COMPUTE_TIME_BUDGET", 0.0)
+    assert feature.compute()
+    assert not entry.compute_snapshots[feature.entityToken]["pending"]
+    assert len(entry.component_joint_cache) == 1
+
+    complete = headless.add_join_feature(design, bodies, tolerance=TOLERANCE)
+    assert _joint_keys(entry, feature) == _joint_keys(entry, complete)
@@ -0,0 +1,74 @@
+"""
+Batched joint cuts
+
+With config.JOINT_CUTS_ENABLED the cut boxes of each target body are
+united and subtracted with one boolean; a failed union skips that target.
+"""
+
+import pytest
+from adsk import fusion, headless
+
+
+@pytest.fixture
+def cut_results(entry, monkeypatch):
+    """The cut bodies of every compute, with joint cutting switched on"""
+    monkeypatch.setattr(entry.config, "JOINT_CUTS_ENABLED", True)
+    results = []
+    original = entry.cut_feature_joints
+
+    def record(*args):
+        results.append(original(*args))
+        return results[-1]
+
+    monkeypatch.setattr(entry, "cut_feature_joints", record)
+    return results
+
+
+def shelf_joint():
+    design = headless.new_design()
+    side = headless.add_box(design, "side", (0, 0, 0), (0.3, 5, 5))
+    shelf = headless.add_box(design, "shelf", (-1, 0, 2), (3, 5, 2.3))
+    return headless.add_join_feature(design, [side, shelf], compute=False)
+
+
+def test_each_target_takes_one_boolean(entry, cut_results):
+    feature = shelf_joint()
+    assert feature.compute()
+    (cut_bodies,) = cut_results
+    stats = entry.last_compute_stats
+    assert len(cut_bodies) == stats["targets"] == 2
+    assert stats["target_booleans"] == 2
+    assert stats["target_booleans_saved"] == stats["tools"] - 2 > 0
+    for cut_body in cut_bodies.values():
+        assert cut_body.volume > 0.0
+
+
+def test_failed_union_skips_the_target(cut_results, monkeypatch):
+    original = fusion.TemporaryBRepManager.booleanOperation
+
+    def failing_union(self, target, tool, boolean_type):
+        if boolean_type == fusion.BooleanTypes.UnionBooleanType:
+            return False
+        return original(self, target, tool, boolean_type)
+
+    monkeypatch.setattr(fusion.TemporaryBRepManager, "booleanOperation", failing_union)
+    feature = shelf_joint()
+    assert feature.compute()
+    (cut_bodies,) = cut_results
+    assert cut_bodies == {}
+
+
+def test_cut_tools_are_placed_from_shared_templates(entry, cut_results):
+    entry.tab_templates.clear()
+    entry.tab_templates.hits = entry.tab_templates.misses = 0
+    feature = shelf_joint()
+    counters_before = headless.kernel_counters()
+    assert feature.compute()
+    stats = entry.tab_templates.stats()
+    tools = entry.last_compute_stats["tools"]
+    # One template per distinct finger or slot size, every other tool a hit
+    assert stats["misses"] == stats["templates"] <= 3 < tools
+    assert stats["hits"] == tools - stats["misses"]
+    counters = headless.kernel_counters()
+    assert counters["transform_calls"] - counters_before["transform_calls"] == tools
+    assert cut_results
@@ -0,0 +1,96 @@
+"""
+Planar slab kernel against TemporaryBRepManager booleans
+
+The kernel must report the same intersection bounds and volume as the
+boolean path for every candidate pair, whichever way a sheet's face normals
+point relative to its thickness.
+"""
+
+import assemblies
+import pytest
+from adsk import headless
+
+from SheetJoinery.lib.joinery.broad_phase import find_candidate_pairs
+from SheetJoinery.lib.joinery.slab_kernel import (
+    make_slab,
+    polyhedron_bounds,
+    slab_polyhedron,
+)
+
+TOLERANCE = 0.01
+ABS = 1e-6
+
+SQUARE = [(0.0, 0.0, 1.0), (4.0, 0.0, 1.0), (4.0, 4.0, 1.0), (0.0, 4.0, 1.0)]
+
+
+def test_positive_thickness_extrudes_along_normal():
+    slab = make_slab(SQUARE, (0.0, 0.0, 1.0), 0.3)
+    assert polyhedron_bounds(slab_polyhedron(slab)) == pytest.approx(
+        (0, 0, 1.0, 4, 4, 1.3)
+    )
+
+
+def test_negative_thickness_extrudes_behind_base_face():
+    # Top face with an outward normal: the bottom face lies 0.3 below it
+    slab = make_slab(SQUARE, (0.0, 0.0, 1.0), -0.3)
+    assert slab["thickness"] == pytest.approx(0.3)
+    assert polyhedron_bounds(slab_polyhedron(slab)) == pytest.approx(
+        (0, 0, 0.7, 4, 4, 1.0)
+    )
+
+
+def _kernel_and_boolean(entry, bodies):
+    bounds = [entry.get_body_bounds(body) for body in bodies]
+    pairs, _ = find_candidate_pairs(bounds, TOLERANCE)
+    slabs = [entry.extract_body_slab(body) for body in bodies]
+    assert all(slabs), "every synthetic sheet should be a slab"
+    kernel = entry.slab_measurements([(slabs[a], slabs[b]) for a, b in pairs])
+    boolean = [entry.measure_boolean_pair(bodies[a], bodies[b])[0] for a, b in pairs]
+    return pairs, kernel, boolean
+
+
+def _assert_same(pairs, kernel, boolean):
+    assert [pair for pair, m in zip(pairs, kernel, strict=True) if m] == [
+        pair for pair, m in zip(pairs, boolean, strict=True) if m
+    ]
+    for pair, k, b in zip(pairs, kernel, boolean, strict=True):
+        if k and b:
+            assert k[0] == pytest.approx(b[0], abs=ABS), pair
+            assert k[1] == pytest.approx(b[1], abs=ABS), pair
+
+
+@pytest.mark.parametrize("scenario", sorted(assemblies.SCENARIOS))
+def test_kernel_matches_booleans_on_assemblies(entry, scenario):
+    _, bodies = assemblies.build(scenario, 30)
+    pairs, kernel, boolean = _kernel_and_boolean(entry, bodies)
+    assert any(kernel)
+    _assert_same(pairs, kernel, boolean)
+
+
+@pytest.mark.parametrize("flip", [False, True])
+def test_kernel_matches_booleans_for_either_face_orientation(entry, flip):
+    # The same cross joint modelled with the in-plane axes swapped, which
+    # reverses the sheet normal and so the sign of the extracted thickness
+    design = headless.new_design()
+    axes = ((0, 0, 1), (0, 1, 0)) if flip else ((0, 1, 0), (0, 0, 1))
+    upright = headless.add_sheet(design, "upright", (2.0, 0, 0), *axes, 6.0, 6.0, 0.3)
+    shelf = headless.add_box(design, "shelf", (0, 0, 2.0), (6.0, 6.0, 2.3))
+    pairs, kernel, boolean = _kernel_and_boolean(entry, [upright, shelf])
+    assert kernel[0]
+    _assert_same(pairs, kernel, boolean)
+
+
+@pytest.mark.parametrize("scenario", sorted(assemblies.SCENARIOS))
+def test_compute_finds_same_joints_with_and_without_kernel(
+    entry, monkeypatch, scenario
+):
+    design, bodies = assemblies.build(scenario, 30)
+    feature = headless.add_join_feature(design, bodies, compute=False)
+    joints = {}
+    for enabled in (True, False):
+        monkeypatch.setattr(entry.config, "PLANAR_KERNEL_ENABLED", enabled)
+        entry.intersection_cache.clear()
+        entry.compute_snapshots.clear()
+        feature.compute()
+        joints[enabled] = entry.last_compute_stats["intersections"]
+    assert joints[True] == joints[False]
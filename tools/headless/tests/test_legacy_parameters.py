@@ -0,0 +1,62 @@
+"""
+Features saved by older versions
+
+Compute reads the per-key legacy attributes in place; only the edit
+command converts them to the packed attribute.
+"""
+
+from adsk import headless
+
+LEGACY_VALUES = {"tab_width": "1.5", "tolerance": "0.02"}
+
+
+def make_legacy_feature(entry):
+    design = headless.new_design()
+    side = headless.add_box(design, "side", (0, 0, 0), (0.3, 5, 5))
+    shelf = headless.add_box(design, "shelf", (-1, 0, 2), (3, 5, 2.3))
+    feature = headless.add_join_feature(design, [side, shelf], compute=False)
+    group = entry.config.ADDIN_ID
+    feature.attributes.itemByName(group, entry.PARAMS_ATTRIBUTE).deleteMe()
+    # Older versions had no custom parameters either
+    feature.parameters._items.clear()
+    entry.feature_parameters_cache.clear()
+    values = dict(
+        LEGACY_VALUES,
+        body_count="2",
+        body_0_token=side.entityToken,
+        body_1_token=shelf.entityToken,
+    )
+    for name, value in values.items():
+        feature.attributes.add(group, name, value)
+    return design, feature
+
+
+def stored_attributes(entry, feature):
+    return {
+        attr.name: attr.value
+        for attr in feature.attributes.itemsByGroup(entry.config.ADDIN_ID)
+    }
+
+
+def test_compute_reads_legacy_attributes_without_writing(entry):
+    _, feature = make_legacy_feature(entry)
+    before = stored_attributes(entry, feature)
+    assert entry.get_feature_parameters(feature) == (2, 1.5, 0.02)
+
+    feature.compute()
+    after = stored_attributes(entry, feature)
+    assert entry.PARAMS_ATTRIBUTE not in after
+    assert {name: after[name] for name in before} == before
+
+
+def test_edit_migrates_to_the_packed_attribute(entry):
+    design, feature = make_legacy_feature(entry)
+    tokens = entry.load_feature_parameters(feature)["body_tokens"]
+
+    entry.update_join_sheets_feature(design, feature.entityToken, 2.0, 0.05)
+    stored = stored_attributes(entry, feature)
+    assert not any(entry.is_legacy_attribute(name) for name in stored)
+    assert entry.unpack_parameters(stored[entry.PARAMS_ATTRIBUTE]) == (
+        entry.make_parameters(2.0, 0.05, tokens)
+    )
+    assert not entry.migrate_legacy_parameters(feature)
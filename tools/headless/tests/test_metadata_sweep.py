@@ -0,0 +1,62 @@
+"""
+Face metadata index over a headless design
+
+Lookups sweep the design's indexed attribute names once, and a recompute
+only marks its bodies dirty; face attributes are never read face by face
+and the add-in's other attributes are never fetched.
+"""
+
+from adsk import fusion, headless
+
+from SheetJoinery.lib.joinery.metadata_index import (
+    DOGBONE_HINT_ATTRIBUTE,
+    JOINT_ID_ATTRIBUTE,
+)
+
+
+def test_recompute_refreshes_its_bodies_on_the_next_lookup(entry, monkeypatch):
+    group = entry.config.ADDIN_ID
+    design = headless.new_design()
+    side = headless.add_box(design, "side", (0, 0, 0), (0.3, 5, 5))
+    shelf = headless.add_box(design, "shelf", (-1, 0, 2), (3, 5, 2.3))
+    side_faces = list(side.faces)
+    shelf_faces = list(shelf.faces)
+    side_faces[0].attributes.add(group, "JointID", "j1")
+    shelf_faces[0].attributes.add(group, "JointID", "j1")
+    shelf_faces[1].attributes.add(group, "DogboneHint", "CornerDogbone")
+
+    swept = []
+    original_find = fusion.Design.findAttributes
+    monkeypatch.setattr(
+        fusion.Design,
+        "findAttributes",
+        lambda self, group, name: (
+            swept.append(name) or original_find(self, group, name)
+        ),
+    )
+
+    entry.metadata_index.invalidate()
+    index = entry.get_metadata_index(design)
+    assert len(index.faces(JOINT_ID_ATTRIBUTE, "j1")) == 2
+    assert index.faces(DOGBONE_HINT_ATTRIBUTE, "CornerDogbone") == [shelf_faces[1]]
+    assert sorted(swept) == sorted(entry.metadata_index.names)
+
+    per_face_reads = []
+    original = fusion.Attributes.itemsByGroup
+    monkeypatch.setattr(
+        fusion.Attributes,
+        "itemsByGroup",
+        lambda self, name: per_face_reads.append(name) or original(self, name),
+    )
+    shelf_faces[1].attributes.itemByName(group, "DogboneHint").deleteMe()
+    side_faces[2].attributes.add(group, "DogboneHint", "FaceDogbone")
+    headless.add_join_feature(design, [side, shelf])
+    assert entry.metadata_index.is_dirty
+
+    swept.clear()
+    index = entry.get_metadata_index(design)
+    assert index.faces(DOGBONE_HINT_ATTRIBUTE, "CornerDogbone") == []
+    assert index.faces(DOGBONE_HINT_ATTRIBUTE, "FaceDogbone") == [side_faces[2]]
+    assert sorted(swept) == sorted(entry.metadata_index.names)
+    assert entry.metadata_index.stats()["builds"] == 1
+    assert per_face_reads == []
@@ -0,0 +1,68 @@
+"""
+Orientation filter on real body topology
+
+Only flat sheets get a plane; the coplanar test measures their mid-planes,
+not their bounding boxes.
+"""
+
+import math
+from types import SimpleNamespace
+
+import pytest
+from adsk import core, headless
+
+
+def _face(origin, normal, area):
+    return SimpleNamespace(
+        geometry=core.Plane(core.Point3D(*origin), core.Vector3D(*normal)), area=area
+    )
+
+
+def _flanged_body():
+    """A 10 x 10 base plate with a 5 high flange standing on its x = 0 edge"""
+    profile = [(0, 0), (10, 0), (10, 0.3), (0.3, 0.3), (0.3, 5), (0, 5)]
+    vertices = [
+        SimpleNamespace(geometry=core.Point3D(x, y, z))
+        for x, z in profile
+        for y in (0, 10)
+    ]
+    faces = [
+        _face((0, 0, 0), (0, 0, -1), 100.0),
+        _face((0, 0, 0), (-1, 0, 0), 50.0),
+        _face((0.3, 0, 0.3), (0, 0, 1), 97.0),
+    ]
+    return SimpleNamespace(
+        faces=SimpleNamespace(count=len(faces), item=faces.__getitem__),
+        vertices=vertices,
+    )
+
+
+def test_flanged_bodies_are_never_bucketed(entry):
+    entry.plane_cache.clear()
+    assert entry.get_body_plane(_flanged_body(), ("flanged",)) is None
+
+    design = headless.new_design()
+    shelf = headless.add_box(design, "shelf", (0, 0, 3), (10, 10, 3.3))
+    bodies = [_flanged_body(), shelf]
+    kept, rejected, _ = entry.reject_parallel_pairs(
+        bodies, [(0, 1)], [0.3, 0.3], [("flanged",), ("shelf",)]
+    )
+    # Its base is parallel to the shelf, but the flange can still meet it
+    assert kept == [(0, 1)]
+    assert rejected == 0
+
+
+def test_plane_is_the_mid_plane_of_a_tilted_sheet(entry):
+    entry.plane_cache.clear()
+    design = headless.new_design()
+    c = math.sqrt(0.5)
+    sheet = headless.add_sheet(
+        design, "tilted", (1, 2, 3), (c, 0, c), (0, 1, 0), 40, 30, 1.2
+    )
+    normal, point = entry.get_body_plane(sheet, ("tilted",))
+    assert [abs(value) for value in normal] == pytest.approx([c, 0, c])
+    # Halfway between the sheet's faces, whichever face the normal came from
+    distance = sum(
+        (p - b) * n for p, b, n in zip(point, (1, 2, 3), (-c, 0, c), strict=True)
+    )
+    assert distance == pytest.approx(0.6)
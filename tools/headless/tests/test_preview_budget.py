@@ -0,0 +1,29 @@
+"""
+Preview under a time budget
+
+executePreview never pumps events, so a large selection is measured a few
+bodies per preview; each preview continues where the last one stopped.
+"""
+
+import assemblies
+
+TOLERANCE = 0.01
+
+
+def test_previews_continue_until_every_body_is_measured(entry, monkeypatch):
+    _, bodies = assemblies.build("shelf_grid", 12)
+    entry._preview_cache.clear()
+    monkeypatch.setattr(entry.config, "PREVIEW_CHUNK_BODIES", 5)
+    monkeypatch.setattr(entry.config, "PREVIEW_TIME_BUDGET", 1e-9)
+
+    previews = 0
+    joints = None
+    while joints is None:
+        previews += 1
+        assert previews <= 3
+        joints = entry.get_preview_joints(bodies, TOLERANCE)
+    assert previews == 3
+
+    entry._preview_cache.clear()
+    monkeypatch.setattr(entry.config, "PREVIEW_TIME_BUDGET", 0.0)
+    assert entry.get_preview_joints(bodies, TOLERANCE) == joints
@@ -0,0 +1,40 @@
+"""
+Sheet thickness lookup
+
+A sheet metal rule is read directly; only the geometric fallback is
+cached, and only under a fingerprint the caller already computed.
+"""
+
+import pytest
+from adsk import headless
+
+
+def _must_not_run(*_args):
+    raise AssertionError("not expected on this path")
+
+
+def test_rule_thickness_is_read_without_fingerprinting(entry, monkeypatch):
+    design = headless.new_design()
+    component, _ = headless.add_component(design, "panel")
+    headless.set_sheet_metal_rule(component, "ply18", 1.8)
+    body = headless.add_box(component, "side", (0, 0, 0), (40, 30, 1.8))
+    monkeypatch.setattr(entry, "body_fingerprint", _must_not_run)
+    entry.thickness_cache.clear()
+    assert entry.get_sheet_metal_thickness(body) == pytest.approx(1.8)
+    assert entry.thickness_cache == {}
+
+
+def test_geometric_fallback_is_cached_under_the_given_fingerprint(entry, monkeypatch):
+    design = headless.new_design()
+    body = headless.add_sheet(
+        design, "tilted", (0, 0, 0), (1, 0, 1), (0, 1, 0), 40, 30, 1.2
+    )
+    monkeypatch.setattr(entry, "body_fingerprint", _must_not_run)
+    entry.thickness_cache.clear()
+    assert entry.get_sheet_metal_thickness(body) == pytest.approx(1.2)
+    assert entry.thickness_cache == {}
+
+    assert entry.get_sheet_metal_thickness(body, ("fingerprint",)) == pytest.approx(1.2)
+    assert entry.thickness_cache == {("fingerprint",): pytest.approx(1.2)}
+    monkeypatch.setattr(entry, "estimate_body_thickness", _must_not_run)
+    assert entry.get_sheet_metal_thickness(body, ("fingerprint",)) == pytest.approx(1.2)